@@ -0,0 +1,77 @@
+"""Measure how ParallelEventConverter scales from 1 to N processes.
+
+Usage:
+
+    python benchmarks/parallel_event_converter.py [VOICE_COUNT] [SIMPLE_EVENT_COUNT]
+
+A simultaneous event with VOICE_COUNT voices (default 16) of
+SIMPLE_EVENT_COUNT simple events (default 500) is converted by a
+converter with an expensive ``_convert_simple_event`` method: once
+serially and once with a process pool for each worker count from 1 to
+the number of CPUs. The script checks that all results are equal and
+prints the time and the speedup compared to the serial conversion.
+"""
+
+import concurrent.futures
+import hashlib
+import os
+import sys
+import time
+
+from mutwo import core_converters
+from mutwo import core_events
+
+
+class HashConverter(
+    core_converters.abc.ParallelEventConverter, core_converters.abc.EventConverter
+):
+    """Converter which spends some CPU time on each simple event."""
+
+    def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+        digest = repr((event_to_convert.duration, absolute_entry_delay)).encode()
+        for _ in range(2000):
+            digest = hashlib.sha256(digest).digest()
+        return (digest,)
+
+    def convert(self, event_to_convert):
+        return self._convert_event(event_to_convert, 0)
+
+
+def main(voice_count: int = 16, simple_event_count: int = 500):
+    event = core_events.SimultaneousEvent(
+        [
+            core_events.SequentialEvent(
+                [
+                    core_events.SimpleEvent(1 + (voice_index + index) % 3)
+                    for index in range(simple_event_count)
+                ]
+            )
+            for voice_index in range(voice_count)
+        ]
+    )
+    # Each voice is one task.
+    minimal_simple_event_count_per_chunk = simple_event_count
+
+    start = time.perf_counter()
+    expected_result = HashConverter().convert(event)
+    serial_duration = time.perf_counter() - start
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {serial_duration:>9.2f} {1:>8.2f}")
+
+    for worker_count in range(1, (os.cpu_count() or 1) + 1):
+        with concurrent.futures.ProcessPoolExecutor(worker_count) as executor:
+            converter = HashConverter(executor, minimal_simple_event_count_per_chunk)
+            # Start all worker processes before the time is measured.
+            list(executor.map(abs, range(worker_count)))
+            start = time.perf_counter()
+            result = converter.convert(event)
+            duration = time.perf_counter() - start
+        assert result == expected_result
+        print(
+            f"{worker_count:>8} {duration:>9.2f} {serial_duration / duration:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Compare the recursive and the vectorized conversion of TempoConverter.
+
+Usage:
+
+    python benchmarks/tempo_converter_vectorize.py [VOICE_COUNT] [SIMPLE_EVENT_COUNT]
+
+A simultaneous event with VOICE_COUNT voices (default 100) of
+SIMPLE_EVENT_COUNT simple events (default 10000, so 1M simple events
+by default) is converted with a tempo envelope of 2500 partly curved
+segments: once recursively and once with ``vectorize=True``. The
+tempo envelopes of the events aren't converted. The script checks
+that both conversions return exactly the same durations and prints
+the time of the copy (which both conversions share), of both
+conversions and of the integration of all intervals alone.
+"""
+
+import sys
+import time
+
+from mutwo import core_converters
+from mutwo import core_events
+from mutwo import core_parameters
+
+
+def main(voice_count: int = 100, simple_event_count: int = 10000):
+    event = core_events.SimultaneousEvent(
+        [
+            core_events.SequentialEvent(
+                [
+                    core_events.SimpleEvent(((voice_index + index) % 4 + 1) / 4)
+                    for index in range(simple_event_count)
+                ]
+            )
+            for voice_index in range(voice_count)
+        ]
+    )
+    tempo_envelope = core_events.TempoEnvelope(
+        [
+            [
+                index * 2,
+                core_parameters.TempoPoint(40 + (index * 37) % 80),
+                (index % 3) - 1,
+            ]
+            for index in range(2501)
+        ]
+    )
+    print(f"simple events: {voice_count * simple_event_count}")
+
+    start = time.perf_counter()
+    event.destructive_copy()
+    print(f"{'copy':>10}: {time.perf_counter() - start:8.2f} s")
+
+    duration_tuple_list = []
+    for vectorize in (False, True):
+        tempo_converter = core_converters.TempoConverter(
+            tempo_envelope,
+            apply_converter_on_events_tempo_envelope=False,
+            vectorize=vectorize,
+        )
+        start = time.perf_counter()
+        converted_event = tempo_converter.convert(event)
+        duration = time.perf_counter() - start
+        name = "vectorized" if vectorize else "recursive"
+        print(f"{name:>10}: {duration:8.2f} s")
+        duration_tuple_list.append(
+            tuple(
+                simple_event.duration.duration
+                for sequential_event in converted_event
+                for simple_event in sequential_event
+            )
+        )
+    assert duration_tuple_list[0] == duration_tuple_list[1]
+
+    (
+        _,
+        start_list,
+        end_list,
+    ) = tempo_converter._get_simple_event_and_start_and_end_list_tuple(event, False)
+    start = time.perf_counter()
+    tempo_converter._beat_length_in_seconds_envelope.integrate_interval_array(
+        start_list, end_list
+    )
+    print(f"{'integrate':>10}: {time.perf_counter() - start:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
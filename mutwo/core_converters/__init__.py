@@ -5,12 +5,13 @@ from . import configurations
 
 from .parsers import *
 from .tempos import *
+from .schedulers import *
 
-from . import parsers, tempos
+from . import parsers, tempos, schedulers
 
 from mutwo import core_utilities
 
-__all__ = core_utilities.get_all(parsers, tempos)
+__all__ = core_utilities.get_all(parsers, tempos, schedulers)
 
 # Force flat structure
-del core_utilities, parsers, tempos
+del core_utilities, parsers, tempos, schedulers
@@ -1,12 +1,56 @@
 """Defining the public API for any converter class."""
 
 import abc
+import concurrent.futures
+import hashlib
+import heapq
+import inspect
+import itertools
+import pickle
 import typing
 
+try:
+    import quicktions as fractions  # type: ignore
+except ImportError:
+    import fractions  # type: ignore
+
+from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
+from mutwo import core_utilities
+
+__all__ = (
+    "Converter",
+    "EventConverter",
+    "SymmetricalEventConverter",
+    "ParallelEventConverter",
+    "ConverterPipeline",
+)
+
+
+def _accepts_positional_argument(function: typing.Callable, index: int) -> bool:
+    """Check if function can be called with more than `index` positional arguments."""
+
+    positional_parameter_count = 0
+    for parameter in inspect.signature(function).parameters.values():
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional_parameter_count += 1
+    return positional_parameter_count > index
 
-__all__ = ("Converter", "EventConverter", "SymmetricalEventConverter")
+
+def _supports_iterative_conversion(method: typing.Callable) -> typing.Callable:
+    """Mark method which doesn't need to be called for each nested event.
+
+    See :meth:`EventConverter.__init_subclass__`.
+    """
+
+    method._supports_iterative_conversion = True  # type: ignore
+    return method
 
 
 class Converter(abc.ABC):
@@ -33,9 +77,10 @@ class EventConverter(Converter):
 
     This class helps building new classes which convert mutwo events
     with few general private methods (and without adding any new public
-    method). Converting mutwo event often involves the same pattern:
-    due to the nested structure of an Event, the converter has
-    to iterate through the different layers until it reaches leaves
+    method besides :meth:`convert_iter`). Converting mutwo event often
+    involves the same pattern: due to the nested structure of an Event,
+    the converter has to iterate through the different layers until it
+    reaches leaves
     (any class that inherits from :class:`mutwo.core_events.SimpleEvent`).
     This common iteration process and the different time treatment
     between :class:`mutwo.core_events.SequentialEvent` and
@@ -89,13 +134,197 @@ class EventConverter(Converter):
     ) -> typing.Sequence[typing.Any]:
         """Convert instance of :class:`mutwo.core_events.SimpleEvent`."""
 
+    _subtree_cache_size = 0
+    _subtree_cache: typing.Optional[core_utilities.LRUCache] = None
+
+    # Concrete event types are mapped to the base class which decides how
+    # they are converted (so that the isinstance checks are only needed
+    # once per type).
+    _event_type_to_base_event_class_dict: dict[
+        type, type[core_events.abc.Event]
+    ] = {}
+    _is_depth_passed_to_convert_simple_event = True
+    _is_converted_per_nested_event = False
+    _is_subtree_cacheable = True
+
+    def __init_subclass__(
+        cls, is_subtree_cacheable: typing.Optional[bool] = None, **kwargs
+    ):
+        super().__init_subclass__(**kwargs)
+        if is_subtree_cacheable is not None:
+            cls._is_subtree_cacheable = is_subtree_cacheable
+        # Old converters define '_convert_simple_event' without the 'depth'
+        # argument. We check this only once for each class (instead of
+        # retrying each call without 'depth' if it raises a TypeError).
+        cls._is_depth_passed_to_convert_simple_event = _accepts_positional_argument(
+            cls._convert_simple_event, 3
+        )
+        # Old converters override '_convert_event', '_convert_sequential_event'
+        # or '_convert_simultaneous_event' and expect that these methods are
+        # called for each nested event. Such converters still convert nested
+        # events recursively (and without the subtree cache).
+        cls._is_converted_per_nested_event = not all(
+            getattr(getattr(cls, method_name), "_supports_iterative_conversion", False)
+            for method_name in (
+                "_convert_event",
+                "_convert_sequential_event",
+                "_convert_simultaneous_event",
+            )
+        )
+
+    @classmethod
+    def _get_base_event_class(
+        cls, event: core_events.abc.Event
+    ) -> type[core_events.abc.Event]:
+        """Find out if event is a simple, sequential or simultaneous event."""
+
+        event_type = type(event)
+        try:
+            return cls._event_type_to_base_event_class_dict[event_type]
+        except KeyError:
+            pass
+        for base_event_class in (
+            core_events.SequentialEvent,
+            core_events.SimultaneousEvent,
+            core_events.SimpleEvent,
+        ):
+            if isinstance(event, base_event_class):
+                cls._event_type_to_base_event_class_dict[event_type] = base_event_class
+                return base_event_class
+        raise TypeError(
+            f"Can't convert object '{event}' of type "
+            f"'{event_type}' with EventConverter."
+            " Supported types only include all inherited classes "
+            f"from '{core_events.abc.Event}'."
+        )
+
+    @staticmethod
+    def _get_subtree_digest_dict(
+        event_to_convert: core_events.abc.Event,
+    ) -> dict[int, bytes]:
+        """Map the id of each nested complex event to a digest of its content.
+
+        The digest of a complex event depends on its attributes, its
+        simple events and on the digests of its complex children.
+        Each event is only pickled once. Envelopes are pickled without
+        their caches (see :class:`mutwo.core_events.Envelope`).
+        """
+
+        # The tempo envelope of an event is initialised when it's accessed
+        # for the first time (e.g. by 'empty_copy' during the conversion).
+        # An uninitialised tempo envelope is therefore equal to the
+        # default tempo envelope, so that the digest doesn't change
+        # after the conversion (and the event doesn't need to be changed).
+        # Tempo envelopes are replaced by an integer digest: pickle
+        # doesn't memoize integers, so the digest doesn't depend on
+        # whether events share the same tempo envelope object.
+        def get_tempo_envelope_digest(
+            tempo_envelope: core_events.TempoEnvelope,
+        ) -> int:
+            return int.from_bytes(
+                hashlib.blake2b(pickle.dumps(tempo_envelope), digest_size=16).digest(),
+                "big",
+            )
+
+        default_tempo_envelope_digest = get_tempo_envelope_digest(
+            core_events.SimpleEvent(1).tempo_envelope
+        )
+
+        def get_state(event: core_events.abc.Event) -> tuple:
+            attribute_dict = vars(event)
+            if "_tempo_envelope" in attribute_dict:
+                tempo_envelope = attribute_dict["_tempo_envelope"]
+                attribute_dict = dict(
+                    attribute_dict,
+                    _tempo_envelope=(
+                        default_tempo_envelope_digest
+                        if tempo_envelope is None
+                        else get_tempo_envelope_digest(tempo_envelope)
+                    ),
+                )
+            return type(event), attribute_dict
+
+        digest_dict: dict[int, bytes] = {}
+        event_and_is_visited_list = [(event_to_convert, False)]
+        while event_and_is_visited_list:
+            event, is_visited = event_and_is_visited_list.pop()
+            if is_visited:
+                digest_dict[id(event)] = hashlib.blake2b(
+                    pickle.dumps(
+                        (
+                            get_state(event),
+                            [
+                                digest_dict.get(id(child)) or get_state(child)
+                                for child in event
+                            ],
+                        )
+                    ),
+                    digest_size=16,
+                ).digest()
+            elif isinstance(event, core_events.abc.ComplexEvent):
+                event_and_is_visited_list.append((event, True))
+                event_and_is_visited_list.extend(
+                    (child_event, False)
+                    for child_event in event
+                    if isinstance(child_event, core_events.abc.ComplexEvent)
+                )
+        return digest_dict
+
+    def _convert_simple_event_at_depth(
+        self,
+        event_to_convert: core_events.SimpleEvent,
+        absolute_entry_delay: core_parameters.abc.Duration,
+        depth: int,
+    ) -> typing.Any:
+        if self._is_depth_passed_to_convert_simple_event:
+            return self._convert_simple_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
+        return self._convert_simple_event(event_to_convert, absolute_entry_delay)
+
+    def _convert_nested_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int,
+    ) -> typing.Any:
+        """Call the conversion method which belongs to the type of the event.
+
+        This is used instead of the iterative conversion by converters
+        which override :meth:`_convert_event`,
+        :meth:`_convert_sequential_event` or
+        :meth:`_convert_simultaneous_event`.
+        """
+
+        absolute_entry_delay = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_entry_delay
+        )
+        base_event_class = self._get_base_event_class(event_to_convert)
+        if base_event_class is core_events.SequentialEvent:
+            return self._convert_sequential_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
+        elif base_event_class is core_events.SimultaneousEvent:
+            return self._convert_simultaneous_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
+        return self._convert_simple_event_at_depth(
+            event_to_convert, absolute_entry_delay, depth
+        )
+
+    @_supports_iterative_conversion
     def _convert_simultaneous_event(
         self,
         simultaneous_event: core_events.SimultaneousEvent,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> typing.Sequence[typing.Any]:
-        """Convert instance of :class:`mutwo.core_events.SimultaneousEvent`."""
+        """Convert instance of :class:`mutwo.core_events.SimultaneousEvent`.
+
+        Only called by converters which are converted recursively (see
+        :meth:`_convert_nested_event`). It calls :meth:`_convert_event`
+        for each child of the simultaneous event.
+        """
 
         data_per_simple_event_list: list[tuple[typing.Any]] = []
 
@@ -105,13 +334,19 @@ class EventConverter(Converter):
             )
         return tuple(data_per_simple_event_list)
 
+    @_supports_iterative_conversion
     def _convert_sequential_event(
         self,
         sequential_event: core_events.SequentialEvent,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> typing.Sequence[typing.Any]:
-        """Convert instance of :class:`mutwo.core_events.SequentialEvent`."""
+        """Convert instance of :class:`mutwo.core_events.SequentialEvent`.
+
+        Only called by converters which are converted recursively (see
+        :meth:`_convert_nested_event`). It calls :meth:`_convert_event`
+        for each child of the sequential event.
+        """
 
         data_per_simple_event_list: list[tuple[typing.Any]] = []
         for event_start, event in zip(
@@ -124,6 +359,149 @@ class EventConverter(Converter):
             )
         return tuple(data_per_simple_event_list)
 
+    def _walk_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int,
+        add_simple_event: typing.Callable[
+            [core_events.SimpleEvent, core_parameters.abc.Duration, int], None
+        ],
+        add_complex_event: typing.Callable[[core_events.abc.ComplexEvent], None],
+        close_complex_event: typing.Callable[[], typing.Any],
+        add_converted_complex_event: typing.Callable[[typing.Any], None],
+    ):
+        """Visit all events of the passed event in their order.
+
+        Instead of calling itself recursively for each nested event,
+        the method keeps an explicit stack with one frame for each
+        complex event which is currently visited. Therefore it also
+        works with very deeply nested events. Each frame knows where
+        the next child of its complex event starts, so the duration of
+        nested complex events never has to be calculated.
+
+        If the :attr:`subtree_cache` is used, ``close_complex_event``
+        has to return the converted data of the complex event. If the
+        same complex event is visited again (at the same time and
+        depth), its children aren't visited, but the cached data is
+        passed to ``add_converted_complex_event``.
+        """
+
+        subtree_cache = self._subtree_cache
+        if subtree_cache is not None:
+            digest_dict = self._get_subtree_digest_dict(event_to_convert)
+        subtree_key = converted_data_and_duration = None
+        # Each frame is a list of
+        #   [iterator of children, is sequential, depth of children,
+        #    start of complex event, end of last (sequential) or
+        #    longest (simultaneous) child, key in subtree cache].
+        frame_list: list[list] = []
+        event = event_to_convert
+        start = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_entry_delay
+        ).duration
+        while True:
+            base_event_class = self._get_base_event_class(event)
+            if base_event_class is core_events.SimpleEvent:
+                # The end is needed before the conversion, because
+                # converters may change the duration of the simple event.
+                end = start + event.duration.duration
+                add_simple_event(event, core_parameters.DirectDuration(start), depth)
+            else:
+                if subtree_cache is not None:
+                    subtree_key = (digest_dict[id(event)], start, depth)
+                    converted_data_and_duration = subtree_cache.get(subtree_key)
+                if converted_data_and_duration is not None:
+                    converted_data, duration = converted_data_and_duration
+                    add_converted_complex_event(converted_data)
+                    end = start + duration
+                else:
+                    add_complex_event(event)
+                    frame_list.append(
+                        [
+                            iter(event),
+                            base_event_class is core_events.SequentialEvent,
+                            depth + 1,
+                            start,
+                            start,
+                            subtree_key,
+                        ]
+                    )
+                    end = None
+
+            # Find the next event which shall be visited.
+            while frame_list:
+                frame = frame_list[-1]
+                if end is not None:
+                    frame[4] = end if frame[1] else max(frame[4], end)
+                try:
+                    event = next(frame[0])
+                except StopIteration:
+                    frame_list.pop()
+                    converted_data = close_complex_event()
+                    end = frame[4]
+                    if frame[5] is not None:
+                        subtree_cache[frame[5]] = (converted_data, end - frame[3])
+                else:
+                    depth = frame[2]
+                    start = frame[4] if frame[1] else frame[3]
+                    break
+            else:
+                return
+
+    @property
+    def subtree_cache_size(self) -> int:
+        """How many converted complex events are cached.
+
+        If bigger than 0, the data of each converted complex event is
+        stored in :attr:`subtree_cache`. When the converter converts an
+        equal complex event (with the same absolute entry delay and
+        depth) again, the cached data is reused instead of converting
+        all nested events again. Therefore only the changed parts of an
+        event are converted again (e.g. when one voice of a large score
+        has been edited). Default to 0.
+
+        The cache is only valid as long as the converter isn't changed
+        and only if the result of :meth:`_convert_simple_event` only
+        depends on its arguments. Converters which override
+        :meth:`_convert_event`, :meth:`_convert_sequential_event` or
+        :meth:`_convert_simultaneous_event` don't use the cache. Events
+        are compared by pickling them, so they have to be picklable.
+
+        Converters which change the events they convert (e.g.
+        :class:`mutwo.core_converters.TempoConverter`) can't use the
+        cache, because a cached subtree wouldn't be changed again. They
+        are declared with
+        ``class MyConverter(EventConverter, is_subtree_cacheable=False)``
+        and raise a :class:`ValueError` if the cache size is set.
+        """
+
+        return self._subtree_cache_size
+
+    @subtree_cache_size.setter
+    def subtree_cache_size(self, subtree_cache_size: int):
+        if subtree_cache_size and not self._is_subtree_cacheable:
+            raise ValueError(
+                f"'{type(self).__name__}' changes the events it converts and "
+                "therefore can't use a subtree cache."
+            )
+        self._subtree_cache_size = subtree_cache_size
+        self._subtree_cache = (
+            core_utilities.LRUCache(subtree_cache_size) if subtree_cache_size else None
+        )
+
+    @property
+    def subtree_cache(self) -> typing.Optional[core_utilities.LRUCache]:
+        """Cache of converted complex events.
+
+        ``None`` if :attr:`subtree_cache_size` is 0. Its
+        :attr:`mutwo.core_utilities.LRUCache.hit_rate` tells how many
+        complex events didn't need to be converted again.
+        """
+
+        return self._subtree_cache
+
+    @_supports_iterative_conversion
     def _convert_event(
         self,
         event_to_convert: core_events.abc.Event,
@@ -132,42 +510,184 @@ class EventConverter(Converter):
     ) -> typing.Any:
         """Convert :class:`mutwo.core_events.abc.Event` of unknown type.
 
-        The method calls different subroutines depending on whether
-        the passed event either are instances from:
+        The method visits all nested events of the passed event, which
+        can be an instance of:
 
             1. :class:`mutwo.core_events.SimpleEvent` or
             2. :class:`mutwo.core_events.SequentialEvent` or
             3. :class:`mutwo.core_events.SimultaneousEvent`.
+
+        The data which :meth:`_convert_simple_event` returns for each
+        :class:`mutwo.core_events.SimpleEvent` is collected (in the order
+        of the simple events) in one tuple.
         """
 
-        absolute_entry_delay = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
-            absolute_entry_delay
-        )
+        if self._is_converted_per_nested_event:
+            return self._convert_nested_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
 
-        if isinstance(event_to_convert, core_events.SequentialEvent):
-            conversion_method = self._convert_sequential_event
-        elif isinstance(
-            event_to_convert,
-            core_events.SimultaneousEvent,
-        ):
-            conversion_method = self._convert_simultaneous_event
-        elif isinstance(
+        data_per_simple_event_list: list[typing.Any] = []
+        # Where the data of each currently visited complex event starts
+        position_list: list[int] = []
+
+        def add_simple_event(simple_event, simple_event_delay, simple_event_depth):
+            data_per_simple_event_list.extend(
+                self._convert_simple_event_at_depth(
+                    simple_event, simple_event_delay, simple_event_depth
+                )
+            )
+
+        def add_complex_event(complex_event):
+            position_list.append(len(data_per_simple_event_list))
+
+        def close_complex_event():
+            position = position_list.pop()
+            if self._subtree_cache is not None:
+                return tuple(data_per_simple_event_list[position:])
+
+        self._walk_event(
             event_to_convert,
-            core_events.SimpleEvent,
+            absolute_entry_delay,
+            depth,
+            add_simple_event,
+            add_complex_event,
+            close_complex_event,
+            data_per_simple_event_list.extend,
+        )
+        return tuple(data_per_simple_event_list)
+
+    def _iterate_simple_event_and_delay_and_depth(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int = 0,
+    ) -> typing.Iterator[
+        tuple[core_events.SimpleEvent, core_parameters.abc.Duration, int]
+    ]:
+        """Lazily find all simple events sorted by their absolute entry delay.
+
+        Simple events which start at the same time are returned in the
+        same order as in :meth:`_convert_event`. Only the next event
+        of each voice is kept in a heap (instead of finding all simple
+        events before returning the first one).
+        """
+
+        start = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_entry_delay
+        ).duration
+        # Each heap item is (start, path, depth, event, iterator of the
+        # following siblings of a sequential event). The path (the indices
+        # of the event and its ancestors) sorts events which start at the
+        # same time like in the event tree.
+        heap: list[
+            tuple[
+                fractions.Fraction,
+                tuple[int, ...],
+                int,
+                core_events.abc.Event,
+                typing.Optional[typing.Iterator[core_events.abc.Event]],
+            ]
+        ] = [(start, (), depth, event_to_convert, None)]
+        while heap:
+            start, path, depth, event, sibling_iterator = heapq.heappop(heap)
+            base_event_class = self._get_base_event_class(event)
+            # The next sibling is added before the event is returned,
+            # because converters may change the duration of the event.
+            if sibling_iterator is not None:
+                sibling = next(sibling_iterator, None)
+                if sibling is not None:
+                    heapq.heappush(
+                        heap,
+                        (
+                            start + event.duration.duration,
+                            path[:-1] + (path[-1] + 1,),
+                            depth,
+                            sibling,
+                            sibling_iterator,
+                        ),
+                    )
+            if base_event_class is core_events.SimpleEvent:
+                yield event, core_parameters.DirectDuration(start), depth
+            elif base_event_class is core_events.SequentialEvent:
+                child_iterator = iter(event)
+                child = next(child_iterator, None)
+                if child is not None:
+                    heapq.heappush(
+                        heap, (start, path + (0,), depth + 1, child, child_iterator)
+                    )
+            else:
+                for index, child in enumerate(event):
+                    heapq.heappush(
+                        heap, (start, path + (index,), depth + 1, child, None)
+                    )
+
+    def _iterate_converted_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int = 0,
+    ) -> typing.Iterator[typing.Any]:
+        """Lazily convert :class:`mutwo.core_events.abc.Event` of unknown type.
+
+        This is the streaming version of :meth:`_convert_event`: it
+        returns the data which :meth:`_convert_simple_event` returns
+        (or yields) for each :class:`mutwo.core_events.SimpleEvent`
+        sorted by the absolute entry delay of the simple events.
+        """
+
+        for (
+            simple_event,
+            simple_event_delay,
+            simple_event_depth,
+        ) in self._iterate_simple_event_and_delay_and_depth(
+            event_to_convert, absolute_entry_delay, depth
         ):
-            conversion_method = self._convert_simple_event
-        else:
-            raise TypeError(
-                f"Can't convert object '{event_to_convert}' of type "
-                f"'{type(event_to_convert)}' with EventConverter."
-                " Supported types only include all inherited classes "
-                f"from '{core_events.abc.Event}'."
+            yield from self._convert_simple_event_at_depth(
+                simple_event, simple_event_delay, simple_event_depth
             )
 
-        try:
-            return conversion_method(event_to_convert, absolute_entry_delay, depth)
-        except TypeError:
-            return conversion_method(event_to_convert, absolute_entry_delay)
+    def convert_iter(self, event_to_convert: core_events.abc.Event) -> typing.Iterator:
+        """Lazily convert the simple events of an event in the order of their start.
+
+        :param event_to_convert: The event which shall be converted. Can be
+            any object that inherits from ``mutwo.events.abc.Event``.
+        :return: An iterator over the data which :func:`_convert_simple_event`
+            returns (or yields if it is a generator function) for each
+            :class:`mutwo.core_events.SimpleEvent`.
+
+        Simple events are converted only when the iterator reaches them.
+        Therefore large outputs can be written (e.g. to a file) without
+        keeping all of them in memory. Simple events which start at the
+        same time are converted in the order in which they appear in
+        the event.
+
+        **Example:**
+
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> class StartConverter(core_converters.abc.EventConverter):
+        >>>     def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+        >>>         yield float(absolute_entry_delay.duration)
+        >>>     def convert(self, event_to_convert):
+        >>>         return self._convert_event(event_to_convert, 0)
+        >>> event = core_events.SimultaneousEvent(
+        >>>     [
+        >>>         core_events.SequentialEvent(
+        >>>             [core_events.SimpleEvent(1), core_events.SimpleEvent(2)]
+        >>>         ),
+        >>>         core_events.SequentialEvent(
+        >>>             [core_events.SimpleEvent(2), core_events.SimpleEvent(1)]
+        >>>         ),
+        >>>     ]
+        >>> )
+        >>> StartConverter().convert(event)
+        (0.0, 1.0, 0.0, 2.0)
+        >>> list(StartConverter().convert_iter(event))
+        [0.0, 0.0, 1.0, 2.0]
+        """
+
+        return self._iterate_converted_event(event_to_convert, 0)
 
 
 class SymmetricalEventConverter(EventConverter):
@@ -175,8 +695,23 @@ class SymmetricalEventConverter(EventConverter):
 
     This converter is a more specified version of the :class:`EventConverter`.
     It helps for building converters which aim to return mutwo core_events.
+
+    Subclasses can be declared as leaf local with
+    ``class MyConverter(SymmetricalEventConverter, is_leaf_local=True)``.
+    A converter is leaf local if its :meth:`convert` method only returns
+    ``self._convert_event(event_to_convert, 0)`` and if its
+    :meth:`_convert_simple_event` method doesn't change the duration of
+    the simple event. :class:`ConverterPipeline` can apply neighbouring
+    leaf local converters together in one conversion.
     """
 
+    _is_leaf_local = False
+
+    def __init_subclass__(cls, is_leaf_local: typing.Optional[bool] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if is_leaf_local is not None:
+            cls._is_leaf_local = is_leaf_local
+
     @abc.abstractmethod
     def _convert_simple_event(
         self,
@@ -186,13 +721,18 @@ class SymmetricalEventConverter(EventConverter):
     ) -> core_events.SimpleEvent:
         """Convert instance of :class:`mutwo.core_events.SimpleEvent`."""
 
+    @_supports_iterative_conversion
     def _convert_simultaneous_event(
         self,
         simultaneous_event: core_events.SimultaneousEvent,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> core_events.SimultaneousEvent:
-        """Convert instance of :class:`mutwo.core_events.SimultaneousEvent`."""
+        """Convert instance of :class:`mutwo.core_events.SimultaneousEvent`.
+
+        Only called by converters which are converted recursively (see
+        :meth:`EventConverter._convert_nested_event`).
+        """
 
         converted_simultaneous_event: core_events.SimultaneousEvent = (
             simultaneous_event.empty_copy()
@@ -204,13 +744,18 @@ class SymmetricalEventConverter(EventConverter):
             )
         return converted_simultaneous_event
 
+    @_supports_iterative_conversion
     def _convert_sequential_event(
         self,
         sequential_event: core_events.SequentialEvent,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> core_events.SequentialEvent:
-        """Convert instance of :class:`mutwo.core_events.SequentialEvent`."""
+        """Convert instance of :class:`mutwo.core_events.SequentialEvent`.
+
+        Only called by converters which are converted recursively (see
+        :meth:`EventConverter._convert_nested_event`).
+        """
 
         converted_sequential_event: core_events.SequentialEvent = (
             sequential_event.empty_copy()
@@ -225,10 +770,350 @@ class SymmetricalEventConverter(EventConverter):
             )
         return converted_sequential_event
 
+    @_supports_iterative_conversion
     def _convert_event(
         self,
         event_to_convert: core_events.abc.Event,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> core_events.abc.ComplexEvent[core_events.abc.Event]:
-        return super()._convert_event(event_to_convert, absolute_entry_delay, depth)
+        """Convert :class:`mutwo.core_events.abc.Event` of unknown type.
+
+        Each complex event is replaced by its
+        :meth:`~mutwo.core_events.abc.ComplexEvent.empty_copy` which is
+        filled with the converted children.
+        """
+
+        if self._is_converted_per_nested_event:
+            return self._convert_nested_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
+
+        # The first item is a dummy parent for the converted event.
+        converted_event_list_list: list[list] = [[]]
+
+        def add_simple_event(simple_event, simple_event_delay, simple_event_depth):
+            converted_event_list_list[-1].append(
+                self._convert_simple_event_at_depth(
+                    simple_event, simple_event_delay, simple_event_depth
+                )
+            )
+
+        def add_complex_event(complex_event):
+            converted_event_list_list.append(complex_event.empty_copy())
+
+        # Complex events are only added to their parent when all their
+        # children have been converted, so that no (cached) state of the
+        # parent gets outdated.
+        def close_complex_event():
+            converted_complex_event = converted_event_list_list.pop()
+            converted_event_list_list[-1].append(converted_complex_event)
+            # The cache gets its own copy, so that it doesn't change
+            # if the returned event is changed.
+            if self._subtree_cache is not None:
+                return converted_complex_event.destructive_copy()
+
+        def add_converted_complex_event(converted_complex_event):
+            converted_event_list_list[-1].append(
+                converted_complex_event.destructive_copy()
+            )
+
+        self._walk_event(
+            event_to_convert,
+            absolute_entry_delay,
+            depth,
+            add_simple_event,
+            add_complex_event,
+            close_complex_event,
+            add_converted_complex_event,
+        )
+        return converted_event_list_list[0][0]
+
+    def _iterate_converted_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int = 0,
+    ) -> typing.Iterator[core_events.SimpleEvent]:
+        for (
+            simple_event,
+            simple_event_delay,
+            simple_event_depth,
+        ) in self._iterate_simple_event_and_delay_and_depth(
+            event_to_convert, absolute_entry_delay, depth
+        ):
+            yield self._convert_simple_event_at_depth(
+                simple_event, simple_event_delay, simple_event_depth
+            )
+
+
+class ParallelEventConverter(EventConverter):
+    """Mixin for converters which convert simultaneous voices in parallel.
+
+    :param executor: The executor (e.g. a
+        :class:`concurrent.futures.ProcessPoolExecutor`) which converts
+        the children of a :class:`mutwo.core_events.SimultaneousEvent`
+        in parallel. If ``None`` the event is converted serially.
+        Default to ``None``.
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    :param minimal_simple_event_count_per_chunk: Neighbouring children
+        of the simultaneous event are converted together in one task
+        until they contain at least this number of simple events. If all
+        children fit into one task, the event is converted serially.
+        Default to
+        :const:`mutwo.core_converters.configurations.DEFAULT_MINIMAL_SIMPLE_EVENT_COUNT_PER_CHUNK`.
+    :type minimal_simple_event_count_per_chunk: typing.Optional[int]
+
+    Only the children of the event which is passed to
+    :meth:`_convert_event` are distributed to the executor, nested
+    simultaneous events are converted by the same task as their parent.
+    The output is the same as in the serial conversion (it has the same
+    order and each child gets the same ``absolute_entry_delay``).
+    Because the converter is copied to other processes by a process
+    pool, it has to be picklable (the executor isn't copied) and its
+    :meth:`_convert_simple_event` shouldn't depend on changing the
+    converter or the converted event.
+
+    The mixin has to be placed before the other converter base class.
+    Subclasses with their own ``__init__`` method should call
+    ``ParallelEventConverter.__init__``, otherwise events are converted
+    serially (as if ``executor`` were ``None``).
+
+    **Example:**
+
+    >>> import concurrent.futures
+    >>> from mutwo import core_converters
+    >>> from mutwo import core_events
+    >>> class DurationConverter(
+    >>>     core_converters.abc.ParallelEventConverter,
+    >>>     core_converters.abc.EventConverter,
+    >>> ):
+    >>>     def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+    >>>         return (float(event_to_convert.duration),)
+    >>>     def convert(self, event_to_convert):
+    >>>         return self._convert_event(event_to_convert, 0)
+    >>> event = core_events.SimultaneousEvent(
+    >>>     [core_events.SequentialEvent([core_events.SimpleEvent(2)] * 1000)] * 4
+    >>> )
+    >>> with concurrent.futures.ProcessPoolExecutor() as executor:
+    >>>     converter = DurationConverter(executor)
+    >>>     duration_tuple = converter.convert(event)
+    >>> len(duration_tuple)
+    4000
+    """
+
+    # Defaults for subclasses which don't call the '__init__' method
+    # of the mixin.
+    executor: typing.Optional[concurrent.futures.Executor] = None
+    minimal_simple_event_count_per_chunk: typing.Optional[int] = None
+
+    def __init__(
+        self,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        minimal_simple_event_count_per_chunk: typing.Optional[int] = None,
+    ):
+        self.executor = executor
+        self.minimal_simple_event_count_per_chunk = (
+            minimal_simple_event_count_per_chunk
+        )
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Executors can't be pickled (and are only needed in the
+        # main process).
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    @staticmethod
+    def _count_simple_events(event: core_events.abc.Event) -> int:
+        simple_event_count = 0
+        event_list = [event]
+        while event_list:
+            event = event_list.pop()
+            if isinstance(event, core_events.abc.ComplexEvent):
+                event_list.extend(event)
+            else:
+                simple_event_count += 1
+        return simple_event_count
+
+    def _get_chunk_list(
+        self, simultaneous_event: core_events.SimultaneousEvent
+    ) -> list[list[core_events.abc.Event]]:
+        """Split children of simultaneous event in chunks of neighbouring events."""
+
+        minimal_simple_event_count_per_chunk = (
+            self.minimal_simple_event_count_per_chunk
+        )
+        if minimal_simple_event_count_per_chunk is None:
+            minimal_simple_event_count_per_chunk = (
+                core_converters.configurations.DEFAULT_MINIMAL_SIMPLE_EVENT_COUNT_PER_CHUNK
+            )
+        chunk_list: list[list[core_events.abc.Event]] = [[]]
+        simple_event_count = 0
+        for event in simultaneous_event:
+            if simple_event_count >= minimal_simple_event_count_per_chunk:
+                chunk_list.append([])
+                simple_event_count = 0
+            chunk_list[-1].append(event)
+            simple_event_count += self._count_simple_events(event)
+        # Too small chunks are converted by the previous task.
+        if (
+            len(chunk_list) > 1
+            and simple_event_count < minimal_simple_event_count_per_chunk
+        ):
+            chunk_list[-2].extend(chunk_list.pop())
+        return chunk_list
+
+    def _convert_chunk(
+        self,
+        chunk: list[core_events.abc.Event],
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int,
+    ) -> list[typing.Any]:
+        return [
+            super(ParallelEventConverter, self)._convert_event(
+                event, absolute_entry_delay, depth
+            )
+            for event in chunk
+        ]
+
+    @_supports_iterative_conversion
+    def _convert_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
+        depth: int = 0,
+    ) -> typing.Any:
+        if self.executor is not None and isinstance(
+            event_to_convert, core_events.SimultaneousEvent
+        ):
+            chunk_list = self._get_chunk_list(event_to_convert)
+        else:
+            chunk_list = []
+        # Small events are converted serially.
+        if len(chunk_list) < 2:
+            return super()._convert_event(
+                event_to_convert, absolute_entry_delay, depth
+            )
+
+        absolute_entry_delay = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_entry_delay
+        )
+        converted_event_iterator = itertools.chain.from_iterable(
+            self.executor.map(
+                self._convert_chunk,
+                chunk_list,
+                itertools.repeat(absolute_entry_delay),
+                itertools.repeat(depth + 1),
+            )
+        )
+        if isinstance(self, SymmetricalEventConverter):
+            converted_simultaneous_event = event_to_convert.empty_copy()
+            converted_simultaneous_event.extend(converted_event_iterator)
+            return converted_simultaneous_event
+        return tuple(itertools.chain.from_iterable(converted_event_iterator))
+
+
+class _LeafLocalConverterChain(SymmetricalEventConverter, is_leaf_local=True):
+    """Apply leaf local converters one after the other on each simple event."""
+
+    def __init__(self, converter_sequence: typing.Sequence[SymmetricalEventConverter]):
+        self._converter_tuple = tuple(converter_sequence)
+
+    def _convert_simple_event(
+        self,
+        event_to_convert: core_events.SimpleEvent,
+        absolute_entry_delay: core_parameters.abc.Duration,
+        depth: int = 0,
+    ) -> core_events.SimpleEvent:
+        for converter in self._converter_tuple:
+            event_to_convert = converter._convert_simple_event_at_depth(
+                event_to_convert, absolute_entry_delay, depth
+            )
+        return event_to_convert
+
+    def convert(self, event_to_convert: core_events.abc.Event) -> core_events.abc.Event:
+        return self._convert_event(event_to_convert, 0)
+
+
+class ConverterPipeline(Converter):
+    """Apply several converters one after the other.
+
+    :param converter_sequence: The converters which are applied (in
+        the given order). Each converter gets the output of the previous
+        converter.
+    :type converter_sequence: typing.Sequence[Converter]
+
+    Neighbouring leaf local :class:`SymmetricalEventConverter`
+    (converters which are declared with ``is_leaf_local=True``) are
+    fused: the event is only copied and visited once and each simple
+    event is passed through all of them at once. All other converters
+    (e.g. :class:`mutwo.core_converters.TempoConverter`, which needs
+    to know the complete event) are applied with their
+    :meth:`~Converter.convert` method.
+
+    **Example:**
+
+    >>> from mutwo import core_converters
+    >>> from mutwo import core_events
+    >>> class AddValue(core_converters.abc.SymmetricalEventConverter, is_leaf_local=True):
+    >>>     def __init__(self, value):
+    >>>         self.value = value
+    >>>     def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+    >>>         return event_to_convert.set('value', getattr(event_to_convert, 'value', 0) + self.value, mutate=False)
+    >>>     def convert(self, event_to_convert):
+    >>>         return self._convert_event(event_to_convert, 0)
+    >>> pipeline = core_converters.abc.ConverterPipeline([AddValue(1), AddValue(2)])
+    >>> pipeline.convert(core_events.SequentialEvent([core_events.SimpleEvent(1)]))[0].value
+    3
+    """
+
+    def __init__(self, converter_sequence: typing.Sequence[Converter]):
+        self._converter_tuple = tuple(converter_sequence)
+        # Neighbouring leaf local converters are applied together.
+        stage_list: list[Converter] = []
+        for is_leaf_local, converter_group in itertools.groupby(
+            self._converter_tuple, key=self._is_leaf_local
+        ):
+            converter_group_tuple = tuple(converter_group)
+            if is_leaf_local and len(converter_group_tuple) > 1:
+                stage_list.append(_LeafLocalConverterChain(converter_group_tuple))
+            else:
+                stage_list.extend(converter_group_tuple)
+        self._stage_tuple = tuple(stage_list)
+
+    @staticmethod
+    def _is_leaf_local(converter: Converter) -> bool:
+        return (
+            isinstance(converter, SymmetricalEventConverter)
+            and converter._is_leaf_local
+            # Converters which override the conversion of complex
+            # events can't be fused.
+            and not converter._is_converted_per_nested_event
+        )
+
+    @property
+    def converter_tuple(self) -> tuple[Converter, ...]:
+        """The converters of the pipeline."""
+
+        return self._converter_tuple
+
+    def convert(self, event_to_convert: core_events.abc.Event) -> typing.Any:
+        """Apply all converters of the pipeline on the event.
+
+        :param event_to_convert: The event which shall be converted. Can be
+            any object that inherits from ``mutwo.events.abc.Event``.
+        :return: The output of the last converter of the pipeline.
+        """
+
+        for stage in self._stage_tuple:
+            event_to_convert = stage.convert(event_to_convert)
+        return event_to_convert
@@ -7,3 +7,14 @@ DEFAULT_DURATION_TO_SEARCH_NAME = "duration"
 DEFAULT_DURATION_KEYWORD_NAME = "duration"
 """Default value for :param:`duration_keyword_name` parameter in
 :class:`mutwo.core_converters.MutwoParameterDictToDuration`"""
+
+DEFAULT_TEMPO_MAP_CACHE_SIZE = 128
+"""How many prepared tempo maps are cached by :class:`mutwo.core_converters.TempoConverter`.
+
+The value is read when :mod:`mutwo.core_converters` is imported. To change the
+size later, assign a new :class:`mutwo.core_utilities.LRUCache` to
+:attr:`mutwo.core_converters.TempoConverter.tempo_map_cache`."""
+
+DEFAULT_MINIMAL_SIMPLE_EVENT_COUNT_PER_CHUNK = 1000
+"""Default value for :param:`minimal_simple_event_count_per_chunk` parameter in
+:class:`mutwo.core_converters.abc.ParallelEventConverter`"""
@@ -0,0 +1,328 @@
+"""Play events in real time by calling functions at the start of each simple event.
+
+"""
+
+import abc
+import asyncio
+import inspect
+import math
+import time
+import typing
+
+from mutwo import core_converters
+from mutwo import core_events
+
+
+__all__ = ("Clock", "MonotonicClock", "VirtualClock", "EventScheduler")
+
+
+class Clock(abc.ABC):
+    """Abstract base class for clocks which are used by :class:`EventScheduler`."""
+
+    @abc.abstractmethod
+    def time(self) -> float:
+        """Current time in seconds."""
+
+    @abc.abstractmethod
+    async def sleep(self, duration: float):
+        """Wait for the given duration (in seconds)."""
+
+
+class MonotonicClock(Clock):
+    """Wall clock which is based on :func:`time.monotonic`."""
+
+    def time(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, duration: float):
+        await asyncio.sleep(max(duration, 0))
+
+
+class VirtualClock(Clock):
+    """Clock which doesn't wait when sleeping (for tests and offline rendering).
+
+    :param start: The time when the clock starts. Default to 0.
+    :type start: float
+    :param sleep_latency: How much longer (in seconds) each call of
+        :meth:`sleep` takes than requested. This can be used to simulate
+        an imprecise wall clock. Default to 0.
+    :type sleep_latency: float
+
+    The clock is supposed to be used by only one :class:`EventScheduler`
+    at once.
+
+    **Example:**
+
+    >>> import asyncio
+    >>> from mutwo import core_converters
+    >>> clock = core_converters.VirtualClock(sleep_latency=0.25)
+    >>> asyncio.run(clock.sleep(2))
+    >>> clock.time()
+    2.25
+    """
+
+    def __init__(self, start: float = 0, sleep_latency: float = 0):
+        self._time = start
+        self._sleep_latency = sleep_latency
+
+    def time(self) -> float:
+        return self._time
+
+    async def sleep(self, duration: float):
+        self._time += max(duration, 0) + self._sleep_latency
+        # Give other tasks the chance to run
+        await asyncio.sleep(0)
+
+    def advance(self, duration: float):
+        """Move clock forward (e.g. to simulate a callback which blocks).
+
+        :param duration: How many seconds the clock moves forward.
+        :type duration: float
+        """
+
+        self._time += duration
+
+
+class EventScheduler(object):
+    """Call function at the start of each simple event of an event.
+
+    :param callback: Function which is called for each
+        :class:`~mutwo.core_events.SimpleEvent`. It gets the start
+        and the end of the simple event (as time of the clock of the
+        scheduler) and the simple event. If it returns an awaitable
+        object (e.g. if the callback is a coroutine function), it is
+        run as a task, so that it doesn't block the scheduler.
+    :type callback: typing.Callable[[float, float, core_events.SimpleEvent], typing.Any]
+    :param tempo_converter: Maps the event from beats to seconds.
+        If ``None`` the scheduler converts each event with its own
+        :attr:`~mutwo.core_events.abc.Event.tempo_envelope` (but
+        tempo envelopes of nested events are ignored, use
+        :class:`EventToMetrizedEvent` to apply them before).
+        Default to ``None``.
+    :type tempo_converter: typing.Optional[TempoConverter]
+    :param lookahead: How many seconds before its start each simple
+        event is passed to the callback. The scheduler only wakes up
+        once for all simple events which start within the next
+        ``lookahead`` seconds and passes them to the callback at once,
+        so that the callback can schedule them precisely (e.g. in an
+        audio engine). Default to 0.05.
+    :type lookahead: float
+    :param clock: The clock of the scheduler. If ``None`` a
+        :class:`MonotonicClock` is used. Use :class:`VirtualClock`
+        to test a scheduler. Default to ``None``.
+    :type clock: typing.Optional[Clock]
+
+    The scheduler calculates the time when it has to wake up again
+    from the time when it started playing (and not from the time
+    when it fell asleep), so that imprecise sleeps and slow callbacks
+    don't add up. How late the scheduler wakes up is reported with
+    :attr:`mean_latency`, :attr:`max_latency` and :attr:`jitter`.
+    The speed of the playback can be changed with :attr:`tempo_factor`
+    while playing.
+
+    **Example:**
+
+    >>> import asyncio
+    >>> from mutwo import core_converters
+    >>> from mutwo import core_events
+    >>> clock = core_converters.VirtualClock()
+    >>> scheduler = core_converters.EventScheduler(
+    >>>     lambda start, end, simple_event: print(start, end),
+    >>>     lookahead=0,
+    >>>     clock=clock,
+    >>> )
+    >>> asyncio.run(
+    >>>     scheduler.play(
+    >>>         core_events.SequentialEvent(
+    >>>             [core_events.SimpleEvent(1), core_events.SimpleEvent(2)]
+    >>>         )
+    >>>     )
+    >>> )
+    0.0 1.0
+    1.0 3.0
+    """
+
+    def __init__(
+        self,
+        callback: typing.Callable[
+            [float, float, core_events.SimpleEvent], typing.Any
+        ],
+        tempo_converter: typing.Optional[core_converters.TempoConverter] = None,
+        lookahead: float = 0.05,
+        clock: typing.Optional[Clock] = None,
+    ):
+        if lookahead < 0:
+            raise ValueError(f"'lookahead' can't be negative, but is '{lookahead}'.")
+        self._callback = callback
+        self._tempo_converter = tempo_converter
+        self._lookahead = lookahead
+        self._clock = clock or MonotonicClock()
+        self._tempo_factor = 1.0
+        self._anchor_clock_time: typing.Optional[float] = None
+        self._anchor_score_time = 0.0
+        self.reset_statistics()
+
+    # ###################################################################### #
+    #                         private methods                                #
+    # ###################################################################### #
+
+    def _get_clock_time(self, score_time: float) -> float:
+        """Get time of clock when the score reaches the given time."""
+
+        return (
+            self._anchor_clock_time
+            + (score_time - self._anchor_score_time) / self._tempo_factor
+        )
+
+    def _get_score_time(self, clock_time: float) -> float:
+        """Get time of score when the clock reaches the given time."""
+
+        return (
+            self._anchor_score_time
+            + (clock_time - self._anchor_clock_time) * self._tempo_factor
+        )
+
+    def _add_latency(self, latency: float):
+        self._wake_up_count += 1
+        self._latency_sum += latency
+        self._latency_square_sum += latency**2
+        self._max_latency = max(self._max_latency, latency)
+
+    # ###################################################################### #
+    #                         public properties                              #
+    # ###################################################################### #
+
+    @property
+    def tempo_factor(self) -> float:
+        """How fast the event is played (2 is twice as fast as notated).
+
+        If the tempo factor is changed while playing, it takes effect
+        for all simple events which haven't been passed to the callback
+        yet (if it's changed by another task while the scheduler sleeps,
+        the scheduler notices it after at most ``lookahead`` seconds).
+        """
+
+        return self._tempo_factor
+
+    @tempo_factor.setter
+    def tempo_factor(self, tempo_factor: float):
+        if tempo_factor <= 0:
+            raise ValueError(
+                f"'tempo_factor' has to be bigger than 0, but is '{tempo_factor}'."
+            )
+        if self._anchor_clock_time is not None:
+            clock_time = self._clock.time()
+            self._anchor_score_time = self._get_score_time(clock_time)
+            self._anchor_clock_time = clock_time
+        self._tempo_factor = float(tempo_factor)
+
+    @property
+    def dispatch_count(self) -> int:
+        """How many simple events have been passed to the callback."""
+
+        return self._dispatch_count
+
+    @property
+    def wake_up_count(self) -> int:
+        """How often the scheduler woke up to pass simple events to the callback."""
+
+        return self._wake_up_count
+
+    @property
+    def mean_latency(self) -> float:
+        """How late (in seconds) the scheduler woke up on average."""
+
+        if not self._wake_up_count:
+            return 0.0
+        return self._latency_sum / self._wake_up_count
+
+    @property
+    def max_latency(self) -> float:
+        """How late (in seconds) the scheduler woke up at most."""
+
+        return self._max_latency
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of the latency (in seconds)."""
+
+        if not self._wake_up_count:
+            return 0.0
+        variance = (
+            self._latency_square_sum / self._wake_up_count - self.mean_latency**2
+        )
+        return math.sqrt(max(variance, 0))
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def reset_statistics(self):
+        """Set all statistics (e.g. :attr:`dispatch_count`) to 0."""
+
+        self._dispatch_count = 0
+        self._wake_up_count = 0
+        self._latency_sum = 0.0
+        self._latency_square_sum = 0.0
+        self._max_latency = 0.0
+
+    async def play(self, event_to_play: core_events.abc.Event):
+        """Pass all simple events of the event to the callback in time.
+
+        :param event_to_play: The event which shall be played. Can be
+            any object that inherits from ``mutwo.events.abc.Event``.
+
+        The method returns as soon as the callbacks of all simple events
+        have been called and all tasks of the callbacks are done.
+        """
+
+        tempo_converter = self._tempo_converter or core_converters.TempoConverter(
+            event_to_play.tempo_envelope
+        )
+        timed_simple_event_iterator = tempo_converter.iterate_timed_simple_events(
+            event_to_play
+        )
+        task_list: list[asyncio.Future] = []
+        self._anchor_clock_time = self._clock.time()
+        self._anchor_score_time = 0.0
+        try:
+            timed_simple_event = next(timed_simple_event_iterator, None)
+            while timed_simple_event is not None:
+                # Pass all simple events to the callback which start
+                # before the end of the lookahead.
+                while timed_simple_event is not None and timed_simple_event[
+                    0
+                ] <= self._get_score_time(self._clock.time() + self._lookahead):
+                    start, end, simple_event = timed_simple_event
+                    result = self._callback(
+                        self._get_clock_time(start),
+                        self._get_clock_time(end),
+                        simple_event,
+                    )
+                    if inspect.isawaitable(result):
+                        task_list.append(asyncio.ensure_future(result))
+                    self._dispatch_count += 1
+                    timed_simple_event = next(timed_simple_event_iterator, None)
+                if timed_simple_event is None:
+                    break
+                # Sleep until the next simple event enters the lookahead.
+                # The wake up time is always calculated from the anchor,
+                # so that latencies don't add up. We don't sleep longer
+                # than the lookahead, so that changes of the tempo
+                # factor by other tasks are noticed in time.
+                clock_time = self._clock.time()
+                sleep_duration = max(
+                    self._get_clock_time(timed_simple_event[0])
+                    - self._lookahead
+                    - clock_time,
+                    0,
+                )
+                if self._lookahead:
+                    sleep_duration = min(sleep_duration, self._lookahead)
+                await self._clock.sleep(sleep_duration)
+                self._add_latency(
+                    max(self._clock.time() - clock_time - sleep_duration, 0)
+                )
+            await asyncio.gather(*task_list)
+        finally:
+            self._anchor_clock_time = None
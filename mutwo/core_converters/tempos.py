@@ -2,13 +2,24 @@
 
 """
 
+import hashlib
+import heapq
+import itertools
 import typing
 import warnings
 
+try:
+    import quicktions as fractions  # type: ignore
+except ImportError:
+    import fractions  # type: ignore
+
+import numpy as np
+
 from mutwo import core_constants
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
+from mutwo import core_utilities
 
 
 __all__ = (
@@ -19,12 +30,20 @@ __all__ = (
 
 
 class UndefinedReferenceWarning(RuntimeWarning):
-    def __init__(self, tempo_point: typing.Any):
-        super().__init__(
-            f"Tempo point '{tempo_point}' of type '{type(tempo_point)}' "
-            "doesn't know attribute 'reference'."
-            " Therefore reference has been set to 1."
-        )
+    def __init__(self, tempo_point: typing.Any, tempo_point_count: int = 1):
+        if tempo_point_count > 1:
+            message = (
+                f"Tempo point '{tempo_point}' of type '{type(tempo_point)}' "
+                f"and {tempo_point_count - 1} other tempo point(s) don't know "
+                "attribute 'reference'. Therefore reference has been set to 1."
+            )
+        else:
+            message = (
+                f"Tempo point '{tempo_point}' of type '{type(tempo_point)}' "
+                "doesn't know attribute 'reference'."
+                " Therefore reference has been set to 1."
+            )
+        super().__init__(message)
 
 
 class TempoPointConverter(core_converters.abc.Converter):
@@ -53,9 +72,11 @@ class TempoPointConverter(core_converters.abc.Converter):
         return float(60 / beats_per_minute)
 
     @staticmethod
-    def _extract_beats_per_minute_and_reference_from_tempo_point(
+    def _get_beats_per_minute_and_reference(
         tempo_point: TempoPoint,
-    ) -> tuple[core_constants.Real, core_constants.Real]:
+    ) -> tuple[core_constants.Real, typing.Optional[core_constants.Real]]:
+        """Get BPM and reference (or `None` if tempo point has no reference)."""
+
         try:
             beats_per_minute = tempo_point.tempo_in_beats_per_minute  # type: ignore
         except AttributeError:
@@ -64,9 +85,21 @@ class TempoPointConverter(core_converters.abc.Converter):
         try:
             reference = tempo_point.reference  # type: ignore
         except AttributeError:
+            reference = None
+
+        return beats_per_minute, reference
+
+    @staticmethod
+    def _extract_beats_per_minute_and_reference_from_tempo_point(
+        tempo_point: TempoPoint,
+    ) -> tuple[core_constants.Real, core_constants.Real]:
+        (
+            beats_per_minute,
+            reference,
+        ) = TempoPointConverter._get_beats_per_minute_and_reference(tempo_point)
+        if reference is None:
             warnings.warn(UndefinedReferenceWarning(tempo_point))
             reference = 1
-
         return beats_per_minute, reference
 
     def convert(self, tempo_point_to_convert: TempoPoint) -> float:
@@ -99,8 +132,88 @@ class TempoPointConverter(core_converters.abc.Converter):
             / reference
         )
 
+    def convert_many(
+        self, tempo_point_sequence_to_convert: typing.Sequence[TempoPoint]
+    ) -> np.ndarray:
+        """Converts many :class:`TempoPoint` to beat-length-in-seconds at once.
+
+        :param tempo_point_sequence_to_convert: The tempo points which
+            shall be converted (see :meth:`convert`).
+        :type tempo_point_sequence_to_convert: typing.Sequence[TempoPoint]
+        :return: Array with the duration of one beat in seconds for each
+            tempo point.
+
+        The results are exactly the same as if each tempo point would be
+        converted with :meth:`convert`, but sequences which only contain
+        numbers are converted at once and tempo points which occur
+        several times in the sequence are only converted once. Instead
+        of one warning per tempo point without a reference, only one
+        warning is emitted.
+
+        **Example:**
 
-class TempoConverter(core_converters.abc.EventConverter):
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_parameters
+        >>> converter = core_converters.TempoPointConverter()
+        >>> converter.convert_many([60, 120, core_parameters.TempoPoint(60, reference=2)])
+        array([1. , 0.5, 0.5])
+        """
+
+        if isinstance(tempo_point_sequence_to_convert, np.ndarray):
+            tempo_point_tuple = tuple(tempo_point_sequence_to_convert.tolist())
+        else:
+            tempo_point_tuple = tuple(tempo_point_sequence_to_convert)
+
+        if all(type(tempo_point) in (int, float) for tempo_point in tempo_point_tuple):
+            # Fast path for plain numbers: 60 / BPM as in
+            # '_beats_per_minute_to_seconds_per_beat'.
+            beat_length_in_seconds_array = 60 / np.array(
+                tempo_point_tuple, dtype=float
+            )
+            undefined_reference_tempo_point_list = list(tempo_point_tuple)
+        else:
+            undefined_reference_tempo_point_list = []
+            tempo_point_id_to_beat_length_in_seconds: dict[int, float] = {}
+            beat_length_in_seconds_list = []
+            for tempo_point in tempo_point_tuple:
+                try:
+                    beat_length_in_seconds = tempo_point_id_to_beat_length_in_seconds[
+                        id(tempo_point)
+                    ]
+                except KeyError:
+                    (
+                        beats_per_minute,
+                        reference,
+                    ) = self._get_beats_per_minute_and_reference(tempo_point)
+                    if reference is None:
+                        undefined_reference_tempo_point_list.append(tempo_point)
+                        reference = 1
+                    beat_length_in_seconds = (
+                        TempoPointConverter._beats_per_minute_to_seconds_per_beat(
+                            beats_per_minute
+                        )
+                        / reference
+                    )
+                    tempo_point_id_to_beat_length_in_seconds[
+                        id(tempo_point)
+                    ] = beat_length_in_seconds
+                beat_length_in_seconds_list.append(beat_length_in_seconds)
+            beat_length_in_seconds_array = np.array(
+                beat_length_in_seconds_list, dtype=float
+            )
+
+        if undefined_reference_tempo_point_list:
+            warnings.warn(
+                UndefinedReferenceWarning(
+                    undefined_reference_tempo_point_list[0],
+                    len(undefined_reference_tempo_point_list),
+                )
+            )
+
+        return beat_length_in_seconds_array
+
+
+class TempoConverter(core_converters.abc.EventConverter, is_subtree_cacheable=False):
     """Apply tempo curves on mutwo events
 
     :param tempo_envelope: The tempo curve that shall be applied on the
@@ -111,6 +224,15 @@ class TempoConverter(core_converters.abc.EventConverter):
     :param apply_converter_on_events_tempo_envelope: If set to `True` the
         converter will also adjust the :attr:`tempo_envelope` attribute of
         each converted event. Default to `True`.
+    :param vectorize: If set to `True` the converter doesn't convert each
+        :class:`~mutwo.core_events.SimpleEvent` while recursively visiting
+        the event. Instead it first collects the start and end (in beats)
+        of all simple events and then converts them to seconds at once with
+        :meth:`mutwo.core_events.Envelope.integrate_interval_array`. The
+        results are exactly the same as in the recursive conversion, but
+        events with many simple events are converted much faster. Please
+        note that in this mode :meth:`_convert_simple_event` isn't called.
+        Default to `False`.
 
     **Example:**
 
@@ -123,22 +245,58 @@ class TempoConverter(core_converters.abc.EventConverter):
     >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
     """
 
-    _tempo_point_to_beat_length_in_seconds = TempoPointConverter().convert
+    _tempo_point_sequence_to_beat_length_in_seconds_array = (
+        TempoPointConverter().convert_many
+    )
+    _timed_simple_event_chunk_size = 64
+
+    tempo_map_cache: core_utilities.LRUCache[
+        bytes, core_events.Envelope
+    ] = core_utilities.LRUCache(
+        core_converters.configurations.DEFAULT_TEMPO_MAP_CACHE_SIZE
+    )
+    """Prepared tempo maps which are shared by all converters.
+
+    Before converting, each :class:`TempoConverter` prepares a tempo map
+    (an envelope with the length of one beat in seconds) from its
+    tempo envelope. The tempo maps are cached with a digest of the
+    content of the tempo envelope as a key, so that converters with
+    equal tempo envelopes only need to prepare it once (this happens
+    for instance for the converters which are used internally to
+    convert the tempo envelopes of events). Use the statistics of the
+    cache (:attr:`mutwo.core_utilities.LRUCache.hit_count` and
+    :attr:`mutwo.core_utilities.LRUCache.miss_count`) to check how
+    often tempo maps are reused.
+
+    The digest is built from the :func:`repr` of the absolute times,
+    the tempi (or the tempo in beats per minute and the reference of
+    :class:`mutwo.core_parameters.TempoPoint` objects) and the
+    curve shapes of the tempo envelope. Tempo envelopes with values
+    without a deterministic representation (for instance objects with
+    the default representation which contains their memory address)
+    therefore never hit the cache: their tempo map is prepared again
+    for each converter.
+    """
 
     def __init__(
         self,
         tempo_envelope: core_events.TempoEnvelope,
         apply_converter_on_events_tempo_envelope: bool = True,
+        vectorize: bool = False,
     ):
         self._tempo_envelope = tempo_envelope
         self._beat_length_in_seconds_envelope = (
-            TempoConverter._tempo_envelope_to_beat_length_in_seconds_envelope(
-                tempo_envelope
+            self._get_beat_length_in_seconds_envelope(tempo_envelope)
+        )
+        self._static_beat_length_in_seconds = (
+            self._get_static_beat_length_in_seconds(
+                self._beat_length_in_seconds_envelope
             )
         )
         self._apply_converter_on_events_tempo_envelope = (
             apply_converter_on_events_tempo_envelope
         )
+        self._vectorize = vectorize
 
     # ###################################################################### #
     #                          static methods                                #
@@ -150,12 +308,11 @@ class TempoConverter(core_converters.abc.EventConverter):
     ) -> core_events.Envelope:
         """Convert bpm / TempoPoint based env to beat-length-in-seconds env."""
 
-        level_list: list[float] = []
-        for tempo_point in tempo_envelope.value_tuple:
-            beat_length_in_seconds = (
-                TempoConverter._tempo_point_to_beat_length_in_seconds(tempo_point)
-            )
-            level_list.append(beat_length_in_seconds)
+        level_list: list[float] = (
+            TempoConverter._tempo_point_sequence_to_beat_length_in_seconds_array(
+                tempo_envelope.value_tuple
+            ).tolist()
+        )
 
         return core_events.Envelope(
             [
@@ -168,39 +325,279 @@ class TempoConverter(core_converters.abc.EventConverter):
             ]
         )
 
+    @staticmethod
+    def _get_tempo_envelope_digest(tempo_envelope: core_events.Envelope) -> bytes:
+        """Create key which only depends on the data that defines the tempo map.
+
+        The key is the digest of the :func:`repr` of the points, so
+        equal values need equal representations to share a key.
+        """
+
+        point_list = []
+        for absolute_time, tempo_point, curve_shape in zip(
+            tempo_envelope.absolute_time_tuple,
+            tempo_envelope.value_tuple,
+            tempo_envelope.curve_shape_tuple,
+        ):
+            point_list.append(
+                (
+                    absolute_time,
+                    getattr(tempo_point, "tempo_in_beats_per_minute", tempo_point),
+                    getattr(tempo_point, "reference", None),
+                    curve_shape,
+                )
+            )
+        return hashlib.blake2b(repr(point_list).encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _get_static_beat_length_in_seconds(
+        beat_length_in_seconds_envelope: core_events.Envelope,
+    ) -> typing.Optional[float]:
+        """Return beat length if the tempo never changes, otherwise `None`."""
+
+        if beat_length_in_seconds_envelope and (
+            beat_length_in_seconds_envelope.is_static
+        ):
+            return beat_length_in_seconds_envelope.value_tuple[0]
+        return None
+
     # ###################################################################### #
     #                         private methods                                #
     # ###################################################################### #
 
+    @classmethod
+    def _get_beat_length_in_seconds_envelope(
+        cls, tempo_envelope: core_events.Envelope
+    ) -> core_events.Envelope:
+        """Get prepared tempo map from cache (or prepare and cache it)."""
+
+        tempo_envelope_digest = cls._get_tempo_envelope_digest(tempo_envelope)
+        if (
+            beat_length_in_seconds_envelope := cls.tempo_map_cache.get(
+                tempo_envelope_digest
+            )
+        ) is None:
+            beat_length_in_seconds_envelope = (
+                cls._tempo_envelope_to_beat_length_in_seconds_envelope(tempo_envelope)
+            )
+            cls.tempo_map_cache[tempo_envelope_digest] = beat_length_in_seconds_envelope
+        return beat_length_in_seconds_envelope
+
     def _convert_simple_event(
         self,
         simple_event: core_events.SimpleEvent,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
-    ) -> tuple[typing.Any, ...]:
+    ) -> tuple[core_events.SimpleEvent]:
         simple_event.duration = (
             self._beat_length_in_seconds_envelope.integrate_interval(
                 absolute_entry_delay, simple_event.duration + absolute_entry_delay
             )
         )
-        return tuple([])
+        return (simple_event,)
 
-    def _convert_event(
+    def _get_converted_tempo_envelope(
         self,
-        event_to_convert: core_events.abc.Event,
+        tempo_envelope: core_events.TempoEnvelope,
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
-        depth: int = 0,
-    ) -> core_events.abc.ComplexEvent[core_events.abc.Event]:
-        if self._apply_converter_on_events_tempo_envelope:
-            event_to_convert.tempo_envelope = TempoConverter(
-                self._tempo_envelope.cut_out(
-                    absolute_entry_delay,
-                    absolute_entry_delay + event_to_convert.duration,
-                    mutate=False,
-                ),
-                apply_converter_on_events_tempo_envelope=False,
-            ).convert(event_to_convert.tempo_envelope)
-        return super()._convert_event(event_to_convert, absolute_entry_delay, depth)
+        duration: typing.Union[core_parameters.abc.Duration, float, int],
+    ) -> core_events.TempoEnvelope:
+        """Convert tempo envelope of an event which starts at the given delay."""
+
+        if (beat_length_in_seconds := self._static_beat_length_in_seconds) is not None:
+            # If the tempo never changes, the tempo envelope of the event
+            # only needs to be stretched by the beat length.
+            if beat_length_in_seconds == 1:
+                return tempo_envelope
+            tempo_envelope = tempo_envelope.destructive_copy()
+            for tempo_event in tempo_envelope:
+                tempo_event.duration = (
+                    tempo_event.duration.duration_in_floats * beat_length_in_seconds
+                )
+            return tempo_envelope
+        cut_out_tempo_envelope = self._tempo_envelope.cut_out(
+            absolute_entry_delay, absolute_entry_delay + duration, mutate=False
+        )
+        # Nothing is cut out for events without duration or for events
+        # which start after the last tempo point: then the tempo at the
+        # start of the event is kept.
+        if not cut_out_tempo_envelope:
+            beat_length_in_seconds = self._beat_length_in_seconds_envelope.value_at(
+                absolute_entry_delay
+            )
+            cut_out_tempo_envelope = core_events.TempoEnvelope(
+                [[0, core_parameters.TempoPoint(60 / beat_length_in_seconds)]]
+            )
+        return TempoConverter(
+            cut_out_tempo_envelope, apply_converter_on_events_tempo_envelope=False
+        ).convert(tempo_envelope)
+
+    def _convert_tempo_envelope(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_entry_delay: core_parameters.abc.Duration,
+    ):
+        # With 60 BPM nothing changes at all, so we don't even need to
+        # touch the (maybe not yet initialized) tempo envelope of the event.
+        if self._static_beat_length_in_seconds != 1:
+            event_to_convert.tempo_envelope = self._get_converted_tempo_envelope(
+                event_to_convert.tempo_envelope,
+                absolute_entry_delay,
+                event_to_convert.duration,
+            )
+
+    def _convert_tempo_envelope_of_each_event(
+        self, event_to_convert: core_events.abc.Event
+    ):
+        """Convert tempo envelopes of the event and of all its nested events."""
+
+        event_and_start_list: list[
+            tuple[core_events.abc.Event, fractions.Fraction]
+        ] = [(event_to_convert, fractions.Fraction(0))]
+        while event_and_start_list:
+            event, start = event_and_start_list.pop()
+            self._convert_tempo_envelope(event, core_parameters.DirectDuration(start))
+            if isinstance(event, core_events.SequentialEvent):
+                for child_event in event:
+                    event_and_start_list.append((child_event, start))
+                    start += child_event.duration.duration
+            elif isinstance(event, core_events.SimultaneousEvent):
+                event_and_start_list.extend(
+                    (child_event, start) for child_event in event
+                )
+
+    def _get_simple_event_and_start_and_end_list_tuple(
+        self, event: core_events.abc.Event, convert_tempo_envelope: bool
+    ) -> tuple[list[core_events.SimpleEvent], list[float], list[float]]:
+        """Find all simple events and their absolute start and end.
+
+        Start and end of each event are summed up as exact fractions and
+        rounded in the same way as in the recursive conversion, so that
+        the vectorized conversion returns exactly the same durations.
+        """
+
+        simple_event_list: list[core_events.SimpleEvent] = []
+        start_list: list[float] = []
+        end_list: list[float] = []
+        n_digits = core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS
+        # The end is only needed for simple events. If the parent
+        # already knows it, it's passed to avoid adding it twice.
+        event_and_start_and_end_list: list[
+            tuple[
+                core_events.abc.Event,
+                fractions.Fraction,
+                typing.Optional[fractions.Fraction],
+            ]
+        ] = [(event, fractions.Fraction(0), None)]
+        while event_and_start_and_end_list:
+            event, start, end = event_and_start_and_end_list.pop()
+            if convert_tempo_envelope:
+                self._convert_tempo_envelope(
+                    event, core_parameters.DirectDuration(start)
+                )
+            if isinstance(event, core_events.SimpleEvent):
+                if end is None:
+                    end = start + event.duration.duration
+                simple_event_list.append(event)
+                start_list.append(round(float(start), n_digits))
+                end_list.append(round(float(end), n_digits))
+            elif isinstance(event, core_events.SequentialEvent):
+                for child_event in event:
+                    child_end = start + child_event.duration.duration
+                    event_and_start_and_end_list.append((child_event, start, child_end))
+                    start = child_end
+            elif isinstance(event, core_events.SimultaneousEvent):
+                event_and_start_and_end_list.extend(
+                    (child_event, start, None) for child_event in event
+                )
+            else:
+                raise TypeError(
+                    f"Can't convert object '{event}' of type "
+                    f"'{type(event)}' with TempoConverter."
+                    " Supported types only include all inherited classes "
+                    f"from '{core_events.abc.Event}'."
+                )
+        return simple_event_list, start_list, end_list
+
+    def _vectorized_convert_event(self, event_to_convert: core_events.abc.Event):
+        """Convert all simple events of the passed event at once."""
+
+        (
+            simple_event_list,
+            start_list,
+            end_list,
+        ) = self._get_simple_event_and_start_and_end_list_tuple(
+            event_to_convert, self._apply_converter_on_events_tempo_envelope
+        )
+        if not simple_event_list:
+            return
+        duration_list = self._beat_length_in_seconds_envelope.integrate_interval_array(
+            start_list, end_list
+        ).tolist()
+        for simple_event, duration in zip(simple_event_list, duration_list):
+            simple_event.duration = duration
+
+    def _iterate_simple_events(
+        self, event: core_events.abc.Event, start: fractions.Fraction
+    ) -> typing.Generator[
+        tuple[fractions.Fraction, fractions.Fraction, core_events.SimpleEvent],
+        None,
+        fractions.Fraction,
+    ]:
+        """Lazily yield start, end (in beats) and simple event sorted by start.
+
+        The generator returns the end of the event, so that sequential
+        events know when their next child starts without calculating
+        the duration of each child.
+        """
+
+        if isinstance(event, core_events.SimpleEvent):
+            end = start + event.duration.duration
+            yield start, end, event
+            return end
+        elif isinstance(event, core_events.SequentialEvent):
+            for child_event in event:
+                start = yield from self._iterate_simple_events(child_event, start)
+            return start
+        elif isinstance(event, core_events.SimultaneousEvent):
+            # k-way merge of the (already sorted) children: the heap only
+            # contains the next simple event of each child.
+            end = start
+            heap: list[
+                tuple[
+                    fractions.Fraction,
+                    int,
+                    tuple[
+                        fractions.Fraction,
+                        fractions.Fraction,
+                        core_events.SimpleEvent,
+                    ],
+                    typing.Iterator,
+                ]
+            ] = []
+
+            def push(index: int, iterator: typing.Iterator):
+                nonlocal end
+                try:
+                    item = next(iterator)
+                except StopIteration as stop_iteration:
+                    end = max(end, stop_iteration.value)
+                else:
+                    heapq.heappush(heap, (item[0], index, item, iterator))
+
+            for index, child_event in enumerate(event):
+                push(index, self._iterate_simple_events(child_event, start))
+            while heap:
+                _, index, item, iterator = heapq.heappop(heap)
+                yield item
+                push(index, iterator)
+            return end
+        else:
+            raise TypeError(
+                f"Can't convert object '{event}' of type '{type(event)}' with "
+                f"{type(self).__name__}. Supported types only include all "
+                f"inherited classes from '{core_events.abc.Event}'."
+            )
 
     # ###################################################################### #
     #               public methods for interaction with the user             #
@@ -234,12 +631,237 @@ class TempoConverter(core_converters.abc.EventConverter):
         SequentialEvent([SimpleEvent(duration = 3.0), SimpleEvent(duration = 1.5), SimpleEvent(duration = 2.5)])
         """
         copied_event_to_convert = event_to_convert.destructive_copy()
-        self._convert_event(copied_event_to_convert, core_parameters.DirectDuration(0))
+        if self._vectorize:
+            self._vectorized_convert_event(copied_event_to_convert)
+        else:
+            # Tempo envelopes are converted before the simple events,
+            # because their conversion depends on the durations in beats.
+            if self._apply_converter_on_events_tempo_envelope:
+                self._convert_tempo_envelope_of_each_event(copied_event_to_convert)
+            self._convert_event(
+                copied_event_to_convert, core_parameters.DirectDuration(0)
+            )
         return copied_event_to_convert
 
+    def convert_iter(
+        self, event_to_convert: core_events.abc.Event
+    ) -> typing.Iterator[core_events.SimpleEvent]:
+        """Lazily apply tempo curve of the converter to each simple event.
+
+        :param event_to_convert: The event to convert. Can be any object
+            that inherits from ``mutwo.events.abc.Event``.
+        :return: An iterator over the copied simple events of the event
+            (sorted by their start) which durations have been adapted by
+            the tempo curve of the ``TempoConverter``.
+
+        Like :meth:`convert` the method doesn't change the original event:
+        each simple event is copied only when the iterator reaches it.
+        Therefore the converted simple events don't need to be kept in
+        memory at once.
+
+        **Example:**
+
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 30]])
+        >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
+        >>> my_events = core_events.SequentialEvent([core_events.SimpleEvent(d) for d in (1, 2)])
+        >>> [float(simple_event.duration) for simple_event in my_tempo_converter.convert_iter(my_events)]
+        [2.0, 4.0]
+        """
+
+        for (
+            simple_event,
+            absolute_entry_delay,
+            depth,
+        ) in self._iterate_simple_event_and_delay_and_depth(event_to_convert, 0):
+            copied_simple_event = simple_event.destructive_copy()
+            # The tempo envelope is converted before the simple event,
+            # because its conversion depends on the duration in beats.
+            if self._apply_converter_on_events_tempo_envelope:
+                self._convert_tempo_envelope(copied_simple_event, absolute_entry_delay)
+            yield from self._convert_simple_event(
+                copied_simple_event, absolute_entry_delay, depth
+            )
+
+    def invert(self, event_to_invert: core_events.abc.Event) -> core_events.abc.Event:
+        """Apply the inverse tempo curve of the converter to the entered event.
+
+        :param event_to_invert: The event which durations are given in
+            seconds (for instance because it has been captured from a
+            performance). Can be any object that inherits from
+            ``mutwo.events.abc.Event``.
+        :return: A new ``Event`` object which durations are given in
+            beats.
+
+        This is the inverse of :meth:`convert`: the absolute start and
+        end of each :class:`~mutwo.core_events.SimpleEvent` is mapped
+        from seconds to beats with
+        :meth:`get_absolute_time_in_beats_array` (and all simple events
+        are mapped at once). The tempo envelopes of the events aren't
+        changed.
+
+        **Example:**
+
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
+        >>> my_events = core_events.SequentialEvent([core_events.SimpleEvent(d) for d in (3.5, 2.5, 1)])
+        >>> [float(d) for d in my_tempo_converter.invert(my_events).get_parameter('duration')]
+        [2.0, 2.0, 1.0]
+        """
+
+        copied_event_to_invert = event_to_invert.destructive_copy()
+        (
+            simple_event_list,
+            start_list,
+            end_list,
+        ) = self._get_simple_event_and_start_and_end_list_tuple(
+            copied_event_to_invert, False
+        )
+        if simple_event_list:
+            duration_list = np.diff(
+                self.get_absolute_time_in_beats_array((start_list, end_list)),
+                axis=0,
+            )[0].tolist()
+            for simple_event, duration in zip(simple_event_list, duration_list):
+                simple_event.duration = duration
+        return copied_event_to_invert
+
+    def iterate_timed_simple_events(
+        self, event_to_iterate: core_events.abc.Event
+    ) -> typing.Iterator[tuple[float, float, core_events.SimpleEvent]]:
+        """Lazily get start and end (in seconds) of all simple events.
+
+        :param event_to_iterate: The event which simple events shall be
+            visited. Can be any object that inherits from
+            ``mutwo.events.abc.Event``.
+        :return: Iterator which yields tuples with the absolute start (in
+            seconds), the absolute end (in seconds) and the
+            :class:`~mutwo.core_events.SimpleEvent`. The simple events
+            are sorted by their start (simple events of different
+            children of a :class:`~mutwo.core_events.SimultaneousEvent`
+            are merged and simple events which start at the same time
+            are sorted by the position of their children).
+
+        In contrast to :meth:`convert` the event is neither copied nor
+        converted: the method only walks through the event while the
+        iterator is consumed (and only reads a few simple events ahead),
+        so that it can be used for real-time playback. The yielded simple
+        events are the original simple events (with their durations in
+        beats), so they shouldn't be changed. ``end - start`` is exactly
+        the duration which :meth:`convert` would assign to a simple
+        event. The tempo envelopes of the events are ignored.
+
+        **Example:**
 
-class EventToMetrizedEvent(core_converters.abc.SymmetricalEventConverter):
-    """Apply tempo envelope of event on itself"""
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
+        >>> my_events = core_events.SimultaneousEvent(
+        >>>     [
+        >>>         core_events.SequentialEvent([core_events.SimpleEvent(d) for d in (2, 3)]),
+        >>>         core_events.SequentialEvent([core_events.SimpleEvent(d) for d in (1, 3)]),
+        >>>     ]
+        >>> )
+        >>> [
+        >>>     (start, end)
+        >>>     for start, end, _ in my_tempo_converter.iterate_timed_simple_events(my_events)
+        >>> ]
+        [(0.0, 3.5), (0.0, 1.875), (1.875, 6.0), (3.5, 7.0)]
+        """
+
+        iterator = self._iterate_simple_events(event_to_iterate, fractions.Fraction(0))
+        n_digits = core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS
+        # Mapping absolute times one by one is much slower than mapping
+        # a few of them at once, so we read a bit ahead.
+        while chunk := tuple(
+            itertools.islice(iterator, self._timed_simple_event_chunk_size)
+        ):
+            absolute_time_in_seconds_list = self.get_absolute_time_in_seconds_array(
+                [
+                    round(float(absolute_time), n_digits)
+                    for start, end, _ in chunk
+                    for absolute_time in (start, end)
+                ]
+            ).tolist()
+            for index, (_, _, simple_event) in enumerate(chunk):
+                yield (
+                    absolute_time_in_seconds_list[index * 2],
+                    absolute_time_in_seconds_list[index * 2 + 1],
+                    simple_event,
+                )
+
+    def get_absolute_time_in_seconds_array(
+        self,
+        absolute_time_in_beats_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+    ) -> np.ndarray:
+        """Map absolute times from beats to seconds.
+
+        :param absolute_time_in_beats_sequence: The absolute times (in
+            beats) which shall be mapped.
+        :type absolute_time_in_beats_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :return: Array with the absolute times in seconds.
+
+        **Example:**
+
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
+        >>> my_tempo_converter.get_absolute_time_in_seconds_array([0, 2, 4, 5])
+        array([0. , 3.5, 6. , 7. ])
+        """
+
+        return self._beat_length_in_seconds_envelope.integrate_interval_array(
+            0, absolute_time_in_beats_sequence
+        )
+
+    def get_absolute_time_in_beats_array(
+        self,
+        absolute_time_in_seconds_sequence: typing.Sequence[core_constants.Real],
+    ) -> np.ndarray:
+        """Map absolute times from seconds to beats.
+
+        :param absolute_time_in_seconds_sequence: The absolute times (in
+            seconds) which shall be mapped.
+        :type absolute_time_in_seconds_sequence: typing.Sequence[core_constants.Real]
+        :return: Array with the absolute times in beats.
+
+        This is the inverse of :meth:`get_absolute_time_in_seconds_array`.
+
+        **Example:**
+
+        >>> from mutwo import core_converters
+        >>> from mutwo import core_events
+        >>> tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        >>> my_tempo_converter = core_converters.TempoConverter(tempo_envelope)
+        >>> my_tempo_converter.get_absolute_time_in_beats_array([0, 3.5, 6, 7])
+        array([0., 2., 4., 5.])
+        """
+
+        return self._beat_length_in_seconds_envelope.get_time_at_integral_array(
+            absolute_time_in_seconds_sequence
+        )
+
+
+class EventToMetrizedEvent(
+    core_converters.abc.SymmetricalEventConverter, is_subtree_cacheable=False
+):
+    """Apply tempo envelope of event on itself
+
+    The event is only copied once. While visiting the nested events the
+    converter collects the tempo maps of all metrized events. The
+    :class:`~mutwo.core_events.SimpleEvent` objects which share the same
+    metrized ancestors are converted together: the tempo maps of these
+    ancestors are applied at once on the starts and ends of all of them
+    (instead of converting each nested event again and again with its
+    own :class:`TempoConverter`).
+    """
 
     def __init__(
         self,
@@ -249,6 +871,279 @@ class EventToMetrizedEvent(core_converters.abc.SymmetricalEventConverter):
         self._skip_level_count = skip_level_count
         self._maxima_depth_count = maxima_depth_count
 
+    # ###################################################################### #
+    #                          static methods                                #
+    # ###################################################################### #
+
+    @staticmethod
+    def _get_duration_dict(
+        event: core_events.abc.Event,
+    ) -> dict[int, fractions.Fraction]:
+        """Find duration (in beats) of event and of all its nested events."""
+
+        duration_dict: dict[int, fractions.Fraction] = {}
+        # Complex events are visited twice: before their children (to
+        # add them) and after their children (to sum up their durations).
+        event_and_is_visited_list: list[tuple[core_events.abc.Event, bool]] = [
+            (event, False)
+        ]
+        while event_and_is_visited_list:
+            event, is_visited = event_and_is_visited_list.pop()
+            if isinstance(event, core_events.SimpleEvent):
+                duration_dict[id(event)] = event.duration.duration
+            elif not isinstance(
+                event, (core_events.SequentialEvent, core_events.SimultaneousEvent)
+            ):
+                raise TypeError(
+                    f"Can't convert object '{event}' of type '{type(event)}' with "
+                    f"{EventToMetrizedEvent.__name__}. Supported types only "
+                    f"include all inherited classes from '{core_events.abc.Event}'."
+                )
+            elif not is_visited:
+                event_and_is_visited_list.append((event, True))
+                event_and_is_visited_list.extend(
+                    (child_event, False) for child_event in event
+                )
+            elif isinstance(event, core_events.SequentialEvent):
+                duration_dict[id(event)] = sum(
+                    (duration_dict[id(child_event)] for child_event in event),
+                    fractions.Fraction(0),
+                )
+            else:
+                duration_dict[id(event)] = max(
+                    (duration_dict[id(child_event)] for child_event in event),
+                    default=fractions.Fraction(0),
+                )
+        return duration_dict
+
+    @staticmethod
+    def _get_position_list(
+        position: fractions.Fraction,
+        tempo_converter_and_origin_list: list[tuple[TempoConverter, typing.Any]],
+    ) -> list:
+        """Get position of absolute time (in beats) in each tempo map.
+
+        The first tempo map is applied on the absolute time, the second
+        tempo map on the result of the first tempo map and so on.
+        Each tempo map starts at its origin (the start of the event which
+        owns the tempo map).
+        """
+
+        position_list = [position]
+        for tempo_converter, origin in tempo_converter_and_origin_list:
+            position = (
+                tempo_converter._beat_length_in_seconds_envelope.integrate_interval(
+                    0, position - origin
+                )
+            )
+            position_list.append(position)
+        return position_list
+
+    @staticmethod
+    def _get_last_position_array(
+        position_list: list[fractions.Fraction],
+        tempo_converter_and_origin_list: list[tuple[TempoConverter, typing.Any]],
+    ) -> np.ndarray:
+        """Vectorized version of :meth:`_get_position_list`.
+
+        Only the positions in the last tempo map are returned. Like
+        :meth:`mutwo.core_events.Envelope.integrate_interval` the
+        positions are rounded before each tempo map is applied.
+        """
+
+        n_digits = core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS
+        (tempo_converter, origin), *tempo_converter_and_origin_list = (
+            tempo_converter_and_origin_list
+        )
+        # The positions in the first tempo map are exact fractions
+        position_array = tempo_converter.get_absolute_time_in_seconds_array(
+            [round(float(position - origin), n_digits) for position in position_list]
+        )
+        for tempo_converter, origin in tempo_converter_and_origin_list:
+            position_array = tempo_converter.get_absolute_time_in_seconds_array(
+                np.round(position_array - origin, n_digits)
+            )
+        return position_array
+
+    # ###################################################################### #
+    #                         private methods                                #
+    # ###################################################################### #
+
+    def _is_metrized(self, depth: int) -> bool:
+        return (self._skip_level_count is None or self._skip_level_count < depth) and (
+            self._maxima_depth_count is None or depth < self._maxima_depth_count
+        )
+
+    def _convert_tempo_envelope(
+        self,
+        event: core_events.abc.Event,
+        start_position_list: list,
+        end_position_list: list,
+        tempo_converter_and_origin_list: list[tuple[TempoConverter, typing.Any]],
+    ):
+        """Adjust tempo envelope of event to the tempo maps of its ancestors.
+
+        This is the same as what :class:`TempoConverter` does with the tempo
+        envelopes of all converted events.
+        """
+
+        for (tempo_converter, origin), start, end in zip(
+            tempo_converter_and_origin_list, start_position_list, end_position_list
+        ):
+            event.tempo_envelope = tempo_converter._get_converted_tempo_envelope(
+                event.tempo_envelope, start - origin, end - start
+            )
+
+    def _metrize_event(
+        self,
+        event: core_events.abc.Event,
+        depth: int,
+        duration_dict: dict[int, fractions.Fraction],
+    ):
+        """Metrize event and all its nested events in place.
+
+        Only the positions of complex events (and of simple events which
+        have their own tempo map or which aren't metrized) are mapped one
+        by one through the tempo maps of their ancestors. All other simple
+        events are collected per list of tempo maps. At the end the tempo
+        maps of each list are applied at once on the starts and ends of
+        all its simple events.
+        """
+
+        # id of tempo converter list -> (
+        #   tempo converter list, simple event list, start list, end list
+        # )
+        simple_event_batch_dict: dict[
+            int,
+            tuple[
+                list[tuple[TempoConverter, typing.Any]],
+                list[core_events.SimpleEvent],
+                list[fractions.Fraction],
+                list[fractions.Fraction],
+            ],
+        ] = {}
+        event_and_depth_and_start_and_tempo_converter_list: list[
+            tuple[
+                core_events.abc.Event,
+                int,
+                fractions.Fraction,
+                list[tuple[TempoConverter, typing.Any]],
+            ]
+        ] = [(event, depth, fractions.Fraction(0), [])]
+        while event_and_depth_and_start_and_tempo_converter_list:
+            (
+                event,
+                depth,
+                start,
+                tempo_converter_and_origin_list,
+            ) = event_and_depth_and_start_and_tempo_converter_list.pop()
+            end = start + duration_dict[id(event)]
+            is_metrized = self._is_metrized(depth)
+            if is_metrized:
+                tempo_converter = TempoConverter(event.tempo_envelope)
+                # 60 BPM doesn't change anything: we can skip the tempo map (its
+                # tempo envelope keeps its values when adjusting it to the tempo
+                # maps of the ancestors, so it would still be 60 BPM).
+                is_metrized_by_ancestors_only = (
+                    tempo_converter._static_beat_length_in_seconds == 1
+                )
+            else:
+                is_metrized_by_ancestors_only = False
+
+            if is_metrized_by_ancestors_only and isinstance(
+                event, core_events.SimpleEvent
+            ):
+                event.reset_tempo_envelope()
+                # Without any tempo map the duration stays the same
+                if tempo_converter_and_origin_list:
+                    (
+                        _,
+                        simple_event_list,
+                        start_list,
+                        end_list,
+                    ) = simple_event_batch_dict.setdefault(
+                        id(tempo_converter_and_origin_list),
+                        (tempo_converter_and_origin_list, [], [], []),
+                    )
+                    simple_event_list.append(event)
+                    start_list.append(start)
+                    end_list.append(end)
+                continue
+
+            start_position_list = self._get_position_list(
+                start, tempo_converter_and_origin_list
+            )
+            end_position_list = self._get_position_list(
+                end, tempo_converter_and_origin_list
+            )
+            if is_metrized:
+                if not is_metrized_by_ancestors_only:
+                    self._convert_tempo_envelope(
+                        event,
+                        start_position_list,
+                        end_position_list,
+                        tempo_converter_and_origin_list,
+                    )
+                    tempo_converter = TempoConverter(event.tempo_envelope)
+                    origin = start_position_list[-1]
+                    tempo_converter_and_origin_list = (
+                        tempo_converter_and_origin_list + [(tempo_converter, origin)]
+                    )
+                    beat_length_in_seconds_envelope = (
+                        tempo_converter._beat_length_in_seconds_envelope
+                    )
+                    for position_list in (start_position_list, end_position_list):
+                        position_list.append(
+                            beat_length_in_seconds_envelope.integrate_interval(
+                                0, position_list[-1] - origin
+                            )
+                        )
+                event.reset_tempo_envelope()
+            else:
+                self._convert_tempo_envelope(
+                    event,
+                    start_position_list,
+                    end_position_list,
+                    tempo_converter_and_origin_list,
+                )
+
+            if isinstance(event, core_events.SimpleEvent):
+                if tempo_converter_and_origin_list:
+                    event.duration = end_position_list[-1] - start_position_list[-1]
+            elif isinstance(event, core_events.SequentialEvent):
+                child_start = start
+                for child_event in event:
+                    event_and_depth_and_start_and_tempo_converter_list.append(
+                        (
+                            child_event,
+                            depth + 1,
+                            child_start,
+                            tempo_converter_and_origin_list,
+                        )
+                    )
+                    child_start += duration_dict[id(child_event)]
+            else:
+                event_and_depth_and_start_and_tempo_converter_list.extend(
+                    (child_event, depth + 1, start, tempo_converter_and_origin_list)
+                    for child_event in event
+                )
+
+        for (
+            tempo_converter_and_origin_list,
+            simple_event_list,
+            start_list,
+            end_list,
+        ) in simple_event_batch_dict.values():
+            duration_array = self._get_last_position_array(
+                end_list, tempo_converter_and_origin_list
+            ) - self._get_last_position_array(
+                start_list, tempo_converter_and_origin_list
+            )
+            for simple_event, duration in zip(
+                simple_event_list, duration_array.tolist()
+            ):
+                simple_event.duration = duration
+
     def _convert_simple_event(
         self,
         event_to_convert: core_events.SimpleEvent,
@@ -263,17 +1158,33 @@ class EventToMetrizedEvent(core_converters.abc.SymmetricalEventConverter):
         absolute_entry_delay: typing.Union[core_parameters.abc.Duration, float, int],
         depth: int = 0,
     ) -> core_events.abc.ComplexEvent[core_events.abc.Event]:
-        if (self._skip_level_count is None or self._skip_level_count < depth) and (
-            self._maxima_depth_count is None or depth < self._maxima_depth_count
-        ):
-            tempo_converter = TempoConverter(event_to_convert.tempo_envelope)
-            event_to_convert = tempo_converter.convert(event_to_convert)
-            event_to_convert.reset_tempo_envelope()
-        else:
-            # XXX: Ensure we return copied event!
-            event_to_convert = event_to_convert.destructive_copy()
-        return super()._convert_event(event_to_convert, absolute_entry_delay, depth)
+        # XXX: Ensure we return copied event!
+        event_to_convert = event_to_convert.destructive_copy()
+        self._metrize_event(
+            event_to_convert, depth, self._get_duration_dict(event_to_convert)
+        )
+        return event_to_convert
+
+    # ###################################################################### #
+    #               public methods for interaction with the user             #
+    # ###################################################################### #
 
     def convert(self, event_to_convert: core_events.abc.Event) -> core_events.abc.Event:
         """Apply tempo envelope of event on itself"""
         return self._convert_event(event_to_convert, 0, 0)
+
+    def convert_iter(
+        self, event_to_convert: core_events.abc.Event
+    ) -> typing.Iterator[core_events.SimpleEvent]:
+        """Apply tempo envelope of event on itself and iterate its simple events.
+
+        The simple events are returned in the order of their start.
+
+        Unlike :meth:`TempoConverter.convert_iter` this method isn't
+        lazy: the duration of a simple event depends on the tempo
+        envelopes of all its ancestors (and the positions of its
+        siblings in beats), so the whole event is copied and metrized
+        before the first simple event is returned. Memory therefore
+        grows with the size of the event like in :meth:`convert`.
+        """
+        return super().convert_iter(self.convert(event_to_convert))
@@ -61,4 +61,11 @@ DEFAULT_PARAMETER_ATTRIBUTE_NAME = "value"
 DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME = "curve_shape"
 """Default attribute name when fetching the curve shape of an event"""
 
+DEFAULT_ENVELOPE_OPERATION_MAX_ERROR = 0.001
+"""Default tolerance for envelope operations which can't be calculated exactly.
+
+Used by :meth:`mutwo.core_events.Envelope.add`, :meth:`mutwo.core_events.Envelope.multiply`,
+:meth:`mutwo.core_events.Envelope.minimum`, :meth:`mutwo.core_events.Envelope.maximum`
+and :meth:`mutwo.core_events.Envelope.map`."""
+
 del typing
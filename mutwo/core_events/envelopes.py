@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import bisect
+import copyreg
+import functools
+import math
 import typing
 import warnings
 
-from scipy import integrate
+import numpy as np  # type: ignore
+
+try:
+    import quicktions as fractions
+except ImportError:
+    import fractions
 
 from mutwo import core_constants
 from mutwo import core_events
@@ -13,11 +22,1037 @@ from mutwo import core_parameters
 from mutwo import core_utilities
 
 
-__all__ = ("Envelope", "RelativeEnvelope", "TempoEnvelope")
+__all__ = (
+    "Envelope",
+    "RelativeEnvelope",
+    "TempoEnvelope",
+    "PointEnvelope",
+    "EnvelopeCursor",
+)
 
 T = typing.TypeVar("T", bound=core_events.abc.Event)
 
 
+# ###################################################################### #
+#         private helper functions for array based calculations          #
+# ###################################################################### #
+
+# The following functions implement the math of an envelope for NumPy
+# arrays. Each envelope is represented by three arrays of equal size:
+# the absolute time of each point, the value of each point and the
+# curve shape of the segment which starts at the respective point.
+# The formulas equal the formulas of 'core_utilities.scale'.
+
+PointArrayTuple = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _get_curve_array(
+    percentage_array: np.ndarray, curve_shape_array: np.ndarray
+) -> np.ndarray:
+    """Map percentages (0 - 1) of segments to the curved percentages (0 - 1)."""
+
+    is_linear_array = curve_shape_array == 0
+    # Avoid zero division for linear segments
+    save_curve_shape_array = np.where(is_linear_array, 1, curve_shape_array)
+    return np.where(
+        is_linear_array,
+        percentage_array,
+        np.expm1(save_curve_shape_array * percentage_array)
+        / np.expm1(save_curve_shape_array),
+    )
+
+
+def _get_curve_integral_array(
+    percentage_array: np.ndarray, curve_shape_array: np.ndarray
+) -> np.ndarray:
+    """Integrate curved percentages of segments from 0 to the given percentages."""
+
+    is_linear_array = curve_shape_array == 0
+    save_curve_shape_array = np.where(is_linear_array, 1, curve_shape_array)
+    return np.where(
+        is_linear_array,
+        (percentage_array * percentage_array) / 2,
+        (
+            (np.expm1(save_curve_shape_array * percentage_array) / save_curve_shape_array)
+            - percentage_array
+        )
+        / np.expm1(save_curve_shape_array),
+    )
+
+
+def _locate_time_array(
+    point_array_tuple: PointArrayTuple, time_array: np.ndarray
+) -> tuple[np.ndarray, ...]:
+    """Find active segment and the percentage within this segment for each time.
+
+    Returns the index of the first point of each segment, the duration
+    of each segment and the percentage within each segment (clipped
+    to the range 0 - 1, so times before the first or after the last
+    point are mapped to the start or end of the first or last segment).
+    """
+
+    absolute_time_array, _, _ = point_array_tuple
+    index_array = np.clip(
+        np.searchsorted(absolute_time_array, time_array, side="right") - 1,
+        0,
+        len(absolute_time_array) - 2,
+    )
+    segment_start_array = absolute_time_array[index_array]
+    segment_duration_array = absolute_time_array[index_array + 1] - segment_start_array
+    has_duration_array = segment_duration_array > 0
+    percentage_array = np.where(
+        has_duration_array,
+        np.clip(
+            (time_array - segment_start_array)
+            / np.where(has_duration_array, segment_duration_array, 1),
+            0,
+            1,
+        ),
+        # Segments without any duration are only active if the
+        # time is before the first or after the last point.
+        (time_array >= segment_start_array).astype(float),
+    )
+    return index_array, segment_duration_array, percentage_array
+
+
+def _sequences_to_point_array_tuple(
+    absolute_time_sequence: typing.Sequence[core_constants.Real],
+    value_sequence: typing.Sequence[core_constants.Real],
+    curve_shape_sequence: typing.Optional[typing.Sequence[core_constants.Real]],
+) -> PointArrayTuple:
+    """Convert and validate sequences which describe the points of an envelope."""
+
+    absolute_time_array, value_array = (
+        np.array(sequence, dtype=float)
+        for sequence in (absolute_time_sequence, value_sequence)
+    )
+    if curve_shape_sequence is None:
+        curve_shape_array = np.zeros(len(absolute_time_array))
+    else:
+        curve_shape_array = np.array(curve_shape_sequence, dtype=float)
+    if not (len(absolute_time_array) == len(value_array) == len(curve_shape_array)):
+        raise ValueError(
+            "Found arrays with unequal sizes: absolute times "
+            f"({len(absolute_time_array)}), values ({len(value_array)}) "
+            f"and curve shapes ({len(curve_shape_array)})."
+        )
+    if np.any(np.diff(absolute_time_array) < 0):
+        raise ValueError("Absolute times have to be sorted in ascending order.")
+    return absolute_time_array, value_array, curve_shape_array
+
+
+def _value_at_array(
+    point_array_tuple: PointArrayTuple, time_array: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of :meth:`Envelope.value_at`."""
+
+    _, value_array, curve_shape_array = point_array_tuple
+    if len(value_array) == 1:
+        return np.full(time_array.shape, value_array[0], dtype=float)
+    index_array, _, percentage_array = _locate_time_array(
+        point_array_tuple, time_array
+    )
+    value0_array = value_array[index_array]
+    return value0_array + (value_array[index_array + 1] - value0_array) * (
+        _get_curve_array(percentage_array, curve_shape_array[index_array])
+    )
+
+
+def _get_segment_integral_array(point_array_tuple: PointArrayTuple) -> np.ndarray:
+    """Return the integral of each segment of an envelope."""
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    value0_array = value_array[:-1]
+    return np.diff(absolute_time_array) * (
+        value0_array
+        + (value_array[1:] - value0_array)
+        * _get_curve_integral_array(np.ones(len(value0_array)), curve_shape_array[:-1])
+    )
+
+
+def _integrate_from_start_array(
+    point_array_tuple: PointArrayTuple,
+    time_array: np.ndarray,
+    cumulative_integral_array: typing.Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Integrate envelope from its first point to each time of the given array.
+
+    Before the first and after the last point the envelope holds
+    the value of the first or last point. Therefore times before
+    the first point return negative integrals (if values are
+    positive).
+
+    The floating point operations are the same as in
+    :meth:`Envelope._integrate_from_start`, so that both return
+    exactly the same results.
+    """
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    first_time, last_time = absolute_time_array[0], absolute_time_array[-1]
+    if cumulative_integral_array is None:
+        cumulative_integral_array = np.concatenate(
+            ((0,), np.cumsum(_get_segment_integral_array(point_array_tuple)))
+        )
+    before_integral_array = (time_array - first_time) * value_array[0]
+    after_integral_array = (
+        cumulative_integral_array[-1] + (time_array - last_time) * value_array[-1]
+    )
+    if len(value_array) == 1:
+        return np.where(
+            time_array <= first_time, before_integral_array, after_integral_array
+        )
+    index_array = np.clip(
+        np.searchsorted(absolute_time_array, time_array, side="right") - 1,
+        0,
+        len(absolute_time_array) - 2,
+    )
+    segment_start_array = absolute_time_array[index_array]
+    segment_duration_array = absolute_time_array[index_array + 1] - segment_start_array
+    # Segments without any duration are never active for times
+    # between the first and the last point, so their (invalid)
+    # results are always discarded.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage_array = (time_array - segment_start_array) / segment_duration_array
+        curve_integral_array = _get_curve_integral_array(
+            percentage_array, curve_shape_array[index_array]
+        )
+    value0_array = value_array[index_array]
+    with np.errstate(invalid="ignore"):
+        within_integral_array = cumulative_integral_array[
+            index_array
+        ] + segment_duration_array * (
+            value0_array * percentage_array
+            + (value_array[index_array + 1] - value0_array) * curve_integral_array
+        )
+    return np.where(
+        time_array <= first_time,
+        before_integral_array,
+        np.where(time_array >= last_time, after_integral_array, within_integral_array),
+    )
+
+
+_INTEGRAL_TO_TIME_MAX_ITERATION_COUNT = 64
+# Tolerance of the percentage within a segment. The error of the
+# integral itself is close to the float precision, so that smaller
+# steps are only noise.
+_INTEGRAL_TO_TIME_TOLERANCE = 1e-14
+
+
+def _integral_to_time_array(
+    point_array_tuple: PointArrayTuple,
+    integral_array: np.ndarray,
+    cumulative_integral_array: typing.Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Inverse of :func:`_integrate_from_start_array`.
+
+    Find for each integral the time at which the integral from the
+    first point reaches it. The envelope must only have positive
+    values (so that the integral is strictly increasing).
+
+    Within linear segments the time is the solution of a quadratic
+    equation. Within curved segments it's found with Newton's method,
+    which falls back to bisection whenever a step leaves the range
+    in which the solution is known to be.
+    """
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    first_time, last_time = absolute_time_array[0], absolute_time_array[-1]
+    if cumulative_integral_array is None:
+        cumulative_integral_array = np.concatenate(
+            ((0,), np.cumsum(_get_segment_integral_array(point_array_tuple)))
+        )
+    last_integral = cumulative_integral_array[-1]
+    time_array = np.where(
+        integral_array <= 0,
+        first_time + integral_array / value_array[0],
+        last_time + (integral_array - last_integral) / value_array[-1],
+    )
+    is_within_array = (integral_array > 0) & (integral_array < last_integral)
+    if not is_within_array.any():
+        return time_array
+
+    within_integral_array = integral_array[is_within_array]
+    # Segments without duration never contain a searched integral,
+    # because their start and end integral are equal.
+    index_array = (
+        np.searchsorted(cumulative_integral_array, within_integral_array, side="right")
+        - 1
+    )
+    segment_start_array = absolute_time_array[index_array]
+    segment_duration_array = absolute_time_array[index_array + 1] - segment_start_array
+    value0_array = value_array[index_array]
+    value_difference_array = value_array[index_array + 1] - value0_array
+    curve_shape_array = curve_shape_array[index_array]
+    # Integral per duration which is still missing within the segment
+    relative_integral_array = (
+        within_integral_array - cumulative_integral_array[index_array]
+    ) / segment_duration_array
+
+    # Linear segments: solve v0 * p + (v1 - v0) * p² / 2 = r
+    # (in a form which is also stable if v1 equals v0).
+    percentage_array = (2 * relative_integral_array) / (
+        value0_array
+        + np.sqrt(
+            np.maximum(
+                value0_array**2 + 2 * value_difference_array * relative_integral_array,
+                0,
+            )
+        )
+    )
+
+    is_curved_array = curve_shape_array != 0
+    if is_curved_array.any():
+        curve_shape_array = curve_shape_array[is_curved_array]
+        value0_array = value0_array[is_curved_array]
+        value_difference_array = value_difference_array[is_curved_array]
+        relative_integral_array = relative_integral_array[is_curved_array]
+        lower_percentage_array = np.zeros(len(curve_shape_array))
+        upper_percentage_array = np.ones(len(curve_shape_array))
+        curved_percentage_array = np.clip(percentage_array[is_curved_array], 0, 1)
+        for _ in range(_INTEGRAL_TO_TIME_MAX_ITERATION_COUNT):
+            error_array = (
+                value0_array * curved_percentage_array
+                + value_difference_array
+                * _get_curve_integral_array(curved_percentage_array, curve_shape_array)
+                - relative_integral_array
+            )
+            lower_percentage_array = np.where(
+                error_array < 0, curved_percentage_array, lower_percentage_array
+            )
+            upper_percentage_array = np.where(
+                error_array > 0, curved_percentage_array, upper_percentage_array
+            )
+            # The derivative of the integral is the value of the envelope
+            next_percentage_array = curved_percentage_array - error_array / (
+                value0_array
+                + value_difference_array
+                * _get_curve_array(curved_percentage_array, curve_shape_array)
+            )
+            next_percentage_array = np.where(
+                (next_percentage_array >= lower_percentage_array)
+                & (next_percentage_array <= upper_percentage_array),
+                next_percentage_array,
+                (lower_percentage_array + upper_percentage_array) / 2,
+            )
+            step_size = np.abs(next_percentage_array - curved_percentage_array).max()
+            curved_percentage_array = next_percentage_array
+            if step_size <= _INTEGRAL_TO_TIME_TOLERANCE:
+                break
+        percentage_array[is_curved_array] = curved_percentage_array
+
+    time_array[is_within_array] = (
+        segment_start_array + np.clip(percentage_array, 0, 1) * segment_duration_array
+    )
+    return time_array
+
+
+_SIMPLIFY_MIN_EVENLY_SPLIT_RANGE_LENGTH = 64
+_ENVELOPE_OPERATION_MAX_SAMPLE_DEPTH = 24
+
+
+def _simplify_point_array_tuple(
+    point_array_tuple: PointArrayTuple, max_error: float
+) -> tuple[PointArrayTuple, float]:
+    """Remove points while keeping the envelope within the given tolerance.
+
+    This is the Ramer–Douglas–Peucker algorithm, generalised to curve
+    shapes: a range of original segments is replaced by one linear
+    segment and the error of a range is the largest difference in
+    value between the original envelope and this line. Inside of
+    curved segments the difference is largest where the curve has the
+    same slope as the line (as curves are exponential there is at most
+    one such point), so the error is calculated exactly and doesn't
+    depend on any sampling. Segments which aren't replaced keep their
+    curve shape. Points of zero-duration segments (jumps) are always kept.
+
+    All ranges which exceed the tolerance are split at once, so each
+    round costs O(n) and usually there are O(log n) rounds.
+    """
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    point_count = len(absolute_time_array)
+    if point_count <= 2:
+        return point_array_tuple, 0.0
+
+    segment_duration_array = np.diff(absolute_time_array)
+    segment_value_difference_array = np.diff(value_array)
+
+    is_kept_array = np.zeros(point_count, dtype=bool)
+    is_kept_array[[0, -1]] = True
+    is_jump_array = segment_duration_array == 0
+    is_kept_array[:-1] |= is_jump_array
+    is_kept_array[1:] |= is_jump_array
+
+    # Ranges which are within the tolerance are never split again,
+    # so each round only needs to look at segments of exceeding ranges.
+    segment_index_array = np.arange(point_count - 1)
+    achieved_error = 0.0
+    while len(segment_index_array):
+        kept_index_array = np.flatnonzero(is_kept_array)
+        range_index_array = (
+            np.searchsorted(kept_index_array, segment_index_array, "right") - 1
+        )
+        range_start_array = kept_index_array[range_index_array]
+        range_end_array = kept_index_array[range_index_array + 1]
+        range_start_time_array = absolute_time_array[range_start_array]
+        range_start_value_array = value_array[range_start_array]
+        # Ranges which are longer than one segment never have zero
+        # duration, because all jumps are kept.
+        is_long_range_array = range_end_array - range_start_array > 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope_array = np.where(
+                is_long_range_array,
+                (value_array[range_end_array] - range_start_value_array)
+                / (absolute_time_array[range_end_array] - range_start_time_array),
+                0,
+            )
+
+        def get_error_array(time_array, value_to_compare_array):
+            return np.abs(
+                value_to_compare_array
+                - range_start_value_array
+                - slope_array * (time_array - range_start_time_array)
+            )
+
+        # Error at the end point of each segment (if it's inside of a range)
+        point_error_array = np.where(
+            range_end_array != segment_index_array + 1,
+            get_error_array(
+                absolute_time_array[segment_index_array + 1],
+                value_array[segment_index_array + 1],
+            ),
+            0,
+        )
+
+        # Error inside of each curved segment (if it's inside of a range)
+        segment_curve_shape_array = curve_shape_array[segment_index_array]
+        segment_duration_subarray = segment_duration_array[segment_index_array]
+        value_difference_array = segment_value_difference_array[segment_index_array]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            percentage_array = (
+                np.log(
+                    slope_array
+                    * segment_duration_subarray
+                    * np.expm1(segment_curve_shape_array)
+                    / (value_difference_array * segment_curve_shape_array)
+                )
+                / segment_curve_shape_array
+            )
+        is_valid_array = (
+            is_long_range_array
+            & (segment_curve_shape_array != 0)
+            & (percentage_array > 0)
+            & (percentage_array < 1)
+        )
+        percentage_array = np.where(is_valid_array, percentage_array, 0)
+        curve_error_array = np.where(
+            is_valid_array,
+            get_error_array(
+                absolute_time_array[segment_index_array]
+                + percentage_array * segment_duration_subarray,
+                value_array[segment_index_array]
+                + value_difference_array
+                * _get_curve_array(percentage_array, segment_curve_shape_array),
+            ),
+            0,
+        )
+
+        segment_error_array = np.maximum(point_error_array, curve_error_array)
+        range_first_segment_array = np.flatnonzero(
+            np.diff(range_index_array, prepend=-1)
+        )
+        range_error_array = np.maximum.reduceat(
+            segment_error_array, range_first_segment_array
+        )
+        segment_range_error_array = np.repeat(
+            range_error_array,
+            np.diff(range_first_segment_array, append=len(segment_index_array)),
+        )
+        is_exceeding_array = segment_range_error_array > max_error
+        achieved_error = max(
+            achieved_error,
+            float(
+                range_error_array.max(
+                    initial=0, where=range_error_array <= max_error
+                )
+            ),
+        )
+
+        # Split each exceeding range at its segment with the largest error.
+        candidate_index_array = np.flatnonzero(
+            is_exceeding_array & (segment_error_array == segment_range_error_array)
+        )
+        candidate_range_index_array = range_index_array[candidate_index_array]
+        split_index_array = candidate_index_array[
+            np.diff(candidate_range_index_array, prepend=-1) != 0
+        ]
+        split_segment_index_array = segment_index_array[split_index_array]
+        is_kept_array[split_segment_index_array + 1] = True
+        # If the error is inside of a curved segment, the complete
+        # segment is kept (with its original curve shape).
+        is_kept_array[
+            split_segment_index_array[
+                curve_error_array[split_index_array]
+                > point_error_array[split_index_array]
+            ]
+        ] = True
+        # Periodic data lets RDP split off only a small part of a long
+        # range in each round, so that the number of rounds would grow
+        # linearly. Long ranges which are split so unevenly are
+        # therefore split in their middle too: this costs a few
+        # additional points, but keeps the number of rounds logarithmic.
+        split_start_array = range_start_array[split_index_array]
+        split_length_array = range_end_array[split_index_array] - split_start_array
+        split_position_array = split_segment_index_array + 1 - split_start_array
+        is_uneven_array = (
+            split_length_array >= _SIMPLIFY_MIN_EVENLY_SPLIT_RANGE_LENGTH
+        ) & (
+            np.abs(2 * split_position_array - split_length_array)
+            > split_length_array // 2
+        )
+        is_kept_array[
+            (split_start_array + split_length_array // 2)[is_uneven_array]
+        ] = True
+        segment_index_array = segment_index_array[is_exceeding_array]
+
+    kept_index_array = np.flatnonzero(is_kept_array)
+    is_original_segment_array = np.append(np.diff(kept_index_array) == 1, True)
+    return (
+        absolute_time_array[kept_index_array],
+        value_array[kept_index_array],
+        np.where(is_original_segment_array, curve_shape_array[kept_index_array], 0),
+    ), achieved_error
+
+
+def _get_left_value_array(
+    point_array_tuple: PointArrayTuple, time_array: np.ndarray
+) -> np.ndarray:
+    """Get value of envelope just before each time.
+
+    This only differs from :func:`_value_at_array` for times where
+    the envelope jumps (where multiple points share the same time).
+    """
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    point_count = len(absolute_time_array)
+    if point_count == 1:
+        return np.full(time_array.shape, value_array[0], dtype=float)
+    point_index_array = np.searchsorted(absolute_time_array, time_array, "left") - 1
+    index_array = np.clip(point_index_array, 0, point_count - 2)
+    segment_start_array = absolute_time_array[index_array]
+    value0_array = value_array[index_array]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage_array = np.clip(
+            (time_array - segment_start_array)
+            / (absolute_time_array[index_array + 1] - segment_start_array),
+            0,
+            1,
+        )
+        inner_value_array = value0_array + (
+            value_array[index_array + 1] - value0_array
+        ) * _get_curve_array(percentage_array, curve_shape_array[index_array])
+    return np.where(
+        point_index_array < 0,
+        value_array[0],
+        np.where(
+            point_index_array >= point_count - 1, value_array[-1], inner_value_array
+        ),
+    )
+
+
+def _get_interval_curve_shape_array(
+    point_array_tuple: PointArrayTuple,
+    start_time_array: np.ndarray,
+    end_time_array: np.ndarray,
+) -> np.ndarray:
+    """Get curve shape of an envelope within intervals without any points.
+
+    A part of an exponential segment is again an exponential segment,
+    its curve shape is scaled by the relative duration of the part.
+    """
+
+    absolute_time_array, _, curve_shape_array = point_array_tuple
+    point_count = len(absolute_time_array)
+    if point_count == 1:
+        return np.zeros(start_time_array.shape)
+    point_index_array = (
+        np.searchsorted(absolute_time_array, start_time_array, "right") - 1
+    )
+    index_array = np.clip(point_index_array, 0, point_count - 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        curve_shape_part_array = (
+            curve_shape_array[index_array]
+            * (end_time_array - start_time_array)
+            / (absolute_time_array[index_array + 1] - absolute_time_array[index_array])
+        )
+    return np.where(
+        (point_index_array >= 0) & (point_index_array < point_count - 1),
+        curve_shape_part_array,
+        0,
+    )
+
+
+def _sample_adaptively(
+    function: typing.Callable[[np.ndarray], np.ndarray],
+    start_time_array: np.ndarray,
+    end_time_array: np.ndarray,
+    start_value_array: np.ndarray,
+    end_value_array: np.ndarray,
+    max_error: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sample function until linear interpolation is close enough to it.
+
+    Each interval is halved as long as the function value in its middle
+    or at its quarters differs by more than ``max_error`` from the linear
+    interpolation between its borders. Returns the times and values of all points
+    inside the intervals which are needed for the linear interpolation.
+    """
+
+    time_array_list, value_array_list = [], []
+    for _ in range(_ENVELOPE_OPERATION_MAX_SAMPLE_DEPTH):
+        if not len(start_time_array):
+            break
+        duration_array = end_time_array - start_time_array
+        value_difference_array = end_value_array - start_value_array
+        # The largest error isn't necessarily in the middle of an
+        # interval (for instance for strongly curved segments), so
+        # the quarters are tested too.
+        is_split_array = np.zeros(len(start_time_array), dtype=bool)
+        for percentage in (0.25, 0.75, 0.5):
+            test_time_array = start_time_array + percentage * duration_array
+            test_value_array = function(test_time_array)
+            is_split_array |= (
+                np.abs(
+                    test_value_array
+                    - start_value_array
+                    - percentage * value_difference_array
+                )
+                > max_error
+            )
+        middle_time_array, middle_value_array = test_time_array, test_value_array
+        # Avoid endless splitting at the resolution of floats
+        is_split_array &= (middle_time_array > start_time_array) & (
+            middle_time_array < end_time_array
+        )
+        middle_time_array, middle_value_array = (
+            middle_time_array[is_split_array],
+            middle_value_array[is_split_array],
+        )
+        time_array_list.append(middle_time_array)
+        value_array_list.append(middle_value_array)
+        start_time_array, end_time_array, start_value_array, end_value_array = (
+            np.concatenate(array_pair)
+            for array_pair in (
+                (start_time_array[is_split_array], middle_time_array),
+                (middle_time_array, end_time_array[is_split_array]),
+                (start_value_array[is_split_array], middle_value_array),
+                (middle_value_array, end_value_array[is_split_array]),
+            )
+        )
+    if not time_array_list:
+        return np.zeros(0), np.zeros(0)
+    return np.concatenate(time_array_list), np.concatenate(value_array_list)
+
+
+def _combine_point_array_tuple_sequence(
+    point_array_tuple_sequence: typing.Sequence[PointArrayTuple],
+    operation: typing.Callable[..., np.ndarray],
+    max_error: float,
+) -> PointArrayTuple:
+    """Apply an operation on the values of one or two envelopes.
+
+    The breakpoints of all envelopes are merged, so that each interval
+    between two merged breakpoints only contains one segment of each
+    envelope. For these intervals the result is exact if possible:
+
+    - ``np.add``: if one segment is constant or if both segments
+      have the same curve shape.
+    - ``np.multiply``: if one segment is constant.
+    - ``np.minimum`` and ``np.maximum``: if one segment is constant or
+      if both segments have the same curve shape (the difference of
+      both segments is monotone then, so that they cross at most once,
+      and the crossing is added as a new point).
+    - any other operation: if all segments are constant.
+
+    Otherwise the result is sampled adaptively with linear segments.
+    """
+
+    time_array = functools.reduce(
+        np.union1d,
+        (point_array_tuple[0] for point_array_tuple in point_array_tuple_sequence),
+    )
+    left_value_array_tuple, right_value_array_tuple = (
+        tuple(
+            get_value_array(point_array_tuple, time_array)
+            for point_array_tuple in point_array_tuple_sequence
+        )
+        for get_value_array in (_get_left_value_array, _value_at_array)
+    )
+    left_result_array, right_result_array = (
+        operation(*value_array_tuple)
+        for value_array_tuple in (left_value_array_tuple, right_value_array_tuple)
+    )
+
+    start_time_array, end_time_array = time_array[:-1], time_array[1:]
+    start_value_array_tuple = tuple(
+        value_array[:-1] for value_array in right_value_array_tuple
+    )
+    end_value_array_tuple = tuple(
+        value_array[1:] for value_array in left_value_array_tuple
+    )
+    curve_shape_array_tuple = tuple(
+        _get_interval_curve_shape_array(
+            point_array_tuple, start_time_array, end_time_array
+        )
+        for point_array_tuple in point_array_tuple_sequence
+    )
+    is_constant_array_tuple = tuple(
+        start_value_array == end_value_array
+        for start_value_array, end_value_array in zip(
+            start_value_array_tuple, end_value_array_tuple
+        )
+    )
+
+    crossing_time_array = crossing_value_array = np.zeros(0)
+    crossing_curve_shape_array = np.zeros(0)
+    if len(point_array_tuple_sequence) == 1 or operation not in (
+        np.add,
+        np.multiply,
+        np.minimum,
+        np.maximum,
+    ):
+        is_exact_array = np.logical_and.reduce(is_constant_array_tuple)
+        curve_shape_array = np.zeros(len(start_time_array))
+    else:
+        is_constant_array0, is_constant_array1 = is_constant_array_tuple
+        curve_shape_array0, curve_shape_array1 = curve_shape_array_tuple
+        is_exact_array = is_constant_array0 | is_constant_array1
+        if operation is not np.multiply:
+            is_exact_array |= curve_shape_array0 == curve_shape_array1
+        curve_shape_array = np.where(
+            is_constant_array0, curve_shape_array1, curve_shape_array0
+        )
+        if operation in (np.minimum, np.maximum):
+            (
+                crossing_time_array,
+                crossing_value_array,
+                crossing_curve_shape_array,
+                curve_shape_array,
+            ) = _get_minimum_or_maximum_crossing_array_tuple(
+                operation is np.minimum,
+                is_exact_array,
+                curve_shape_array,
+                start_time_array,
+                end_time_array,
+                start_value_array_tuple,
+                end_value_array_tuple,
+                curve_shape_array_tuple,
+            )
+
+    is_sampled_array = ~is_exact_array
+    sample_time_array, sample_value_array = _sample_adaptively(
+        lambda time_array: operation(
+            *(
+                _value_at_array(point_array_tuple, time_array)
+                for point_array_tuple in point_array_tuple_sequence
+            )
+        ),
+        start_time_array[is_sampled_array],
+        end_time_array[is_sampled_array],
+        right_result_array[:-1][is_sampled_array],
+        left_result_array[1:][is_sampled_array],
+        max_error,
+    )
+    curve_shape_array = np.append(np.where(is_exact_array, curve_shape_array, 0), 0)
+
+    # Points where the result jumps get an additional point with the
+    # value just before the jump.
+    is_jump_array = left_result_array != right_result_array
+    result_time_array, result_value_array, result_curve_shape_array, rank_array = (
+        np.concatenate(array_tuple)
+        for array_tuple in zip(
+            (
+                time_array[is_jump_array],
+                left_result_array[is_jump_array],
+                np.zeros(is_jump_array.sum()),
+                np.zeros(is_jump_array.sum()),
+            ),
+            (
+                time_array,
+                right_result_array,
+                curve_shape_array,
+                np.ones(len(time_array)),
+            ),
+            (
+                crossing_time_array,
+                crossing_value_array,
+                crossing_curve_shape_array,
+                np.full(len(crossing_time_array), 2),
+            ),
+            (
+                sample_time_array,
+                sample_value_array,
+                np.zeros(len(sample_time_array)),
+                np.full(len(sample_time_array), 2),
+            ),
+        )
+    )
+    sorted_index_array = np.lexsort((rank_array, result_time_array))
+    return (
+        result_time_array[sorted_index_array],
+        result_value_array[sorted_index_array],
+        result_curve_shape_array[sorted_index_array],
+    )
+
+
+def _get_minimum_or_maximum_crossing_array_tuple(
+    is_minimum: bool,
+    is_exact_array: np.ndarray,
+    curve_shape_array: np.ndarray,
+    start_time_array: np.ndarray,
+    end_time_array: np.ndarray,
+    start_value_array_tuple: tuple[np.ndarray, np.ndarray],
+    end_value_array_tuple: tuple[np.ndarray, np.ndarray],
+    curve_shape_array_tuple: tuple[np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, ...]:
+    """Find where two segments cross and which segment is selected.
+
+    Returns the time, the value and the curve shape of all crossing
+    points and the curve shape at the start of each interval.
+    """
+
+    start_value_array0, start_value_array1 = start_value_array_tuple
+    end_value_array0, end_value_array1 = end_value_array_tuple
+    curve_shape_array0, curve_shape_array1 = curve_shape_array_tuple
+    start_difference_array = start_value_array0 - start_value_array1
+    end_difference_array = end_value_array0 - end_value_array1
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # The difference of both segments has the same curve shape
+        # as the segments, so it's easy to find where it's 0.
+        relative_difference_array = start_difference_array / (
+            start_difference_array - end_difference_array
+        )
+        percentage_array = np.where(
+            curve_shape_array == 0,
+            relative_difference_array,
+            np.log1p(relative_difference_array * np.expm1(curve_shape_array))
+            / curve_shape_array,
+        )
+        crossing_time_array = start_time_array + percentage_array * (
+            end_time_array - start_time_array
+        )
+    is_crossing_array = (
+        is_exact_array
+        & (start_difference_array * end_difference_array < 0)
+        & (crossing_time_array > start_time_array)
+        & (crossing_time_array < end_time_array)
+    )
+    percentage_array = np.where(is_crossing_array, percentage_array, 0)
+
+    # Select first segment if its values are smaller (for minimum) or
+    # bigger (for maximum) than the values of the second segment.
+    sign = 1 if is_minimum else -1
+    is_first_selected_array = (
+        sign
+        * np.where(
+            is_crossing_array,
+            start_difference_array,
+            start_difference_array + end_difference_array,
+        )
+        <= 0
+    )
+    selected_curve_shape_array = np.where(
+        is_first_selected_array, curve_shape_array0, curve_shape_array1
+    )
+    other_curve_shape_array = np.where(
+        is_first_selected_array, curve_shape_array1, curve_shape_array0
+    )
+    crossing_value_array = start_value_array0 + (
+        end_value_array0 - start_value_array0
+    ) * _get_curve_array(percentage_array, curve_shape_array0)
+    return (
+        crossing_time_array[is_crossing_array],
+        crossing_value_array[is_crossing_array],
+        (other_curve_shape_array * (1 - percentage_array))[is_crossing_array],
+        np.where(
+            is_crossing_array,
+            selected_curve_shape_array * percentage_array,
+            selected_curve_shape_array,
+        ),
+    )
+
+
+def _get_step_array_tuple(
+    point_array_tuple: PointArrayTuple,
+    resolution: float,
+    min_interval: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get times and values where the quantized envelope changes.
+
+    Values are quantized to multiples of ``resolution``. The times when
+    a segment crosses the border between two quantized values are
+    found by inverting the curve of the segment, so they are exact.
+    Changes which are closer than ``min_interval`` to the previous
+    change are delayed until ``min_interval`` has passed (and skipped
+    if the value didn't change in the meantime).
+    """
+
+    absolute_time_array, value_array, curve_shape_array = point_array_tuple
+    level_array = np.floor(value_array / resolution + 0.5)
+
+    start_level_array, end_level_array = level_array[:-1], level_array[1:]
+    crossing_count_array = np.abs(end_level_array - start_level_array).astype(int)
+    segment_index_array = np.repeat(
+        np.arange(len(crossing_count_array)), crossing_count_array
+    )
+    # Index of each crossing within its segment
+    crossing_index_array = np.arange(len(segment_index_array)) - np.repeat(
+        np.cumsum(crossing_count_array) - crossing_count_array, crossing_count_array
+    )
+    direction_array = np.sign(end_level_array - start_level_array)[
+        segment_index_array
+    ]
+    start_level_array = start_level_array[segment_index_array]
+    crossing_level_array = start_level_array + direction_array * (
+        crossing_index_array + 1
+    )
+    threshold_array = (
+        start_level_array + direction_array * (crossing_index_array + 0.5)
+    ) * resolution
+
+    start_value_array = value_array[segment_index_array]
+    curve_shape_array = curve_shape_array[segment_index_array]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_threshold_array = (threshold_array - start_value_array) / (
+            value_array[segment_index_array + 1] - start_value_array
+        )
+        percentage_array = np.where(
+            curve_shape_array == 0,
+            relative_threshold_array,
+            np.log1p(relative_threshold_array * np.expm1(curve_shape_array))
+            / curve_shape_array,
+        )
+    segment_start_array = absolute_time_array[segment_index_array]
+    time_array = np.concatenate(
+        (
+            absolute_time_array[:1],
+            segment_start_array
+            + np.clip(percentage_array, 0, 1)
+            * (absolute_time_array[segment_index_array + 1] - segment_start_array),
+        )
+    )
+    level_array = np.concatenate((level_array[:1], crossing_level_array))
+
+    # Only the last of many crossings at the same time (jumps) is
+    # relevant.
+    is_last_array = np.append(time_array[1:] != time_array[:-1], True)
+    time_array, level_array = time_array[is_last_array], level_array[is_last_array]
+
+    if min_interval > 0 and len(time_array) > 1:
+        time_list, level_list = [time_array[0]], [level_array[0]]
+        time_tuple = tuple(time_array.tolist())
+        level_tuple = tuple(level_array.tolist())
+        index, last_index = 1, len(time_tuple)
+        while index < last_index:
+            allowed_time = time_list[-1] + min_interval
+            if (time := time_tuple[index]) < allowed_time:
+                # Use value at the earliest allowed time
+                index = bisect.bisect_right(time_tuple, allowed_time, lo=index)
+                time = allowed_time
+            else:
+                index += 1
+            if (level := level_tuple[index - 1]) != level_list[-1]:
+                time_list.append(time)
+                level_list.append(level)
+        time_array, level_array = np.array(time_list), np.array(level_list)
+    else:
+        is_change_array = np.append(True, level_array[1:] != level_array[:-1])
+        time_array = time_array[is_change_array]
+        level_array = level_array[is_change_array]
+
+    return time_array, level_array * resolution
+
+
+# The default arguments of envelopes are module level functions (and not
+# lambda functions), so that envelopes (and therefore all events with
+# a tempo envelope) can be pickled, e.g. to send them to other processes.
+
+
+def _event_to_parameter(event: core_events.abc.Event) -> core_constants.ParameterType:
+    return (
+        getattr(event, core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME)
+        if hasattr(event, core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME)
+        else 0
+    )
+
+
+def _event_to_curve_shape(event: core_events.abc.Event) -> float:
+    curve_shape_attribute_name = (
+        core_events.configurations.DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME
+    )
+    return (
+        getattr(event, curve_shape_attribute_name)
+        if hasattr(event, curve_shape_attribute_name)
+        else 0
+    )
+
+
+def _return_unchanged(value: typing.Any) -> typing.Any:
+    return value
+
+
+def _apply_parameter_on_event(
+    event: core_events.abc.Event, parameter: core_constants.ParameterType
+):
+    setattr(
+        event, core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME, parameter
+    )
+
+
+def _apply_curve_shape_on_event(event: core_events.abc.Event, curve_shape: float):
+    setattr(
+        event,
+        core_events.configurations.DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME,
+        curve_shape,
+    )
+
+
+def _initialise_default_event_class(
+    simple_event_class: type[core_events.abc.Event],
+    duration: core_constants.DurationType,
+) -> core_events.abc.Event:
+    return simple_event_class(duration)
+
+
+def _cache(method: typing.Callable) -> typing.Callable:
+    """Cache return value of envelope method until the envelope changes.
+
+    Envelopes which exclusively own their events (because they have
+    been initialised with points or arrays and haven't handed out any
+    event yet) only clear the cache when they are changed. Envelopes
+    which share their events check before each access if the duration,
+    parameter or curve shape of any event has changed (see
+    :meth:`Envelope._validate_cache`).
+    """
+
+    method_name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        # Events which are shared with other objects could be changed
+        # in place at any time, so the cache could be outdated.
+        if self._are_events_shared:
+            self._validate_cache()
+        cache_dict = self._cache_dict
+        try:
+            return cache_dict[method_name]
+        except KeyError:
+            cache_dict[method_name] = return_value = method(self)
+            return return_value
+
+    return wrapper
+
+
 class Envelope(
     core_events.SequentialEvent,
     typing.Generic[T],
@@ -90,6 +1125,12 @@ class Envelope(
     ]
     Point = typing.Union[CompletePoint, IncompletePoint]
 
+    # Points of envelopes which have been initialised with 'from_arrays'
+    # and which haven't been converted to events yet.
+    _point_array_tuple_to_materialize: typing.Optional[PointArrayTuple] = None
+    # Attributes which aren't copied or pickled (each copy has its own cache).
+    _cache_attribute_name_tuple = ("_cache_dict", "_are_events_shared")
+
     def __init__(
         self,
         event_iterable_or_point_sequence: typing.Union[
@@ -98,46 +1139,31 @@ class Envelope(
         tempo_envelope: typing.Optional[core_events.TempoEnvelope] = None,
         event_to_parameter: typing.Callable[
             [core_events.abc.Event], core_constants.ParameterType
-        ] = lambda event: getattr(
-            event, core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME
-        )
-        if hasattr(event, core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME)
-        else 0,
+        ] = _event_to_parameter,
         event_to_curve_shape: typing.Callable[
             [core_events.abc.Event], CurveShape
-        ] = lambda event: getattr(
-            event, core_events.configurations.DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME
-        )
-        if hasattr(event, core_events.configurations.DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME)
-        else 0,
+        ] = _event_to_curve_shape,
         parameter_to_value: typing.Callable[
             [Value], core_constants.ParameterType
-        ] = lambda parameter: parameter,
+        ] = _return_unchanged,
         value_to_parameter: typing.Callable[
             [Value], core_constants.ParameterType
-        ] = lambda value: value,
+        ] = _return_unchanged,
         apply_parameter_on_event: typing.Callable[
             [core_events.abc.Event, core_constants.ParameterType], None
-        ] = lambda event, parameter: setattr(
-            event,
-            core_events.configurations.DEFAULT_PARAMETER_ATTRIBUTE_NAME,
-            parameter,
-        ),
+        ] = _apply_parameter_on_event,
         apply_curve_shape_on_event: typing.Callable[
             [core_events.abc.Event, CurveShape], None
-        ] = lambda event, curve_shape: setattr(
-            event,
-            core_events.configurations.DEFAULT_CURVE_SHAPE_ATTRIBUTE_NAME,
-            curve_shape,
-        ),
+        ] = _apply_curve_shape_on_event,
         default_event_class: type[core_events.abc.Event] = core_events.SimpleEvent,
         initialise_default_event_class: typing.Callable[
             [type[core_events.abc.Event], core_constants.DurationType],
             core_events.abc.Event,
-        ] = lambda simple_event_class, duration: simple_event_class(
-            duration
-        ),  # type: ignore
+        ] = _initialise_default_event_class,
     ):
+        self._cache_dict: dict[str, typing.Any] = {}
+        # Set to 'True' if the envelope is initialised with events
+        self._are_events_shared = False
         self.event_to_parameter = event_to_parameter
         self.event_to_curve_shape = event_to_curve_shape
         self.value_to_parameter = value_to_parameter
@@ -164,6 +1190,68 @@ class Envelope(
     ) -> Envelope:
         return cls(point, **kwargs)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        absolute_time_sequence: typing.Sequence[core_constants.Real],
+        value_sequence: typing.Sequence[Value],
+        curve_shape_sequence: typing.Optional[typing.Sequence[CurveShape]] = None,
+        **kwargs,
+    ) -> Envelope:
+        """Initialise envelope from arrays without creating any events.
+
+        :param absolute_time_sequence: The absolute time of each point.
+            The times have to be sorted in ascending order.
+        :type absolute_time_sequence: typing.Sequence[core_constants.Real]
+        :param value_sequence: The value of each point. Please note that
+            these are values and not parameters: when events are created
+            the values are converted to parameters with the envelopes
+            :attr:`value_to_parameter` function.
+        :type value_sequence: typing.Sequence[Value]
+        :param curve_shape_sequence: The curve shape of each point.
+            If ``None`` all curve shapes are 0. Default to ``None``.
+        :type curve_shape_sequence: typing.Optional[typing.Sequence[CurveShape]]
+        :param kwargs: Further keyword arguments which are passed to
+            the envelopes init method.
+
+        Like the points which are passed to the init method, the
+        absolute times are shifted so that the first point is at 0
+        (the first event of an envelope always starts at 0).
+
+        The points are only stored as float arrays. The events of the
+        envelope are created as soon as the envelope is used like a
+        list (for instance when iterating over it, when accessing one
+        of its events or when asking for its :attr:`duration`).
+        Vectorized methods as :meth:`get_average_value_array` don't
+        need any events and therefore don't create them. This makes
+        it cheap to initialise large envelopes (for instance from
+        audio analysis data).
+
+        **Example:**
+
+        >>> import numpy as np
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope.from_arrays(
+        >>>     np.linspace(0, 1, 100001), np.linspace(0, 1, 100001) ** 2
+        >>> )
+        >>> envelope.get_average_value_array([0, 0.5], [1, 1])
+        array([0.33333333, 0.58333333])
+        >>> core_events.Envelope.from_arrays([3, 4], [0, 1]).absolute_time_tuple
+        (DirectDuration(0), DirectDuration(1))
+        """
+
+        point_array_tuple = _sequences_to_point_array_tuple(
+            absolute_time_sequence, value_sequence, curve_shape_sequence
+        )
+        envelope = cls([], **kwargs)
+        if len(absolute_time_array := point_array_tuple[0]):
+            if first_absolute_time := absolute_time_array[0]:
+                point_array_tuple = (
+                    absolute_time_array - first_absolute_time,
+                ) + point_array_tuple[1:]
+            envelope._point_array_tuple_to_materialize = point_array_tuple
+        return envelope
+
     # ###################################################################### #
     #                           magic methods                                #
     # ###################################################################### #
@@ -195,19 +1283,161 @@ class Envelope(
             event_or_sequence = self._event_iterable_or_point_sequence_to_event_iterable(  # type: ignore
                 event_or_sequence  # type: ignore
             )
+        self._access_events(
+            shares_events=not isinstance(index_or_slice, slice)
+        )
         super().__setitem__(index_or_slice, event_or_sequence)  # type: ignore
 
-    # ###################################################################### #
-    #                    private static methods                              #
-    # ###################################################################### #
+    # XXX: All list methods which read or change the events of an envelope
+    # go through '_access_events', so that the events of envelopes which
+    # have been initialised with 'from_arrays' exist before they are used
+    # and so that cached properties are cleared as soon as the events could
+    # be changed. Methods which directly read the items of their argument
+    # (e.g. '__add__' or '__eq__') also need the events of the argument.
+    # Methods which hand out events of the envelope (or which add events
+    # of the caller to the envelope) share these events: they could be
+    # changed in place at any time afterwards, so the envelope can't cache
+    # its properties anymore.
 
-    @staticmethod
-    def _point_sequence_to_corrected_point_list(
-        point_or_invalid_type_sequence: typing.Sequence[typing.Union[Point, typing.Any]]
-    ) -> list[typing.Union[Envelope.CompletePoint, None]]:
-        corrected_point_list: list[typing.Union[Envelope.CompletePoint, None]] = []
-        for point in point_or_invalid_type_sequence:
-            point_count = len(point)
+    def __iter__(self) -> typing.Iterator[T]:
+        self._access_events(shares_events=True)
+        return super().__iter__()
+
+    def __reversed__(self) -> typing.Iterator[T]:
+        self._access_events(shares_events=True)
+        return super().__reversed__()
+
+    def __len__(self) -> int:
+        self._access_events(may_change_events=False)
+        return super().__len__()
+
+    def __contains__(self, event: typing.Any) -> bool:
+        self._access_events(may_change_events=False)
+        return super().__contains__(event)
+
+    def __getitem__(self, index_or_slice):
+        self._access_events(shares_events=True)
+        return super().__getitem__(index_or_slice)
+
+    def __delitem__(self, index_or_slice: typing.Union[int, slice]):
+        self._access_events()
+        super().__delitem__(index_or_slice)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        self._access_events(other, may_change_events=False)
+        return super().__eq__(other)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        self._access_events(other, may_change_events=False)
+        return super().__lt__(other)
+
+    def __le__(self, other: typing.Any) -> bool:
+        self._access_events(other, may_change_events=False)
+        return super().__le__(other)
+
+    def __gt__(self, other: typing.Any) -> bool:
+        self._access_events(other, may_change_events=False)
+        return super().__gt__(other)
+
+    def __ge__(self, other: typing.Any) -> bool:
+        self._access_events(other, may_change_events=False)
+        return super().__ge__(other)
+
+    def __add__(self, event: list[T]) -> Envelope[T]:
+        self._access_events(event, shares_events=True)
+        return super().__add__(event)  # type: ignore
+
+    def __iadd__(self, event_iterable: typing.Iterable[T]) -> Envelope[T]:
+        self._access_events(event_iterable, shares_events=True)
+        return super().__iadd__(event_iterable)
+
+    def __mul__(self, factor: int) -> Envelope[T]:
+        self._access_events(shares_events=True)
+        return super().__mul__(factor)  # type: ignore
+
+    def __rmul__(self, factor: int) -> Envelope[T]:
+        self._access_events(shares_events=True)
+        return super().__rmul__(factor)  # type: ignore
+
+    def __imul__(self, factor: int) -> Envelope[T]:
+        self._access_events()
+        return super().__imul__(factor)
+
+    def __repr__(self) -> str:
+        self._access_events(may_change_events=False)
+        return super().__repr__()
+
+    def __copy__(self) -> Envelope[T]:
+        # The copy contains the same events as the original envelope.
+        self._access_events(shares_events=True)
+        copied_envelope = type(self).__new__(type(self))
+        copied_envelope.__setstate__(self._get_state())
+        copied_envelope._are_events_shared = True
+        return copied_envelope
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex):
+        self._access_events(may_change_events=False)
+        return copyreg.__newobj__, (type(self),), self._get_state()
+
+    def __setstate__(self, state: tuple[dict[str, typing.Any], list[T]]):
+        attribute_dict, event_list = state
+        self.__dict__.update(attribute_dict)
+        # Each copy has its own cache
+        self._cache_dict = {}
+        self._are_events_shared = False
+        list.extend(self, event_list)
+
+    def append(self, event: T):
+        self._access_events(shares_events=True)
+        super().append(event)
+
+    def extend(self, event_iterable: typing.Iterable[T]):
+        self._access_events(event_iterable, shares_events=True)
+        super().extend(event_iterable)
+
+    def insert(self, index: typing.SupportsIndex, event: T):
+        self._access_events(shares_events=True)
+        super().insert(index, event)
+
+    def pop(self, index: typing.SupportsIndex = -1) -> T:
+        self._access_events(shares_events=True)
+        return super().pop(index)
+
+    def remove(self, event: T):
+        self._access_events()
+        super().remove(event)
+
+    def clear(self):
+        self._access_events()
+        super().clear()
+
+    def reverse(self):
+        self._access_events()
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        self._access_events(shares_events=True)
+        super().sort(*args, **kwargs)
+
+    def index(self, event: T, *args) -> int:
+        self._access_events(may_change_events=False)
+        return super().index(event, *args)
+
+    def count(self, event: T) -> int:
+        self._access_events(may_change_events=False)
+        return super().count(event)
+
+    # ###################################################################### #
+    #                    private static methods                              #
+    # ###################################################################### #
+
+    @staticmethod
+    def _point_sequence_to_corrected_point_list(
+        point_or_invalid_type_sequence: typing.Sequence[typing.Union[Point, typing.Any]]
+    ) -> list[typing.Union[Envelope.CompletePoint, None]]:
+        corrected_point_list: list[typing.Union[Envelope.CompletePoint, None]] = []
+        for point in point_or_invalid_type_sequence:
+            point_count = len(point)
             if point_count == 2:
                 point += (0,)  # type: ignore
             elif point_count != 3:
@@ -249,19 +1479,86 @@ class Envelope(
             event_list.append(event)
         return event_list
 
+    def _materialize(self):
+        """Create events from points which have been set by :meth:`from_arrays`."""
+
+        if (point_array_tuple := self._point_array_tuple_to_materialize) is None:
+            return
+        self._point_array_tuple_to_materialize = None
+        absolute_time_array, value_array, curve_shape_array = point_array_tuple
+        # The duration of the last event is always 0
+        duration_array = np.diff(absolute_time_array, append=absolute_time_array[-1])
+        initialise_default_event_class = self.initialise_default_event_class
+        default_event_class = self.default_event_class
+        apply_parameter_on_event = self.apply_parameter_on_event
+        apply_curve_shape_on_event = self.apply_curve_shape_on_event
+        value_to_parameter = self.value_to_parameter
+        event_list = []
+        for duration, value, curve_shape in zip(
+            duration_array.tolist(), value_array.tolist(), curve_shape_array.tolist()
+        ):
+            event = initialise_default_event_class(default_event_class, duration)
+            apply_parameter_on_event(event, value_to_parameter(value))
+            apply_curve_shape_on_event(event, curve_shape)
+            event_list.append(event)
+        # XXX: Use list method to avoid endless recursion.
+        list.extend(self, event_list)
+
+    def _access_events(
+        self,
+        *other: typing.Any,
+        may_change_events: bool = True,
+        shares_events: bool = False,
+    ):
+        """Prepare envelope (and envelope arguments) for list access.
+
+        This is the only place where envelopes which have been
+        initialised with :meth:`from_arrays` create their events
+        before they are used like a list.
+        """
+
+        self._materialize()
+        if shares_events:
+            self._are_events_shared = True
+        if may_change_events or shares_events:
+            self._invalidate_cache()
+        for other_object in other:
+            if isinstance(other_object, Envelope):
+                other_object._access_events(
+                    may_change_events=False, shares_events=shares_events
+                )
+
+    def _get_state(self) -> tuple[dict[str, typing.Any], list[T]]:
+        return (
+            {
+                attribute_name: value
+                for attribute_name, value in self.__dict__.items()
+                if attribute_name not in self._cache_attribute_name_tuple
+            },
+            list(list.__iter__(self)),
+        )
+
     def _event_iterable_or_point_sequence_to_event_iterable(
         self,
         event_iterable_or_point_sequence: typing.Union[
             typing.Iterable[T], typing.Sequence[Point]
         ],
     ) -> typing.Iterable[core_events.abc.Event]:
-        item_type_list = [
-            isinstance(event_or_point, core_events.abc.Event)
+        # Generators can only be iterated once
+        if not isinstance(event_iterable_or_point_sequence, typing.Sequence):
+            event_iterable_or_point_sequence = tuple(event_iterable_or_point_sequence)
+        if not event_iterable_or_point_sequence:
+            return []
+        # XXX: We don't need to collect the type of all items: it's
+        # sufficient to know the type of the first item and to find
+        # any item which differs from it.
+        is_event_sequence = isinstance(
+            event_iterable_or_point_sequence[0], core_events.abc.Event
+        )
+        if any(
+            isinstance(event_or_point, core_events.abc.Event) is not is_event_sequence
             for event_or_point in event_iterable_or_point_sequence
-        ]
-        if all(item_type_list):
-            event_iterable = event_iterable_or_point_sequence
-        elif any(item_type_list):
+        ):
             raise TypeError(
                 "Found inconsistent iterable with mixed types. "
                 "Please only use events or only use points for "
@@ -269,6 +1566,10 @@ class Envelope(
                 "characters of the problematic iterable: \n"
                 f"{str(event_iterable_or_point_sequence)[:200]}"
             )
+        if is_event_sequence:
+            # The caller could change these events at any time.
+            self._are_events_shared = True
+            event_iterable = event_iterable_or_point_sequence
         else:
             event_iterable = self._point_sequence_to_event_list(
                 event_iterable_or_point_sequence  # type: ignore
@@ -278,23 +1579,218 @@ class Envelope(
     def _event_to_value(self, event: core_events.abc.Event) -> Value:
         return self.parameter_to_value(self.event_to_parameter(event))
 
+    def _invalidate_cache(self):
+        self._cache_dict.clear()
+
+    def _get_event_fingerprint(self) -> tuple[tuple[typing.Any, ...], ...]:
+        """Get duration, parameter and curve shape of each event.
+
+        All cached values only depend on this data.
+        """
+
+        event_to_parameter = self.event_to_parameter
+        event_to_curve_shape = self.event_to_curve_shape
+        return tuple(
+            (
+                event.duration.duration,
+                event_to_parameter(event),
+                event_to_curve_shape(event),
+            )
+            for event in list.__iter__(self)
+        )
+
+    def _validate_cache(self):
+        """Clear cache if events have been changed since the cache was filled.
+
+        Parameters which are changed in place (instead of being replaced
+        by another object) can't be noticed.
+        """
+
+        event_fingerprint = self._get_event_fingerprint()
+        cache_dict = self._cache_dict
+        if cache_dict.get("_event_fingerprint") != event_fingerprint:
+            self._invalidate_cache()
+            cache_dict["_event_fingerprint"] = event_fingerprint
+
+    def _get_point_array_tuple(self) -> PointArrayTuple:
+        """Get absolute times, values and curve shapes as float arrays.
+
+        This is the compiled representation of the envelope which
+        is used by all vectorized methods.
+        """
+
+        if (point_array_tuple := self._point_array_tuple_to_materialize) is not None:
+            return point_array_tuple
+        if not self:
+            raise ValueError("Can't compile an empty envelope to arrays.")
+        return self._point_array_tuple
+
+    def _point_array_tuple_to_envelope(
+        self, point_array_tuple: PointArrayTuple
+    ) -> Envelope:
+        """Create new envelope with the same side attributes from arrays."""
+
+        return type(self).from_arrays(
+            *point_array_tuple,
+            **{
+                attribute_name: getattr(self, attribute_name)
+                for attribute_name in self._class_specific_side_attribute_tuple
+            },
+        )
+
+    def _combine(
+        self,
+        other_sequence: typing.Sequence[
+            typing.Union[Envelope, PointEnvelope, core_constants.Real]
+        ],
+        operation: typing.Callable[..., np.ndarray],
+        max_error: typing.Optional[core_constants.Real],
+    ) -> Envelope:
+        if max_error is None:
+            max_error = core_events.configurations.DEFAULT_ENVELOPE_OPERATION_MAX_ERROR
+        # Sampling with a tolerance of 0 would split each curved segment
+        # until the resolution of floats is reached.
+        if max_error <= 0:
+            raise ValueError(f"'max_error' has to be positive, but is '{max_error}'.")
+        point_array_tuple = self._get_point_array_tuple()
+        point_array_tuple_list = [point_array_tuple]
+        for other in other_sequence:
+            try:
+                point_array_tuple_list.append(other._get_point_array_tuple())
+            # Numbers are static envelopes
+            except AttributeError:
+                point_array_tuple_list.append(
+                    (point_array_tuple[0][:1], np.array([float(other)]), np.zeros(1))
+                )
+        return self._point_array_tuple_to_envelope(
+            _combine_point_array_tuple_sequence(
+                point_array_tuple_list, operation, float(max_error)
+            )
+        )
+
+    @property
+    @_cache
+    def _point_array_tuple(self) -> PointArrayTuple:
+        point_array_tuple = tuple(
+            np.array(tuple_, dtype=float)
+            for tuple_ in (
+                self._absolute_time_in_floats_tuple,
+                self.value_tuple,
+                self.curve_shape_tuple,
+            )
+        )
+        # Cached arrays must not be changed
+        for array in point_array_tuple:
+            array.flags.writeable = False
+        return point_array_tuple  # type: ignore
+
+    @property
+    @_cache
+    def _absolute_time_in_floats_tuple(self) -> tuple[float, ...]:
+        return tuple(
+            absolute_time.duration_in_floats
+            for absolute_time in self.absolute_time_tuple
+        )
+
+    @property
+    @_cache
+    def _integral_table_tuple(self) -> tuple[tuple[float, ...], ...]:
+        """Absolute times, values, curve shapes and integrals up to each point.
+
+        The tuples are created from the same arrays as the arrays
+        which are used by :func:`_integrate_from_start_array`.
+        """
+
+        point_array_tuple = self._get_point_array_tuple()
+        cumulative_integral_array = np.concatenate(
+            ((0,), np.cumsum(_get_segment_integral_array(point_array_tuple)))
+        )
+        return tuple(
+            tuple(array.tolist())
+            for array in point_array_tuple + (cumulative_integral_array,)
+        )
+
+    def _integrate_from_start(self, absolute_time: float) -> float:
+        """Scalar version of :func:`_integrate_from_start_array`.
+
+        Both use :func:`numpy.expm1` (its results can differ from
+        :func:`math.expm1` in the last digit), so that they return
+        exactly the same results.
+        """
+
+        (
+            absolute_time_tuple,
+            value_tuple,
+            curve_shape_tuple,
+            cumulative_integral_tuple,
+        ) = self._integral_table_tuple
+        first_time, last_time = absolute_time_tuple[0], absolute_time_tuple[-1]
+        if absolute_time <= first_time:
+            return (absolute_time - first_time) * value_tuple[0]
+        if absolute_time >= last_time:
+            return (
+                cumulative_integral_tuple[-1]
+                + (absolute_time - last_time) * value_tuple[-1]
+            )
+        index = bisect.bisect_right(absolute_time_tuple, absolute_time) - 1
+        segment_start = absolute_time_tuple[index]
+        segment_duration = absolute_time_tuple[index + 1] - segment_start
+        percentage = (absolute_time - segment_start) / segment_duration
+        if curve_shape := curve_shape_tuple[index]:
+            curve_integral = float(
+                (np.expm1(curve_shape * percentage) / curve_shape - percentage)
+                / np.expm1(curve_shape)
+            )
+        else:
+            curve_integral = (percentage * percentage) / 2
+        value0 = value_tuple[index]
+        return cumulative_integral_tuple[index] + segment_duration * (
+            value0 * percentage + (value_tuple[index + 1] - value0) * curve_integral
+        )
+
     # ###################################################################### #
     #                         public properties                              #
     # ###################################################################### #
 
+    # XXX: The following properties are cached. They read the events
+    # with the list methods, so that they don't clear the cache.
+
+    @core_events.SequentialEvent.duration.getter
+    def duration(self) -> core_parameters.abc.Duration:
+        if not (absolute_time_tuple := self.absolute_time_tuple):
+            return core_parameters.DirectDuration(0)
+        return absolute_time_tuple[-1] + list.__getitem__(self, -1).duration
+
+    @property
+    @_cache
+    def absolute_time_tuple(self) -> tuple[core_parameters.abc.Duration, ...]:
+        self._materialize()
+        duration_iterator = (event.duration for event in list.__iter__(self))
+        return tuple(
+            core_utilities.accumulate_from_n(
+                duration_iterator, core_parameters.DirectDuration(0)
+            )
+        )[:-1]
+
     @property
+    @_cache
     def parameter_tuple(self) -> tuple[core_constants.ParameterType, ...]:
-        return tuple(map(self.event_to_parameter, self))
+        self._materialize()
+        return tuple(map(self.event_to_parameter, list.__iter__(self)))
 
     @property
+    @_cache
     def value_tuple(self) -> tuple[Value, ...]:
         return tuple(map(self.parameter_to_value, self.parameter_tuple))
 
     @property
+    @_cache
     def curve_shape_tuple(self) -> tuple[CurveShape, ...]:
-        return tuple(map(self.event_to_curve_shape, self))
+        self._materialize()
+        return tuple(map(self.event_to_curve_shape, list.__iter__(self)))
 
     @property
+    @_cache
     def is_static(self) -> bool:
         """Return `True` if :class:`Envelope` only has one static value."""
 
@@ -309,43 +1805,23 @@ class Envelope(
     ) -> Value:
         absolute_time = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
             absolute_time
-        )
-        absolute_time_tuple = self.absolute_time_tuple
-
-        use_only_first_event = absolute_time <= absolute_time_tuple[0]
-        use_only_last_event = absolute_time >= (
-            # If the duration of the last event == 0 there is the danger
-            # of floating point errors (the value in absolute_time_tuple could
-            # be slightly higher than the duration of the Envelope. If this
-            # happens the function will raise an AssertionError, because
-            # "_get_index_at_from_absolute_time_tuple" will return
-            # "None"). With explicitly testing if the last duration
-            # equals 0 we can avoid this danger.
-            absolute_time_tuple[-1]
-            if self[-1].duration > 0
-            else self.duration
-        )
-        if use_only_first_event or use_only_last_event:
-            index = 0 if use_only_first_event else -1
-            return self._event_to_value(self[index])
-
-        event_0_index = self._get_index_at_from_absolute_time_tuple(
-            absolute_time, absolute_time_tuple, self.duration
-        )
-        assert event_0_index is not None
+        ).duration_in_floats
+        absolute_time_tuple = self._absolute_time_in_floats_tuple
+        value_tuple = self.value_tuple
 
-        value0, value1 = (
-            self._event_to_value(self[event_0_index + n]) for n in range(2)
-        )
-        curve_shape = self.event_to_curve_shape(self[event_0_index])
+        if absolute_time <= absolute_time_tuple[0]:
+            return value_tuple[0]
+        if absolute_time >= absolute_time_tuple[-1]:
+            return value_tuple[-1]
 
+        event_0_index = bisect.bisect_right(absolute_time_tuple, absolute_time) - 1
         return core_utilities.scale(
-            absolute_time.duration_in_floats,
-            absolute_time_tuple[event_0_index].duration_in_floats,
-            absolute_time_tuple[event_0_index + 1].duration_in_floats,
-            value0,
-            value1,
-            curve_shape,
+            absolute_time,
+            absolute_time_tuple[event_0_index],
+            absolute_time_tuple[event_0_index + 1],
+            value_tuple[event_0_index],
+            value_tuple[event_0_index + 1],
+            self.curve_shape_tuple[event_0_index],
         )
 
     def parameter_at(
@@ -354,9 +1830,34 @@ class Envelope(
         return self.value_to_parameter(self.value_at(absolute_time))
 
     def integrate_interval(
-        self, start: core_constants.DurationType, end: core_constants.DurationType
+        self,
+        start: typing.Union[core_parameters.abc.Duration, typing.Any],
+        end: typing.Union[core_parameters.abc.Duration, typing.Any],
     ) -> float:
-        return integrate.quad(lambda x: self.value_at(x), start, end)[0]
+        """Integrate envelope from start to end.
+
+        :param start: Where to start integration.
+        :type start: typing.Union[core_parameters.abc.Duration, typing.Any]
+        :param end: Where to end integration.
+        :type end: typing.Union[core_parameters.abc.Duration, typing.Any]
+
+        The integral is calculated with the closed-form integral of the
+        envelope segments and a cumulative table of the integrals of all
+        previous segments. Therefore each call only costs two binary
+        searches (and the table is only created once, until the
+        envelope changes). Intervals without duration are always 0
+        (even for empty envelopes).
+        """
+
+        start, end = (
+            core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                unknown_object
+            ).duration_in_floats
+            for unknown_object in (start, end)
+        )
+        if start == end:
+            return 0.0
+        return self._integrate_from_start(end) - self._integrate_from_start(start)
 
     def get_average_value(
         self,
@@ -383,6 +1884,394 @@ class Envelope(
             return self.value_at(start)
         return self.integrate_interval(start, end) / duration.duration
 
+    def cursor(self) -> EnvelopeCursor:
+        """Create cursor for fast queries at increasing absolute times.
+
+        See :class:`EnvelopeCursor` for more information.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        >>> cursor = envelope.cursor()
+        >>> [cursor.value_at(absolute_time) for absolute_time in (0, 0.5, 1.5)]
+        [0.0, 0.5, 0.5]
+        """
+
+        return EnvelopeCursor(self)
+
+    def simplify(self, max_error: core_constants.Real = 0) -> tuple[Envelope, float]:
+        """Remove points which are not needed to keep the envelopes shape.
+
+        :param max_error: The largest allowed difference in value between
+            the original and the simplified envelope. For the default 0
+            only points which are exactly on a line between their
+            neighbours are removed (for instance points between
+            collinear linear segments). Default to 0.
+        :type max_error: core_constants.Real
+        :return: A tuple with the new simplified envelope and the largest
+            difference in value between the original and the simplified
+            envelope (which is never bigger than ``max_error``).
+
+        This is the Ramer–Douglas–Peucker algorithm, generalised to
+        curve shapes: removed points are replaced by linear segments,
+        while segments which are kept stay with their curve shape.
+        The original envelope isn't changed.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope(
+        >>>     [[0, 0], [1, 1], [2, 2], [3, 2.1], [4, 2]]
+        >>> )
+        >>> simplified_envelope, error = envelope.simplify()
+        >>> simplified_envelope.value_tuple, error
+        ((0.0, 2.0, 2.1, 2.0), 0.0)
+        >>> simplified_envelope, error = envelope.simplify(0.2)
+        >>> simplified_envelope.value_tuple, round(error, 2)
+        ((0.0, 2.0, 2.0), 0.1)
+        """
+
+        if max_error < 0:
+            raise ValueError(f"'max_error' can't be negative, but is '{max_error}'.")
+        point_array_tuple, error = _simplify_point_array_tuple(
+            self._get_point_array_tuple(), float(max_error)
+        )
+        return self._point_array_tuple_to_envelope(point_array_tuple), error
+
+    def to_step_events(
+        self,
+        resolution: core_constants.Real,
+        min_interval: typing.Union[core_parameters.abc.Duration, typing.Any] = 0,
+    ) -> core_events.SequentialEvent[core_events.abc.Event]:
+        """Convert envelope to a sequence of events with static values.
+
+        :param resolution: The values of the envelope are rounded to
+            multiples of ``resolution``. A new event starts as soon
+            as the rounded value changes. For instance use ``1 / 127``
+            for MIDI control changes of an envelope with values between
+            0 and 1.
+        :type resolution: core_constants.Real
+        :param min_interval: The minimal duration of each event (except
+            of the last one). If the rounded value changes earlier, the
+            change is delayed until ``min_interval`` has passed (and
+            ignored if the rounded value is the same again). Default to 0.
+        :type min_interval: typing.Union[core_parameters.abc.Duration, typing.Any]
+
+        The times when the rounded value changes are found by
+        inverting the curve of each segment and not by sampling the
+        envelope, so even long envelopes are converted quickly. The
+        events are created with the envelopes :attr:`default_event_class`
+        and they get their parameter from the rounded value (with
+        :attr:`value_to_parameter`). The last event lasts until the end
+        of the envelope.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [4, 1]])
+        >>> envelope.to_step_events(0.5)
+        SequentialEvent([SimpleEvent(duration = DirectDuration(duration = 1), value = 0.0), SimpleEvent(duration = DirectDuration(duration = 2), value = 0.5), SimpleEvent(duration = DirectDuration(duration = 1), value = 1.0)])
+        """
+
+        if resolution <= 0:
+            raise ValueError(f"'resolution' has to be positive, but is '{resolution}'.")
+        min_interval = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            min_interval
+        ).duration_in_floats
+        point_array_tuple = self._get_point_array_tuple()
+        time_array, value_array = _get_step_array_tuple(
+            point_array_tuple, float(resolution), min_interval
+        )
+        duration_array = np.diff(time_array, append=point_array_tuple[0][-1])
+        step_event_list = []
+        for duration, value in zip(duration_array.tolist(), value_array.tolist()):
+            step_event = self.initialise_default_event_class(
+                self.default_event_class, duration
+            )
+            self.apply_parameter_on_event(step_event, self.value_to_parameter(value))
+            step_event_list.append(step_event)
+        return core_events.SequentialEvent(step_event_list)
+
+    def add(
+        self,
+        other: typing.Union[Envelope, PointEnvelope, core_constants.Real],
+        max_error: typing.Optional[core_constants.Real] = None,
+    ) -> Envelope:
+        """Create new envelope with the sum of both envelopes.
+
+        :param other: The envelope (or static number) which is added.
+        :type other: typing.Union[Envelope, PointEnvelope, core_constants.Real]
+        :param max_error: The tolerance for segments which can't be
+            added exactly: they are sampled until the returned linear
+            segments differ by no more than ``max_error`` from the exact
+            sum (the difference is tested at the middle and the quarters
+            of each linear segment). It has to be bigger than 0, otherwise
+            a :class:`ValueError` is raised. If ``None`` the value of
+            :const:`mutwo.core_events.configurations.DEFAULT_ENVELOPE_OPERATION_MAX_ERROR`
+            is used. Default to ``None``.
+        :type max_error: typing.Optional[core_constants.Real]
+
+        The points of both envelopes are merged in one sweep. Between
+        two merged points the sum is exact if one of the envelopes is
+        static or if both envelopes have the same curve shape (for
+        instance if both are linear). Values (and not parameters) are
+        added, the returned envelope has the class and the side
+        attributes of the envelope on which the method is called.
+        Neither envelope is changed.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> dynamics = core_events.Envelope([[0, 0.5], [4, 1]])
+        >>> accents = core_events.Envelope([[0, 0], [1, 0.2], [2, 0]])
+        >>> dynamics.add(accents).value_tuple
+        (0.5, 0.825, 0.75, 1.0)
+        """
+
+        return self._combine((other,), np.add, max_error)
+
+    def multiply(
+        self,
+        other: typing.Union[Envelope, PointEnvelope, core_constants.Real],
+        max_error: typing.Optional[core_constants.Real] = None,
+    ) -> Envelope:
+        """Create new envelope with the product of both envelopes.
+
+        :param other: The envelope (or static number) which is multiplied.
+        :type other: typing.Union[Envelope, PointEnvelope, core_constants.Real]
+        :param max_error: The tolerance for segments which can't be
+            calculated exactly. See :meth:`add` for more information.
+            Default to ``None``.
+        :type max_error: typing.Optional[core_constants.Real]
+
+        The product is exact where one of the envelopes is static,
+        otherwise it's sampled.
+        """
+
+        return self._combine((other,), np.multiply, max_error)
+
+    def minimum(
+        self,
+        other: typing.Union[Envelope, PointEnvelope, core_constants.Real],
+        max_error: typing.Optional[core_constants.Real] = None,
+    ) -> Envelope:
+        """Create new envelope with the smaller value of both envelopes.
+
+        :param other: The envelope (or static number) to compare with.
+        :type other: typing.Union[Envelope, PointEnvelope, core_constants.Real]
+        :param max_error: The tolerance for segments which can't be
+            calculated exactly. See :meth:`add` for more information.
+            Default to ``None``.
+        :type max_error: typing.Optional[core_constants.Real]
+
+        The minimum is exact where one of the envelopes is static or
+        where both envelopes have the same curve shape. Points where
+        both envelopes cross are added.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [2, 2]])
+        >>> minimum_envelope = envelope.minimum(1)
+        >>> minimum_envelope.absolute_time_tuple, minimum_envelope.value_tuple
+        ((DirectDuration(0), DirectDuration(1), DirectDuration(2)), (0.0, 1.0, 1.0))
+        """
+
+        return self._combine((other,), np.minimum, max_error)
+
+    def maximum(
+        self,
+        other: typing.Union[Envelope, PointEnvelope, core_constants.Real],
+        max_error: typing.Optional[core_constants.Real] = None,
+    ) -> Envelope:
+        """Create new envelope with the bigger value of both envelopes.
+
+        :param other: The envelope (or static number) to compare with.
+        :type other: typing.Union[Envelope, PointEnvelope, core_constants.Real]
+        :param max_error: The tolerance for segments which can't be
+            calculated exactly. See :meth:`add` for more information.
+            Default to ``None``.
+        :type max_error: typing.Optional[core_constants.Real]
+
+        See :meth:`minimum` for more information.
+        """
+
+        return self._combine((other,), np.maximum, max_error)
+
+    def map(
+        self,
+        function: typing.Callable[[Value], Value],
+        max_error: typing.Optional[core_constants.Real] = None,
+    ) -> Envelope:
+        """Create new envelope by applying a function on the envelopes values.
+
+        :param function: A function which receives a value and returns a
+            new value.
+        :type function: typing.Callable[[Value], Value]
+        :param max_error: The tolerance for segments which can't be
+            calculated exactly. See :meth:`add` for more information.
+            Default to ``None``.
+        :type max_error: typing.Optional[core_constants.Real]
+
+        Static segments are exact, all other segments are sampled.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [1, 1]])
+        >>> envelope.map(lambda value: value ** 2, max_error=0.1).value_tuple
+        (0.0, 0.25, 1.0)
+        """
+
+        return self._combine((), np.vectorize(function, otypes=[float]), max_error)
+
+    def integrate_interval_array(
+        self,
+        start_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+        end_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+    ) -> np.ndarray:
+        """Integrate envelope for many intervals at once.
+
+        :param start_sequence: Where to start the integration of each interval.
+        :type start_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :param end_sequence: Where to end the integration of each interval.
+        :type end_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :return: Array with the integral of each interval.
+
+        This is the vectorized version of :meth:`integrate_interval`.
+        For each pair of (float) start and end it returns exactly the
+        same float as :meth:`integrate_interval`. Intervals without
+        duration are always 0 (even for empty envelopes).
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        >>> envelope.integrate_interval_array([0, 0, 1], [1, 2, 3])
+        array([0.5, 1. , 0.5])
+        """
+
+        start_array, end_array = np.broadcast_arrays(
+            *(
+                np.asarray(sequence, dtype=float)
+                for sequence in (start_sequence, end_sequence)
+            )
+        )
+        if (start_array == end_array).all():
+            return np.zeros(start_array.shape)
+        point_array_tuple = self._get_point_array_tuple()
+        cumulative_integral_array = np.array(self._integral_table_tuple[-1])
+        return _integrate_from_start_array(
+            point_array_tuple, end_array, cumulative_integral_array
+        ) - _integrate_from_start_array(
+            point_array_tuple, start_array, cumulative_integral_array
+        )
+
+    def get_time_at_integral_array(
+        self,
+        integral_sequence: typing.Sequence[core_constants.Real],
+        start: typing.Union[core_parameters.abc.Duration, typing.Any] = 0,
+    ) -> np.ndarray:
+        """Find for many integrals where the integration has to end.
+
+        :param integral_sequence: The integrals (from ``start``) for
+            which the end time shall be found.
+        :type integral_sequence: typing.Sequence[core_constants.Real]
+        :param start: Where the integration starts. Default to 0.
+        :type start: typing.Union[core_parameters.abc.Duration, typing.Any]
+        :return: Array with the absolute time for each integral.
+
+        This is the inverse of :meth:`integrate_interval_array`: for
+        each integral ``i`` it returns the time ``t`` for which
+        ``integrate_interval(start, t) == i`` (except for floating
+        point errors). It's only defined for envelopes with positive
+        values, otherwise a :class:`ValueError` is raised.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 1], [2, 3]])
+        >>> envelope.get_time_at_integral_array([0, 1.5, 4, 7])
+        array([0. , 1. , 2. , 3. ])
+        """
+
+        point_array_tuple = self._get_point_array_tuple()
+        if (point_array_tuple[1] <= 0).any():
+            raise ValueError(
+                "Can't find time at integral for envelope with values which "
+                "aren't positive."
+            )
+        cumulative_integral_array = np.array(self._integral_table_tuple[-1])
+        start_integral = self._integrate_from_start(float(start))
+        return _integral_to_time_array(
+            point_array_tuple,
+            np.asarray(integral_sequence, dtype=float) + start_integral,
+            cumulative_integral_array,
+        )
+
+    def get_average_value_array(
+        self,
+        start_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+        end_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+    ) -> np.ndarray:
+        """Get average value for many time windows at once.
+
+        :param start_sequence: The start of each window.
+        :type start_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :param end_sequence: The end of each window.
+        :type end_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :return: Array with the average value of each window.
+
+        This is the vectorized version of :meth:`get_average_value`.
+        Instead of numerically integrating each window, all windows are
+        integrated with the closed-form integral of the envelope
+        segments. For windows where start equals end the value at
+        start is returned (and one
+        :class:`mutwo.core_utilities.InvalidAverageValueStartAndEndWarning`
+        is emitted for the whole call).
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        >>> envelope.get_average_value_array([0, 0, 0.5], [1, 2, 0.5])
+        array([0.5, 0.5, 0.5])
+        """
+
+        start_array, end_array = np.broadcast_arrays(
+            *(
+                np.asarray(sequence, dtype=float)
+                for sequence in (start_sequence, end_sequence)
+            )
+        )
+        point_array_tuple = self._get_point_array_tuple()
+        duration_array = end_array - start_array
+        is_zero_duration_array = duration_array == 0
+        if is_zero_duration_array.any():
+            warnings.warn(core_utilities.InvalidAverageValueStartAndEndWarning())
+        integral_array = np.diff(
+            _integrate_from_start_array(
+                point_array_tuple, np.stack((start_array, end_array))
+            ),
+            axis=0,
+        )[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            average_value_array = integral_array / duration_array
+        return np.where(
+            is_zero_duration_array,
+            _value_at_array(point_array_tuple, start_array),
+            average_value_array,
+        )
+
     def get_average_parameter(
         self,
         start: typing.Optional[core_constants.DurationType] = None,
@@ -391,7 +2280,14 @@ class Envelope(
         return self.value_to_parameter(self.get_average_value(start, end))
 
 
-class RelativeEnvelope(Envelope, typing.Generic[T]):
+class RelativeEnvelope(
+    Envelope,
+    typing.Generic[T],
+    class_specific_side_attribute_tuple=(
+        "base_parameter_and_relative_parameter_to_absolute_parameter",
+        "resolve_cache_size",
+    ),
+):
     __parent_doc_string = Envelope.__doc__.split("\n")[2:]  # type: ignore
     __after_parameter_text_index = __parent_doc_string.index("")
     __doc__ = "\n".join(
@@ -402,6 +2298,11 @@ class RelativeEnvelope(Envelope, typing.Generic[T]):
             "        which runs when the :func:`resolve` is called. It expects the base parameter",
             "        and the relative parameter (which is extracted from the envelope events)",
             "        and should return an absolute parameter.",
+            "    :param resolve_cache_size: If bigger than 0 the envelope stores up to",
+            "        `resolve_cache_size` envelopes which have been returned by :func:`resolve`",
+            "        and returns them again (without resolving them again) if :func:`resolve`",
+            "        is called with the same arguments. See :attr:`resolve_cache` for more",
+            "        information. Default to 0 (no cache).",
         ]
         + __parent_doc_string[__after_parameter_text_index:]
         + [
@@ -410,6 +2311,10 @@ class RelativeEnvelope(Envelope, typing.Generic[T]):
         ]
     )
 
+    _cache_attribute_name_tuple = Envelope._cache_attribute_name_tuple + (
+        "_resolve_cache",
+    )
+
     def __init__(
         self,
         *args,
@@ -417,39 +2322,268 @@ class RelativeEnvelope(Envelope, typing.Generic[T]):
             [core_constants.ParameterType, core_constants.ParameterType],
             core_constants.ParameterType,
         ],
+        resolve_cache_size: int = 0,
         **kwargs,
     ):
         self.base_parameter_and_relative_parameter_to_absolute_parameter = (
             base_parameter_and_relative_parameter_to_absolute_parameter
         )
+        self.resolve_cache_size = resolve_cache_size
         super().__init__(*args, **kwargs)
 
-    def resolve(
+    # ###################################################################### #
+    #                         private methods                                #
+    # ###################################################################### #
+
+    def __setstate__(self, state: tuple[dict[str, typing.Any], list[T]]):
+        super().__setstate__(state)
+        # Each copy has its own cache
+        self.resolve_cache_size = self.resolve_cache_size
+
+    def _invalidate_cache(self):
+        super()._invalidate_cache()
+        if (resolve_cache := getattr(self, "_resolve_cache", None)) is not None:
+            resolve_cache.clear()
+
+    def _resolve(
         self,
-        duration: typing.Union[core_parameters.abc.Duration, typing.Any],
+        duration: core_parameters.abc.Duration,
         base_parameter: core_constants.ParameterType,
-        resolve_envelope_class: type[Envelope] = Envelope,
+        resolve_envelope_class: type[Envelope],
     ) -> Envelope:
-        duration = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(duration)
-        point_list = []
         try:
             duration_factor = duration / self.duration
         except ZeroDivisionError:
             duration_factor = core_parameters.DirectDuration(0)
-        for absolute_time, event in zip(self.absolute_time_tuple, self):
-            relative_parameter = self.event_to_parameter(event)
-            new_parameter = (
-                self.base_parameter_and_relative_parameter_to_absolute_parameter(
-                    base_parameter, relative_parameter
+        return resolve_envelope_class(
+            [
+                (
+                    absolute_time * duration_factor,
+                    self.base_parameter_and_relative_parameter_to_absolute_parameter(
+                        base_parameter, relative_parameter
+                    ),
+                    curve_shape,
+                )
+                for absolute_time, relative_parameter, curve_shape in zip(
+                    self.absolute_time_tuple,
+                    self.parameter_tuple,
+                    self.curve_shape_tuple,
                 )
+            ]
+        )
+
+    # ###################################################################### #
+    #                         public properties                              #
+    # ###################################################################### #
+
+    @property
+    def resolve_cache_size(self) -> int:
+        """How many resolved envelopes are cached (0 if there is no cache)."""
+
+        return self._resolve_cache_size
+
+    @resolve_cache_size.setter
+    def resolve_cache_size(self, resolve_cache_size: int):
+        self._resolve_cache_size = resolve_cache_size
+        self._resolve_cache: typing.Optional[
+            core_utilities.LRUCache[tuple, Envelope]
+        ] = (
+            core_utilities.LRUCache(resolve_cache_size) if resolve_cache_size else None
+        )
+
+    @property
+    def resolve_cache(
+        self,
+    ) -> typing.Optional[core_utilities.LRUCache[tuple, Envelope]]:
+        """Cache of envelopes which have been returned by :meth:`resolve`.
+
+        ``None`` if :attr:`resolve_cache_size` is 0. The cache is
+        keyed by the duration, the base parameter, the resolve envelope
+        class and the resolve function and it's cleared as soon as the
+        relative envelope changes. Its :attr:`mutwo.core_utilities.LRUCache.hit_count`
+        and :attr:`mutwo.core_utilities.LRUCache.miss_count` help to find
+        a good :attr:`resolve_cache_size`.
+        """
+
+        return self._resolve_cache
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def resolve(
+        self,
+        duration: typing.Union[core_parameters.abc.Duration, typing.Any],
+        base_parameter: core_constants.ParameterType,
+        resolve_envelope_class: type[Envelope] = Envelope,
+    ) -> Envelope:
+        """Create absolute envelope from relative envelope.
+
+        :param duration: The duration of the absolute envelope.
+        :type duration: typing.Union[core_parameters.abc.Duration, typing.Any]
+        :param base_parameter: The parameter which is passed together
+            with each parameter of the relative envelope to
+            :attr:`base_parameter_and_relative_parameter_to_absolute_parameter`.
+        :type base_parameter: core_constants.ParameterType
+        :param resolve_envelope_class: The class of the absolute envelope.
+            Default to :class:`Envelope`.
+        :type resolve_envelope_class: type[Envelope]
+
+        If the envelope has a :attr:`resolve_cache` and the base
+        parameter is hashable, the absolute envelope is cached. In this
+        case calls with the same arguments return the same envelope, so
+        the returned envelope shouldn't be changed. The cache is cleared
+        when the envelope or one of its events is changed (like the
+        other caches of envelopes).
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> relative_envelope = core_events.RelativeEnvelope(
+        >>>     [[0, 0], [1, 1]],
+        >>>     base_parameter_and_relative_parameter_to_absolute_parameter=lambda base, relative: base + relative,
+        >>>     resolve_cache_size=16,
+        >>> )
+        >>> relative_envelope.resolve(4, 10).value_tuple
+        (10, 11)
+        >>> relative_envelope.resolve(4, 10) is relative_envelope.resolve(4, 10)
+        True
+        """
+
+        duration = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(duration)
+        if (resolve_cache := self._resolve_cache) is None:
+            return self._resolve(duration, base_parameter, resolve_envelope_class)
+        # Shared events could be changed at any time (see :func:`_cache`)
+        if self._are_events_shared:
+            self._validate_cache()
+        key = (
+            duration.duration,
+            base_parameter,
+            resolve_envelope_class,
+            self.base_parameter_and_relative_parameter_to_absolute_parameter,
+        )
+        try:
+            resolved_envelope = resolve_cache.get(key)
+        # Unhashable base parameters can't be cached
+        except TypeError:
+            return self._resolve(duration, base_parameter, resolve_envelope_class)
+        if resolved_envelope is None:
+            resolved_envelope = resolve_cache[key] = self._resolve(
+                duration, base_parameter, resolve_envelope_class
             )
-            point = (
-                absolute_time * duration_factor,
-                new_parameter,
-                self.event_to_curve_shape(event),
+        return resolved_envelope
+
+    def resolve_many(
+        self,
+        duration_sequence: typing.Sequence[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ],
+        base_parameter_sequence: typing.Sequence[core_constants.ParameterType],
+        resolve_envelope_class: type[Envelope] = Envelope,
+    ) -> tuple[Envelope, ...]:
+        """Create many absolute envelopes from relative envelope.
+
+        :param duration_sequence: The duration of each absolute envelope.
+        :type duration_sequence: typing.Sequence[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        :param base_parameter_sequence: The base parameter of each
+            absolute envelope.
+        :type base_parameter_sequence: typing.Sequence[core_constants.ParameterType]
+        :param resolve_envelope_class: The class of the absolute envelopes.
+            Default to :class:`Envelope`.
+        :type resolve_envelope_class: type[Envelope]
+        :return: One absolute envelope for each pair of duration and base
+            parameter. The envelopes are equal to the envelopes
+            which are returned by :meth:`resolve`.
+
+        In contrast to calling :meth:`resolve` for each pair, the
+        relative envelope is only read once, the event durations are
+        only calculated once for each distinct duration and the
+        absolute parameters are only calculated once for each distinct
+        (hashable) base parameter. Therefore absolute envelopes with equal
+        base parameters share the same parameter objects.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> relative_envelope = core_events.RelativeEnvelope(
+        >>>     [[0, 0], [1, 1]],
+        >>>     base_parameter_and_relative_parameter_to_absolute_parameter=lambda base, relative: base + relative,
+        >>> )
+        >>> [
+        >>>     envelope.value_tuple
+        >>>     for envelope in relative_envelope.resolve_many([1, 2, 1], [10, 10, 20])
+        >>> ]
+        [(10, 11), (10, 11), (20, 21)]
+        """
+
+        if len(duration_sequence) != len(base_parameter_sequence):
+            raise ValueError(
+                "Found sequences with unequal sizes: durations "
+                f"({len(duration_sequence)}) and base parameters "
+                f"({len(base_parameter_sequence)})."
             )
-            point_list.append(point)
-        return resolve_envelope_class(point_list)
+
+        relative_duration = self.duration.duration
+        # The last event always has duration 0
+        relative_event_duration_tuple = tuple(
+            event.duration.duration for event in list.__iter__(self)
+        )[:-1]
+        relative_parameter_tuple = self.parameter_tuple
+        curve_shape_tuple = self.curve_shape_tuple
+        resolve = self.base_parameter_and_relative_parameter_to_absolute_parameter
+        zero = fractions.Fraction(0)
+
+        template_envelope = resolve_envelope_class([])
+        initialise_default_event_class = (
+            template_envelope.initialise_default_event_class
+        )
+        default_event_class = template_envelope.default_event_class
+        apply_parameter_on_event = template_envelope.apply_parameter_on_event
+        apply_curve_shape_on_event = template_envelope.apply_curve_shape_on_event
+
+        duration_to_event_duration_tuple: dict[fractions.Fraction, tuple] = {}
+        base_parameter_to_parameter_tuple: dict[typing.Any, tuple] = {}
+        resolved_envelope_list = []
+        for duration, base_parameter in zip(duration_sequence, base_parameter_sequence):
+            duration = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                duration
+            ).duration
+            try:
+                event_duration_tuple = duration_to_event_duration_tuple[duration]
+            except KeyError:
+                duration_factor = (
+                    duration / relative_duration if relative_duration else zero
+                )
+                event_duration_tuple = duration_to_event_duration_tuple[
+                    duration
+                ] = tuple(
+                    event_duration * duration_factor
+                    for event_duration in relative_event_duration_tuple
+                ) + (zero,)
+
+            try:
+                parameter_tuple = base_parameter_to_parameter_tuple[base_parameter]
+            except (KeyError, TypeError) as error:
+                parameter_tuple = tuple(
+                    resolve(base_parameter, relative_parameter)
+                    for relative_parameter in relative_parameter_tuple
+                )
+                # Unhashable base parameters can't be stored
+                if isinstance(error, KeyError):
+                    base_parameter_to_parameter_tuple[base_parameter] = parameter_tuple
+
+            event_list = []
+            for event_duration, parameter, curve_shape in zip(
+                event_duration_tuple, parameter_tuple, curve_shape_tuple
+            ):
+                event = initialise_default_event_class(
+                    default_event_class, event_duration
+                )
+                apply_parameter_on_event(event, parameter)
+                apply_curve_shape_on_event(event, curve_shape)
+                event_list.append(event)
+            resolved_envelope_list.append(resolve_envelope_class(event_list))
+        return tuple(resolved_envelope_list)
 
 
 class TempoEnvelope(Envelope):
@@ -458,13 +2592,491 @@ class TempoEnvelope(Envelope):
         # from list, because this would create endless recursion
         # (because every event has a TempoEnvelope, so Python would forever
         #  compare the TempoEnvelopes of TempoEnvelopes).
+        if self is other:
+            return True
         try:
             return (
                 # XXX: Prefer lazy evaluation for better performance
-                # (use 'and' instead of 'all').
-                self.absolute_time_tuple == other.absolute_time_tuple
-                and self.curve_shape_tuple == other.curve_shape_tuple
+                # (use 'and' instead of 'all'). Durations are slower to
+                # compare than curve shapes and values, so they are
+                # compared at last.
+                self.curve_shape_tuple == other.curve_shape_tuple
                 and self.value_tuple == other.value_tuple
+                and self.absolute_time_tuple == other.absolute_time_tuple
             )
         except AttributeError:
             return False
+
+
+class PointEnvelope(object):
+    """Memory efficient envelope which stores its points in float arrays.
+
+    :param absolute_time_sequence: The absolute time of each point.
+        The times have to be sorted in ascending order.
+    :type absolute_time_sequence: typing.Sequence[core_constants.Real]
+    :param value_sequence: The value of each point.
+    :type value_sequence: typing.Sequence[Envelope.Value]
+    :param curve_shape_sequence: The curve shape of each point. If ``None``
+        all curve shapes are 0. Default to ``None``.
+    :type curve_shape_sequence: typing.Optional[typing.Sequence[Envelope.CurveShape]]
+    :param value_to_parameter: A callable object which converts a value to a parameter.
+    :type value_to_parameter: typing.Callable[[Envelope.Value], core_constants.ParameterType]
+    :param parameter_to_value: Convert a parameter to a value.
+    :type parameter_to_value: typing.Callable[[core_constants.ParameterType], Envelope.Value]
+
+    In contrast to :class:`Envelope` a :class:`PointEnvelope` isn't an
+    event and doesn't contain any events: each point only occupies three
+    floats (its absolute time, its value and its curve shape). It
+    implements the reading methods of :class:`Envelope` and allows
+    to insert and remove points. Absolute times are returned as floats
+    and not as :class:`mutwo.core_parameters.abc.Duration` objects.
+    Use :meth:`from_envelope` and :meth:`to_envelope` to convert
+    between both classes.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> point_envelope = core_events.PointEnvelope([0, 1, 3], [0, 1, 0.5])
+    >>> point_envelope.value_at(2)
+    0.75
+    >>> point_envelope.insert_point(2, 0)
+    >>> point_envelope.value_tuple
+    (0.0, 1.0, 0.0, 0.5)
+    """
+
+    def __init__(
+        self,
+        absolute_time_sequence: typing.Sequence[core_constants.Real],
+        value_sequence: typing.Sequence[Envelope.Value],
+        curve_shape_sequence: typing.Optional[
+            typing.Sequence[Envelope.CurveShape]
+        ] = None,
+        value_to_parameter: typing.Callable[
+            [Envelope.Value], core_constants.ParameterType
+        ] = _return_unchanged,
+        parameter_to_value: typing.Callable[
+            [core_constants.ParameterType], Envelope.Value
+        ] = _return_unchanged,
+    ):
+        (
+            self._absolute_time_array,
+            self._value_array,
+            self._curve_shape_array,
+        ) = _sequences_to_point_array_tuple(
+            absolute_time_sequence, value_sequence, curve_shape_sequence
+        )
+        self.value_to_parameter = value_to_parameter
+        self.parameter_to_value = parameter_to_value
+
+    # ###################################################################### #
+    #                      public class methods                              #
+    # ###################################################################### #
+
+    @classmethod
+    def from_envelope(cls, envelope: Envelope) -> PointEnvelope:
+        """Convert :class:`Envelope` to :class:`PointEnvelope`.
+
+        :param envelope: The envelope which shall be converted.
+        :type envelope: Envelope
+
+        The points are stored as floats, therefore the conversion
+        isn't lossless: absolute times and values which aren't floats
+        (for instance :class:`fractions.Fraction`) are rounded to the
+        nearest float and :meth:`to_envelope` returns them as floats.
+        """
+
+        if envelope._point_array_tuple_to_materialize is None and not envelope:
+            point_array_tuple: PointArrayTuple = (
+                np.zeros(0),
+                np.zeros(0),
+                np.zeros(0),
+            )
+        else:
+            point_array_tuple = envelope._get_point_array_tuple()
+        return cls(
+            *point_array_tuple,
+            value_to_parameter=envelope.value_to_parameter,
+            parameter_to_value=envelope.parameter_to_value,
+        )
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __len__(self) -> int:
+        return len(self._absolute_time_array)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not hasattr(other, "_get_point_array_tuple"):
+            return False
+        # Empty envelopes can't be compiled to arrays.
+        if not len(self) or not len(other):
+            return len(self) == len(other)
+        return all(
+            np.array_equal(array0, array1)
+            for array0, array1 in zip(
+                self._get_point_array_tuple(), other._get_point_array_tuple()
+            )
+        )
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                str(point)
+                for point in zip(
+                    self.absolute_time_tuple, self.value_tuple, self.curve_shape_tuple
+                )
+            ),
+        )
+
+    # ###################################################################### #
+    #                         private methods                                #
+    # ###################################################################### #
+
+    def _get_point_array_tuple(self) -> PointArrayTuple:
+        if not len(self):
+            raise ValueError("Can't use an empty envelope.")
+        return self._absolute_time_array, self._value_array, self._curve_shape_array
+
+    # ###################################################################### #
+    #                         public properties                              #
+    # ###################################################################### #
+
+    @property
+    def absolute_time_tuple(self) -> tuple[float, ...]:
+        return tuple(self._absolute_time_array.tolist())
+
+    @property
+    def value_tuple(self) -> tuple[Envelope.Value, ...]:
+        return tuple(self._value_array.tolist())
+
+    @property
+    def parameter_tuple(self) -> tuple[core_constants.ParameterType, ...]:
+        return tuple(map(self.value_to_parameter, self.value_tuple))
+
+    @property
+    def curve_shape_tuple(self) -> tuple[Envelope.CurveShape, ...]:
+        return tuple(self._curve_shape_array.tolist())
+
+    @property
+    def duration(self) -> float:
+        """The absolute time of the last point."""
+
+        return float(self._absolute_time_array[-1]) if len(self) else 0.0
+
+    @property
+    def is_static(self) -> bool:
+        """Return `True` if :class:`PointEnvelope` only has one static value."""
+
+        return len(self) == 0 or bool(np.all(self._value_array == self._value_array[0]))
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def to_envelope(
+        self, envelope_class: type[Envelope] = Envelope, **kwargs
+    ) -> Envelope:
+        """Convert :class:`PointEnvelope` to :class:`Envelope`.
+
+        :param envelope_class: The class of the returned envelope.
+            Default to :class:`Envelope`.
+        :type envelope_class: type[Envelope]
+        :param kwargs: Further keyword arguments which are passed to
+            the envelopes init method.
+
+        The first event of an :class:`Envelope` always starts at 0.
+        If the first point of the point envelope is later, a point with
+        the same value is added at 0 (the value before the first point
+        is always the value of the first point, so the envelope still
+        describes the same curve). Points before 0 can't be converted
+        and raise a :class:`ValueError`.
+        """
+
+        kwargs.setdefault("value_to_parameter", self.value_to_parameter)
+        kwargs.setdefault("parameter_to_value", self.parameter_to_value)
+        absolute_time_array, value_array, curve_shape_array = (
+            self._absolute_time_array,
+            self._value_array,
+            self._curve_shape_array,
+        )
+        if len(absolute_time_array) and absolute_time_array[0]:
+            if (first_absolute_time := absolute_time_array[0]) < 0:
+                raise ValueError(
+                    "Can't convert point envelope with points before 0 "
+                    f"(first absolute time is '{first_absolute_time}')."
+                )
+            absolute_time_array, value_array, curve_shape_array = (
+                np.concatenate(((0,), absolute_time_array)),
+                np.concatenate((value_array[:1], value_array)),
+                np.concatenate(((0,), curve_shape_array)),
+            )
+        return envelope_class.from_arrays(
+            absolute_time_array.copy(),
+            value_array.copy(),
+            curve_shape_array.copy(),
+            **kwargs,
+        )
+
+    def insert_point(
+        self,
+        absolute_time: core_constants.Real,
+        value: Envelope.Value,
+        curve_shape: Envelope.CurveShape = 0,
+    ) -> int:
+        """Insert new point into envelope.
+
+        :param absolute_time: The absolute time of the new point.
+        :param value: The value of the new point.
+        :param curve_shape: The curve shape of the new point. Default to 0.
+        :return: The index of the new point. If there are already points
+            at the same absolute time, the new point is inserted after them.
+        """
+
+        index = int(
+            np.searchsorted(self._absolute_time_array, float(absolute_time), "right")
+        )
+        self._absolute_time_array, self._value_array, self._curve_shape_array = (
+            np.insert(array, index, float(item))
+            for array, item in (
+                (self._absolute_time_array, absolute_time),
+                (self._value_array, value),
+                (self._curve_shape_array, curve_shape),
+            )
+        )
+        return index
+
+    def remove_point(self, index: int):
+        """Remove point from envelope.
+
+        :param index: The index of the point which shall be removed.
+        """
+
+        # Raise IndexError for invalid indices (as lists do)
+        self._absolute_time_array[index]
+        self._absolute_time_array, self._value_array, self._curve_shape_array = (
+            np.delete(array, index)
+            for array in (
+                self._absolute_time_array,
+                self._value_array,
+                self._curve_shape_array,
+            )
+        )
+
+    def simplify(
+        self, max_error: core_constants.Real = 0
+    ) -> tuple[PointEnvelope, float]:
+        """Remove points which are not needed to keep the envelopes shape.
+
+        See :meth:`Envelope.simplify` for more information.
+        """
+
+        if max_error < 0:
+            raise ValueError(f"'max_error' can't be negative, but is '{max_error}'.")
+        point_array_tuple, error = _simplify_point_array_tuple(
+            self._get_point_array_tuple(), float(max_error)
+        )
+        return (
+            type(self)(
+                *point_array_tuple,
+                value_to_parameter=self.value_to_parameter,
+                parameter_to_value=self.parameter_to_value,
+            ),
+            error,
+        )
+
+    def cursor(self) -> EnvelopeCursor:
+        """Create cursor for fast queries at increasing absolute times."""
+
+        return EnvelopeCursor(self)
+
+    def value_at(
+        self, absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+    ) -> Envelope.Value:
+        return float(
+            _value_at_array(
+                self._get_point_array_tuple(), np.array([float(absolute_time)])
+            )[0]
+        )
+
+    def parameter_at(
+        self, absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+    ) -> core_constants.ParameterType:
+        return self.value_to_parameter(self.value_at(absolute_time))
+
+    def integrate_interval(
+        self,
+        start: typing.Union[core_parameters.abc.Duration, typing.Any],
+        end: typing.Union[core_parameters.abc.Duration, typing.Any],
+    ) -> float:
+        if (start := float(start)) == (end := float(end)):
+            return 0.0
+        start_integral, end_integral = _integrate_from_start_array(
+            self._get_point_array_tuple(), np.array([start, end])
+        )
+        return float(end_integral - start_integral)
+
+
+class EnvelopeCursor(object):
+    """Stateful reader of an envelope for monotonically increasing times.
+
+    :param envelope: The envelope which shall be read. This can either
+        be an :class:`Envelope` or a :class:`PointEnvelope`.
+    :type envelope: typing.Union[Envelope, PointEnvelope]
+
+    Renderers or schedulers usually ask an envelope for its values at
+    increasing times. While :meth:`Envelope.value_at` has to search the
+    active segment on each call, the cursor remembers the last active
+    segment. If the next requested time is in the same or in one of the
+    following segments, the cursor only needs to move forward a few
+    steps. Only backward jumps or big forward jumps fall back to a
+    binary search.
+
+    The cursor reads the points of the envelope when it is initialised.
+    Later changes of the envelope are ignored by the cursor.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+    >>> cursor = envelope.cursor()
+    >>> cursor.value_at(0.5)
+    0.5
+    >>> cursor.integrate_to(2)
+    1.0
+    >>> list(cursor.sample(4, 0, 1))
+    [0.0, 0.25, 0.5, 0.75]
+    """
+
+    def __init__(self, envelope: typing.Union[Envelope, PointEnvelope]):
+        point_array_tuple = envelope._get_point_array_tuple()
+        self._absolute_time_list, self._value_list, self._curve_shape_list = (
+            array.tolist() for array in point_array_tuple
+        )
+        if len(self._absolute_time_list) > 1:
+            segment_integral_array = _get_segment_integral_array(point_array_tuple)
+        else:
+            segment_integral_array = np.zeros(0)
+        self._cumulative_integral_list = [0.0] + np.cumsum(
+            segment_integral_array
+        ).tolist()
+        self._last_index = len(self._absolute_time_list) - 1
+        self._index = 0
+
+    # ###################################################################### #
+    #                         private methods                                #
+    # ###################################################################### #
+
+    def _move_to(self, absolute_time: float) -> int:
+        """Find index of the point which starts the segment at absolute_time."""
+
+        absolute_time_list = self._absolute_time_list
+        index, last_index = self._index, self._last_index
+        if absolute_time < absolute_time_list[index]:
+            # Backward jump
+            index = max(bisect.bisect_right(absolute_time_list, absolute_time) - 1, 0)
+        else:
+            # Try a few steps forward before falling back to a binary search
+            for _ in range(2):
+                if index == last_index or absolute_time_list[index + 1] > absolute_time:
+                    break
+                index += 1
+            else:
+                index = (
+                    bisect.bisect_right(absolute_time_list, absolute_time, lo=index)
+                    - 1
+                )
+        self._index = index
+        return index
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def value_at(
+        self, absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+    ) -> Envelope.Value:
+        """Get value at absolute time.
+
+        :param absolute_time: The absolute time of the requested value.
+        :type absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+        """
+
+        absolute_time = float(absolute_time)
+        index = self._move_to(absolute_time)
+        absolute_time_list, value_list = self._absolute_time_list, self._value_list
+        if index == self._last_index or absolute_time <= absolute_time_list[0]:
+            return value_list[index]
+        return core_utilities.scale(
+            absolute_time,
+            absolute_time_list[index],
+            absolute_time_list[index + 1],
+            value_list[index],
+            value_list[index + 1],
+            self._curve_shape_list[index],
+        )
+
+    def integrate_to(
+        self, absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+    ) -> float:
+        """Integrate envelope from its first point to the absolute time.
+
+        :param absolute_time: Until which point in time the envelope
+            shall be integrated.
+        :type absolute_time: typing.Union[core_parameters.abc.Duration, typing.Any]
+
+        Before its first and after its last point the envelope holds
+        the value of its first or last point.
+        """
+
+        absolute_time = float(absolute_time)
+        index = self._move_to(absolute_time)
+        absolute_time_list, value_list = self._absolute_time_list, self._value_list
+        segment_start = absolute_time_list[index]
+        if absolute_time <= absolute_time_list[0]:
+            return (absolute_time - segment_start) * value_list[0]
+        if index == self._last_index:
+            return (
+                self._cumulative_integral_list[index]
+                + (absolute_time - segment_start) * value_list[index]
+            )
+        segment_duration = absolute_time_list[index + 1] - segment_start
+        percentage = (absolute_time - segment_start) / segment_duration
+        value0 = value_list[index]
+        curve_shape = self._curve_shape_list[index]
+        if curve_shape:
+            curve_integral = (
+                (math.expm1(curve_shape * percentage) / curve_shape) - percentage
+            ) / math.expm1(curve_shape)
+        else:
+            curve_integral = (percentage**2) / 2
+        return self._cumulative_integral_list[index] + segment_duration * (
+            value0 * percentage + (value_list[index + 1] - value0) * curve_integral
+        )
+
+    def sample(
+        self,
+        rate: core_constants.Real,
+        start: typing.Union[core_parameters.abc.Duration, typing.Any] = 0,
+        end: typing.Optional[
+            typing.Union[core_parameters.abc.Duration, typing.Any]
+        ] = None,
+    ) -> typing.Generator[Envelope.Value, None, None]:
+        """Yield values of the envelope with a fixed rate.
+
+        :param rate: How many values shall be yielded per time unit.
+        :type rate: core_constants.Real
+        :param start: The absolute time of the first value. Default to 0.
+        :type start: typing.Union[core_parameters.abc.Duration, typing.Any]
+        :param end: The absolute time until which values are yielded
+            (excluding the end itself). If ``None`` values are yielded until
+            the last point of the envelope. Default to ``None``.
+        :type end: typing.Optional[typing.Union[core_parameters.abc.Duration, typing.Any]]
+        """
+
+        start = float(start)
+        end = self._absolute_time_list[-1] if end is None else float(end)
+        frame_count = max(math.ceil((end - start) * rate), 0)
+        for frame_index in range(frame_count):
+            yield self.value_at(start + (frame_index / rate))
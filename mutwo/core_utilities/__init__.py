@@ -2,14 +2,15 @@
 
 from . import configurations
 
+from .caches import *
 from .decorators import *
 from .exceptions import *
 from .prime_factors import *
 from .tools import *
 
-from . import decorators, exceptions, prime_factors, tools
+from . import caches, decorators, exceptions, prime_factors, tools
 
-__all__ = tools.get_all(decorators, exceptions, prime_factors, tools)
+__all__ = tools.get_all(caches, decorators, exceptions, prime_factors, tools)
 
 # Force flat structure
-del decorators, exceptions, prime_factors, tools
+del caches, decorators, exceptions, prime_factors, tools
@@ -0,0 +1,139 @@
+"""Caches for expensive, repeated computations."""
+
+import collections
+import typing
+
+
+__all__ = ("LRUCache",)
+
+
+Key = typing.TypeVar("Key")
+Value = typing.TypeVar("Value")
+
+
+class LRUCache(typing.Generic[Key, Value]):
+    """Bounded mapping which forgets the least recently used items.
+
+    :param max_size: How many items the cache can store at most. If a
+        new item is added to a full cache, the least recently used
+        item is removed.
+    :type max_size: int
+
+    In contrast to :func:`functools.lru_cache` the cache isn't bound
+    to one function: it can be owned by an object and cleared as soon
+    as this object changes. To tune the size of a cache it counts how
+    often :meth:`get` found an item (:attr:`hit_count`) and how often it
+    didn't (:attr:`miss_count`).
+
+    **Example:**
+
+    >>> from mutwo import core_utilities
+    >>> cache = core_utilities.LRUCache(max_size=2)
+    >>> cache[1] = 'a'
+    >>> cache[2] = 'b'
+    >>> cache.get(1)
+    'a'
+    >>> cache[3] = 'c'  # 2 is removed, because 1 was used more recently
+    >>> cache.get(2)
+    >>> cache.hit_count, cache.miss_count
+    (1, 1)
+    """
+
+    def __init__(self, max_size: int = 128):
+        if max_size < 1:
+            raise ValueError(f"'max_size' has to be at least 1, but is '{max_size}'.")
+        self._max_size = max_size
+        self._item_dict: collections.OrderedDict[
+            Key, Value
+        ] = collections.OrderedDict()
+        self.reset_statistics()
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __len__(self) -> int:
+        return len(self._item_dict)
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._item_dict
+
+    def __setitem__(self, key: Key, value: Value):
+        self._item_dict[key] = value
+        self._item_dict.move_to_end(key)
+        if len(self._item_dict) > self._max_size:
+            self._item_dict.popitem(last=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_size = {self.max_size}, size = {len(self)},"
+            f" hit_count = {self.hit_count}, miss_count = {self.miss_count})"
+        )
+
+    # ###################################################################### #
+    #                         public properties                              #
+    # ###################################################################### #
+
+    @property
+    def max_size(self) -> int:
+        """How many items the cache can store at most."""
+
+        return self._max_size
+
+    @property
+    def hit_count(self) -> int:
+        """How often :meth:`get` found the requested item."""
+
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """How often :meth:`get` didn't find the requested item."""
+
+        return self._miss_count
+
+    @property
+    def hit_rate(self) -> float:
+        """Which part of all :meth:`get` calls found the requested item.
+
+        0 if :meth:`get` hasn't been called yet.
+        """
+
+        request_count = self._hit_count + self._miss_count
+        if not request_count:
+            return 0.0
+        return self._hit_count / request_count
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def get(
+        self, key: Key, default: typing.Optional[Value] = None
+    ) -> typing.Optional[Value]:
+        """Get item and mark it as recently used.
+
+        :param key: The key of the item.
+        :param default: Return this object if the cache doesn't
+            contain the item. Default to ``None``.
+        """
+
+        try:
+            value = self._item_dict[key]
+        except KeyError:
+            self._miss_count += 1
+            return default
+        self._item_dict.move_to_end(key)
+        self._hit_count += 1
+        return value
+
+    def clear(self):
+        """Remove all items (but keep the statistics)."""
+
+        self._item_dict.clear()
+
+    def reset_statistics(self):
+        """Set :attr:`hit_count` and :attr:`miss_count` to 0."""
+
+        self._hit_count = 0
+        self._miss_count = 0
@@ -31,7 +31,6 @@ setuptools.setup(
     install_requires=[
         "primesieve>=2.0.0, <3.0.0",
         "numpy>=1.18, <2.00",
-        "scipy>=1.4.1, <2.0.0",
         "python-ranges>=0.2.0, <1.0.0",
     ],
     extras_require=extras_require,
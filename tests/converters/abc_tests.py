@@ -1,6 +1,10 @@
+import concurrent.futures
+import pickle
+import sys
 import unittest
 
 from mutwo import core_converters
+from mutwo import core_events
 
 
 class ConverterTest(unittest.TestCase):
@@ -31,5 +35,422 @@ class ConverterTest(unittest.TestCase):
         self.assertEqual(self.dummy_converter(10), 5)
 
 
+class EventConverterTest(unittest.TestCase):
+    class DelayConverter(core_converters.abc.EventConverter):
+        def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+            return ((absolute_entry_delay, depth),)
+
+        def convert(self, event_to_convert):
+            return self._convert_event(event_to_convert, 1)
+
+    class CopyConverter(core_converters.abc.SymmetricalEventConverter):
+        def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+            return core_events.SimpleEvent(absolute_entry_delay)
+
+        def convert(self, event_to_convert):
+            return self._convert_event(event_to_convert, 0)
+
+    def setUp(self):
+        self.event = core_events.SequentialEvent(
+            [
+                core_events.SimpleEvent(1),
+                core_events.SimultaneousEvent(
+                    [
+                        core_events.SequentialEvent(
+                            [core_events.SimpleEvent(2), core_events.SimpleEvent(1)]
+                        ),
+                        core_events.SimpleEvent(4),
+                    ]
+                ),
+                core_events.SimpleEvent(1),
+            ]
+        )
+
+    def test_convert_event(self):
+        self.assertEqual(
+            self.DelayConverter().convert(self.event),
+            ((1, 1), (2, 3), (4, 3), (2, 2), (6, 1)),
+        )
+
+    def test_convert_event_with_symmetrical_converter(self):
+        self.assertEqual(
+            self.CopyConverter().convert(self.event),
+            core_events.SequentialEvent(
+                [
+                    core_events.SimpleEvent(0),
+                    core_events.SimultaneousEvent(
+                        [
+                            core_events.SequentialEvent(
+                                [
+                                    core_events.SimpleEvent(1),
+                                    core_events.SimpleEvent(3),
+                                ]
+                            ),
+                            core_events.SimpleEvent(1),
+                        ]
+                    ),
+                    core_events.SimpleEvent(5),
+                ]
+            ),
+        )
+
+    def test_convert_deeply_nested_event(self):
+        depth = sys.getrecursionlimit() + 100
+        event = core_events.SimpleEvent(1)
+        for index in range(depth):
+            event_class = (
+                core_events.SequentialEvent
+                if index % 2
+                else core_events.SimultaneousEvent
+            )
+            event = event_class([core_events.SimpleEvent(1), event])
+        # The innermost simple event starts after all simple events of
+        # the sequential events which are before it.
+        expected_delay = 1 + depth // 2
+        self.assertEqual(
+            self.DelayConverter().convert(event)[-1], (expected_delay, depth)
+        )
+        converted_event = self.CopyConverter().convert(event)
+        for _ in range(depth):
+            converted_event = converted_event[1]
+        self.assertEqual(converted_event, core_events.SimpleEvent(expected_delay - 1))
+
+    def test_convert_event_without_depth(self):
+        class DelayConverter(core_converters.abc.EventConverter):
+            def _convert_simple_event(self, event_to_convert, absolute_entry_delay):
+                return (absolute_entry_delay,)
+
+            def convert(self, event_to_convert):
+                return self._convert_event(event_to_convert, 0)
+
+        self.assertEqual(DelayConverter().convert(self.event), (0, 1, 3, 1, 5))
+
+    def test_convert_event_with_type_error(self):
+        call_list = []
+
+        class BrokenConverter(self.DelayConverter):
+            def _convert_simple_event(
+                self, event_to_convert, absolute_entry_delay, depth
+            ):
+                call_list.append(event_to_convert)
+                raise TypeError()
+
+        self.assertRaises(TypeError, BrokenConverter().convert, self.event)
+        # The conversion isn't retried without the 'depth' argument.
+        self.assertEqual(len(call_list), 1)
+
+    def test_convert_event_with_overridden_sequential_event_conversion(self):
+        class ReversingConverter(self.DelayConverter):
+            def _convert_sequential_event(
+                self, sequential_event, absolute_entry_delay, depth=0
+            ):
+                return tuple(
+                    reversed(
+                        super()._convert_sequential_event(
+                            sequential_event, absolute_entry_delay, depth
+                        )
+                    )
+                )
+
+        self.assertTrue(ReversingConverter._is_converted_per_nested_event)
+        self.assertFalse(self.DelayConverter._is_converted_per_nested_event)
+        self.assertEqual(
+            ReversingConverter().convert(self.event),
+            ((6, 1), (2, 2), (2, 3), (4, 3), (1, 1)),
+        )
+
+    def test_convert_event_with_overridden_event_conversion(self):
+        call_list = []
+
+        class CountingCopyConverter(self.CopyConverter):
+            def _convert_event(self, event_to_convert, absolute_entry_delay, depth=0):
+                call_list.append(depth)
+                return super()._convert_event(
+                    event_to_convert, absolute_entry_delay, depth
+                )
+
+        converter = CountingCopyConverter()
+        converter.subtree_cache_size = 10
+        self.assertEqual(
+            converter.convert(self.event), self.CopyConverter().convert(self.event)
+        )
+        # '_convert_event' is called for each nested event
+        self.assertEqual(call_list, [0, 1, 1, 2, 3, 3, 2, 1])
+
+    def test_convert_iter(self):
+        self.assertEqual(
+            list(self.DelayConverter().convert_iter(self.event)),
+            [(0, 1), (1, 3), (1, 2), (3, 3), (5, 1)],
+        )
+        self.assertEqual(
+            list(self.CopyConverter().convert_iter(self.event)),
+            [core_events.SimpleEvent(delay) for delay in (0, 1, 1, 3, 5)],
+        )
+
+    def test_convert_iter_lazily(self):
+        call_list = []
+
+        class StreamConverter(self.DelayConverter):
+            def _convert_simple_event(
+                self, event_to_convert, absolute_entry_delay, depth
+            ):
+                call_list.append(event_to_convert)
+                yield absolute_entry_delay
+                yield event_to_convert.duration
+
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1) for _ in range(1000)]
+                )
+                for _ in range(3)
+            ]
+        )
+        data_iterator = StreamConverter().convert_iter(event)
+        self.assertEqual(next(data_iterator), 0)
+        self.assertEqual(len(call_list), 1)
+        self.assertEqual([next(data_iterator) for _ in range(5)], [1, 0, 1, 0, 1])
+        self.assertEqual(len(call_list), 3)
+        self.assertEqual(len(list(data_iterator)), 6000 - 6)
+
+    def test_subtree_cache(self):
+        for converter_class in (self.DelayConverter, self.CopyConverter):
+            converter = converter_class()
+            self.assertEqual(converter.subtree_cache_size, 0)
+            self.assertIsNone(converter.subtree_cache)
+            cached_converter = converter_class()
+            cached_converter.subtree_cache_size = 10
+            self.assertEqual(cached_converter.subtree_cache.max_size, 10)
+            for _ in range(2):
+                self.assertEqual(
+                    cached_converter.convert(self.event), converter.convert(self.event)
+                )
+            # The second time the complete event is found in the cache
+            self.assertEqual(cached_converter.subtree_cache.hit_count, 1)
+            # Changes are noticed
+            self.event[1][0][1].duration = 3
+            self.assertEqual(
+                cached_converter.convert(self.event), converter.convert(self.event)
+            )
+            self.event[1][0][1].duration = 1
+
+    def test_subtree_cache_with_edited_voice(self):
+        call_list = []
+
+        class CountingConverter(self.DelayConverter):
+            def _convert_simple_event(
+                self, event_to_convert, absolute_entry_delay, depth
+            ):
+                call_list.append(event_to_convert)
+                return super()._convert_simple_event(
+                    event_to_convert, absolute_entry_delay, depth
+                )
+
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in range(1, 5)]
+                )
+                for _ in range(3)
+            ]
+        )
+        converter = CountingConverter()
+        converter.subtree_cache_size = 10
+        converter.convert(event)
+        # All voices are equal, so only the first one is converted
+        self.assertEqual(len(call_list), 4)
+        event[2][0].duration = 2
+        call_list.clear()
+        converted_event = converter.convert(event)
+        self.assertEqual(call_list, list(event[2]))
+        self.assertEqual(converted_event, CountingConverter().convert(event))
+
+    def test_subtree_cache_with_mutating_converter(self):
+        tempo_converter = core_converters.TempoConverter(
+            core_events.TempoEnvelope([[0, 30], [4, 30]])
+        )
+        event = core_events.SequentialEvent([core_events.SimpleEvent(1)] * 4)
+        # A cached subtree wouldn't be converted again
+        with self.assertRaises(ValueError):
+            tempo_converter.subtree_cache_size = 16
+        self.assertIsNone(tempo_converter.subtree_cache)
+        for _ in range(2):
+            converted_event = tempo_converter.convert(event)
+            self.assertEqual(converted_event.get_parameter("duration"), (2.0,) * 4)
+        with self.assertRaises(ValueError):
+            core_converters.EventToMetrizedEvent().subtree_cache_size = 16
+        # Disabling the cache is always possible
+        tempo_converter.subtree_cache_size = 0
+
+    def test_subtree_digest_doesnt_change_event(self):
+        self.event[1].tempo_envelope = core_events.TempoEnvelope([[0, 30], [1, 60]])
+        digest_dict = self.DelayConverter._get_subtree_digest_dict(self.event)
+        self.assertIsNone(self.event._tempo_envelope)
+        self.assertIsNone(self.event[1][0]._tempo_envelope)
+        # Neither caches of envelopes nor initialised default tempo
+        # envelopes change the digest.
+        self.event[1].tempo_envelope.value_tuple
+        self.event.tempo_envelope
+        self.assertEqual(
+            self.DelayConverter._get_subtree_digest_dict(self.event), digest_dict
+        )
+        self.event[1].tempo_envelope[0].value = 40
+        self.assertNotEqual(
+            self.DelayConverter._get_subtree_digest_dict(self.event)[id(self.event)],
+            digest_dict[id(self.event)],
+        )
+
+    def test_convert_unknown_object(self):
+        self.assertRaises(TypeError, self.DelayConverter().convert, [1, 2])
+
+
+# Converters which are used by a process pool have to be importable.
+class ParallelDelayConverter(
+    core_converters.abc.ParallelEventConverter, core_converters.abc.EventConverter
+):
+    def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+        return ((absolute_entry_delay, depth),)
+
+    def convert(self, event_to_convert):
+        return self._convert_event(event_to_convert, 1)
+
+
+class ParallelCopyConverter(
+    core_converters.abc.ParallelEventConverter,
+    core_converters.abc.SymmetricalEventConverter,
+):
+    def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+        return core_events.SimpleEvent(absolute_entry_delay)
+
+    def convert(self, event_to_convert):
+        return self._convert_event(event_to_convert, 1)
+
+
+class ParallelEventConverterTest(unittest.TestCase):
+    def setUp(self):
+        self.event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(duration)
+                        for duration in range(1, simple_event_count + 1)
+                    ]
+                )
+                for simple_event_count in (3, 1, 4, 1, 5)
+            ]
+        )
+        self.event.append(core_events.SimultaneousEvent([core_events.SimpleEvent(2)]))
+
+    def assert_parallel_conversion(self, executor, minimal_simple_event_count):
+        for converter_class in (ParallelDelayConverter, ParallelCopyConverter):
+            self.assertEqual(
+                converter_class(executor, minimal_simple_event_count).convert(
+                    self.event
+                ),
+                converter_class().convert(self.event),
+            )
+
+    def test_get_chunk_list(self):
+        converter = ParallelDelayConverter(minimal_simple_event_count_per_chunk=4)
+        self.assertEqual(
+            converter._get_chunk_list(self.event),
+            [list(self.event[:2]), list(self.event[2:3]), list(self.event[3:])],
+        )
+        converter.minimal_simple_event_count_per_chunk = 100
+        self.assertEqual(converter._get_chunk_list(self.event), [list(self.event)])
+
+    def test_subclass_without_init(self):
+        class DelayConverter(ParallelDelayConverter):
+            def __init__(self):
+                pass
+
+        converter = DelayConverter()
+        self.assertIsNone(converter.executor)
+        self.assertEqual(
+            converter.convert(self.event), ParallelDelayConverter().convert(self.event)
+        )
+        converter.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        with converter.executor:
+            self.assertEqual(converter._get_chunk_list(self.event), [list(self.event)])
+
+    def test_convert_with_thread_pool(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            for minimal_simple_event_count in (1, 4, 100):
+                self.assert_parallel_conversion(executor, minimal_simple_event_count)
+
+    def test_convert_with_process_pool(self):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            self.assert_parallel_conversion(executor, 4)
+
+    def test_pickle(self):
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            converter = ParallelDelayConverter(executor, 10)
+            unpickled_converter = pickle.loads(pickle.dumps(converter))
+        self.assertIsNone(unpickled_converter.executor)
+        self.assertEqual(unpickled_converter.minimal_simple_event_count_per_chunk, 10)
+
+
+class ConverterPipelineTest(unittest.TestCase):
+    class AddValue(core_converters.abc.SymmetricalEventConverter, is_leaf_local=True):
+        def __init__(self, value):
+            self.value = value
+            self.convert_count = 0
+
+        def _convert_simple_event(self, event_to_convert, absolute_entry_delay, depth):
+            return event_to_convert.set(
+                "value",
+                getattr(event_to_convert, "value", 0) * 2
+                + self.value
+                + absolute_entry_delay.duration,
+                mutate=False,
+            )
+
+        def convert(self, event_to_convert):
+            self.convert_count += 1
+            return self._convert_event(event_to_convert, 0)
+
+    def setUp(self):
+        self.event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1), core_events.SimpleEvent(2)]
+                ),
+                core_events.SimpleEvent(3),
+            ]
+        )
+        self.converter_list = [
+            self.AddValue(1),
+            self.AddValue(2),
+            core_converters.TempoConverter(core_events.TempoEnvelope([[0, 30]])),
+            self.AddValue(3),
+        ]
+
+    def test_convert(self):
+        expected_event = self.event
+        for converter in self.converter_list:
+            expected_event = converter.convert(expected_event)
+        for converter in self.converter_list[:2] + self.converter_list[3:]:
+            converter.convert_count = 0
+
+        pipeline = core_converters.abc.ConverterPipeline(self.converter_list)
+        self.assertEqual(pipeline.convert(self.event), expected_event)
+        # The first two converters are fused
+        self.assertEqual(len(pipeline._stage_tuple), 3)
+        self.assertEqual(self.converter_list[0].convert_count, 0)
+        self.assertEqual(self.converter_list[1].convert_count, 0)
+        self.assertEqual(self.converter_list[3].convert_count, 1)
+        # The original event isn't changed
+        self.assertFalse(hasattr(self.event[1], "value"))
+
+    def test_converter_tuple(self):
+        pipeline = core_converters.abc.ConverterPipeline(self.converter_list)
+        self.assertEqual(pipeline.converter_tuple, tuple(self.converter_list))
+
+    def test_is_leaf_local(self):
+        self.assertTrue(self.AddValue._is_leaf_local)
+        self.assertFalse(core_converters.abc.SymmetricalEventConverter._is_leaf_local)
+        self.assertFalse(core_converters.EventToMetrizedEvent._is_leaf_local)
+
+
 if __name__ == "__main__":
     unittest.main()
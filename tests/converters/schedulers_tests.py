@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+
+from mutwo import core_converters
+from mutwo import core_events
+
+
+class EventSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.call_list = []
+
+    def callback(self, start, end, simple_event):
+        self.call_list.append((self.clock.time(), start, end, simple_event))
+
+    def make_scheduler(self, **kwargs) -> core_converters.EventScheduler:
+        return core_converters.EventScheduler(
+            self.callback, clock=self.clock, **kwargs
+        )
+
+    def test_play(self):
+        self.clock = core_converters.VirtualClock(start=10)
+        scheduler = self.make_scheduler(lookahead=0)
+        simultaneous_event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (2, 1)]
+                ),
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (1, 3)]
+                ),
+            ]
+        )
+        asyncio.run(scheduler.play(simultaneous_event))
+        self.assertEqual(
+            [call[:3] for call in self.call_list],
+            [(10, 10, 12), (10, 10, 11), (11, 11, 14), (12, 12, 13)],
+        )
+        self.assertEqual(
+            [call[3] for call in self.call_list],
+            [
+                simultaneous_event[0][0],
+                simultaneous_event[1][0],
+                simultaneous_event[1][1],
+                simultaneous_event[0][1],
+            ],
+        )
+        self.assertEqual(scheduler.dispatch_count, 4)
+        self.assertEqual(scheduler.wake_up_count, 2)
+
+    def test_play_with_tempo_converter(self):
+        self.clock = core_converters.VirtualClock()
+        scheduler = self.make_scheduler(
+            lookahead=0,
+            tempo_converter=core_converters.TempoConverter(
+                core_events.TempoEnvelope([[0, 30], [1, 30]])
+            ),
+        )
+        asyncio.run(
+            scheduler.play(
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (1, 1)]
+                )
+            )
+        )
+        self.assertEqual(
+            [call[:3] for call in self.call_list], [(0, 0, 2), (2, 2, 4)]
+        )
+
+    def test_play_with_lookahead(self):
+        self.clock = core_converters.VirtualClock()
+        scheduler = self.make_scheduler(lookahead=0.25)
+        asyncio.run(
+            scheduler.play(
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (0.125, 1, 1)]
+                )
+            )
+        )
+        # The first two simple events are passed at once,
+        # the last one 0.25 seconds before it starts.
+        self.assertEqual(
+            [call[:2] for call in self.call_list],
+            [(0, 0), (0, 0.125), (0.875, 1.125)],
+        )
+
+    def test_play_with_imprecise_clock(self):
+        """Ensure latencies don't add up"""
+
+        self.clock = core_converters.VirtualClock(sleep_latency=0.125)
+        scheduler = self.make_scheduler(lookahead=0)
+        asyncio.run(
+            scheduler.play(
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1) for _ in range(10)]
+                )
+            )
+        )
+        self.assertEqual(
+            [call[0] for call in self.call_list],
+            [0] + [start + 0.125 for start in range(1, 10)],
+        )
+        self.assertEqual(scheduler.wake_up_count, 9)
+        self.assertEqual(scheduler.mean_latency, 0.125)
+        self.assertEqual(scheduler.max_latency, 0.125)
+        self.assertAlmostEqual(scheduler.jitter, 0)
+        scheduler.reset_statistics()
+        self.assertEqual(scheduler.dispatch_count, 0)
+        self.assertEqual(scheduler.max_latency, 0)
+
+    def test_tempo_factor(self):
+        self.clock = core_converters.VirtualClock()
+        scheduler = self.make_scheduler(lookahead=0)
+
+        def callback(start, end, simple_event):
+            self.callback(start, end, simple_event)
+            if len(self.call_list) == 2:
+                scheduler.tempo_factor = 2
+
+        scheduler._callback = callback
+        asyncio.run(
+            scheduler.play(
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1) for _ in range(4)]
+                )
+            )
+        )
+        self.assertEqual([call[0] for call in self.call_list], [0, 1, 1.5, 2])
+        with self.assertRaises(ValueError):
+            scheduler.tempo_factor = 0
+
+    def test_play_with_coroutine_callback(self):
+        self.clock = core_converters.VirtualClock()
+        finished_list = []
+
+        async def callback(start, end, simple_event):
+            await asyncio.sleep(0)
+            finished_list.append(start)
+
+        scheduler = core_converters.EventScheduler(
+            callback, lookahead=0, clock=self.clock
+        )
+        asyncio.run(
+            scheduler.play(
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1) for _ in range(3)]
+                )
+            )
+        )
+        self.assertEqual(finished_list, [0, 1, 2])
+
+    def test_invalid_lookahead(self):
+        self.clock = core_converters.VirtualClock()
+        self.assertRaises(ValueError, self.make_scheduler, lookahead=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+import warnings
+
+import numpy as np
 
 from mutwo import core_converters
 from mutwo import core_events
@@ -72,6 +75,34 @@ class TempoPointConverterTest(unittest.TestCase):
         self.assertEqual(converter.convert(tempo_point3), 1)
         self.assertEqual(converter.convert(tempo_point4), 0.5)
 
+    def test_convert_many(self):
+        tempo_point = core_parameters.TempoPoint(45, 2)
+        converter = core_converters.TempoPointConverter()
+        for tempo_point_sequence in (
+            [60, 120, 44.5, 70],
+            np.array([60, 120, 44.5, 70]),
+            [tempo_point, 60, tempo_point, core_parameters.TempoPoint(30, 1), 77],
+            [],
+        ):
+            with warnings.catch_warnings(record=True) as warning_list:
+                warnings.simplefilter("always")
+                beat_length_in_seconds_array = converter.convert_many(
+                    tempo_point_sequence
+                )
+            self.assertEqual(
+                beat_length_in_seconds_array.tolist(),
+                [
+                    converter.convert(tempo_point)
+                    for tempo_point in tempo_point_sequence
+                ],
+            )
+            # Only one warning per batch
+            has_undefined_reference = any(
+                not isinstance(tempo_point, core_parameters.TempoPoint)
+                for tempo_point in tempo_point_sequence
+            )
+            self.assertEqual(len(warning_list), int(has_undefined_reference))
+
 
 class TempoConverterTest(unittest.TestCase):
     def test_convert_simple_event(self):
@@ -138,6 +169,287 @@ class TempoConverterTest(unittest.TestCase):
         converted_simple_event = converter.convert(simple_event)
         self.assertEqual(converted_simple_event.tempo_envelope.duration, 6)
 
+    def test_convert_tempo_envelope_with_static_tempo(self):
+        sequential_event = core_events.SequentialEvent(
+            [core_events.SimpleEvent(2), core_events.SimpleEvent(4)]
+        )
+        sequential_event[1].tempo_envelope = core_events.TempoEnvelope(
+            [[0, 60], [2, 30]]
+        )
+        # Static tempo envelope which is shorter than the event
+        tempo_envelope = core_events.TempoEnvelope([[0, 30], [1, 30]])
+        converted_sequential_event = core_converters.TempoConverter(
+            tempo_envelope
+        ).convert(sequential_event)
+        self.assertEqual(
+            converted_sequential_event[0].tempo_envelope,
+            core_events.TempoEnvelope([[0, 60], [2, 60]]),
+        )
+        self.assertEqual(
+            converted_sequential_event[1].tempo_envelope,
+            core_events.TempoEnvelope([[0, 60], [4, 30]]),
+        )
+        # With 60 BPM tempo envelopes stay the same
+        tempo_envelope = core_events.TempoEnvelope([[0, 60], [1, 60]])
+        converted_sequential_event = core_converters.TempoConverter(
+            tempo_envelope
+        ).convert(sequential_event)
+        self.assertEqual(converted_sequential_event, sequential_event)
+
+    def test_convert_tempo_envelope_after_end_of_tempo_envelope(self):
+        sequential_event = core_events.SequentialEvent(
+            [core_events.SimpleEvent(2), core_events.SimpleEvent(1)]
+        )
+        sequential_event[1].tempo_envelope = core_events.TempoEnvelope([[0, 120]])
+        tempo_envelope = core_events.TempoEnvelope([[0, 90], [1, 45]])
+        for vectorize in (False, True):
+            converted_sequential_event = core_converters.TempoConverter(
+                tempo_envelope, vectorize=vectorize
+            ).convert(sequential_event)
+            # After the last tempo point its tempo (45 BPM) is kept.
+            self.assertAlmostEqual(
+                converted_sequential_event[1].duration.duration_in_floats, 4 / 3
+            )
+            self.assertEqual(
+                converted_sequential_event[1].tempo_envelope,
+                sequential_event[1].tempo_envelope,
+            )
+        sequential_event.tempo_envelope = tempo_envelope
+        metrized_sequential_event = core_converters.EventToMetrizedEvent().convert(
+            sequential_event
+        )
+        # The tempo envelope of the second event is applied, too.
+        self.assertAlmostEqual(
+            metrized_sequential_event[1].duration.duration_in_floats, 2 / 3
+        )
+
+    def test_convert_vectorized(self):
+        tempo_envelope = core_events.TempoEnvelope(
+            [
+                [0, 60, 1],
+                [3, 30],
+                [3, core_parameters.TempoPoint(90, reference=2), -2],
+                [7.5, 45],
+                [12, 100],
+            ]
+        )
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(duration)
+                        for duration in (1, 0.5, core_parameters.DirectDuration(1 / 3))
+                    ]
+                    + [
+                        core_events.SimultaneousEvent(
+                            [
+                                core_events.SequentialEvent(
+                                    [core_events.SimpleEvent(2.25)] * 3
+                                ),
+                                core_events.SimpleEvent(5),
+                            ]
+                        ),
+                        core_events.SimpleEvent(3),
+                    ]
+                ),
+                core_events.SimpleEvent(12),
+            ]
+        )
+        event[0][1].tempo_envelope = core_events.TempoEnvelope([[0, 60], [1, 30]])
+        for apply_converter_on_events_tempo_envelope in (True, False):
+            converted_event, vectorized_converted_event = (
+                core_converters.TempoConverter(
+                    tempo_envelope,
+                    apply_converter_on_events_tempo_envelope,
+                    vectorize=vectorize,
+                ).convert(event)
+                for vectorize in (False, True)
+            )
+            # Compare exact fractions, not only rounded floats
+            self.assertEqual(
+                tuple(
+                    duration.duration
+                    for duration in converted_event.get_parameter(
+                        "duration", flat=True
+                    )
+                ),
+                tuple(
+                    duration.duration
+                    for duration in vectorized_converted_event.get_parameter(
+                        "duration", flat=True
+                    )
+                ),
+            )
+            self.assertEqual(
+                converted_event[0][1].tempo_envelope,
+                vectorized_converted_event[0][1].tempo_envelope,
+            )
+
+    def test_tempo_map_cache(self):
+        tempo_map_cache = core_converters.TempoConverter.tempo_map_cache
+        tempo_map_cache.clear()
+        tempo_map_cache.reset_statistics()
+
+        def get_statistics():
+            return tempo_map_cache.hit_count, tempo_map_cache.miss_count
+
+        tempo_envelope = core_events.Envelope(
+            [[0, core_parameters.TempoPoint(30)], [4, 60]]
+        )
+        converter0 = core_converters.TempoConverter(tempo_envelope)
+        self.assertEqual(get_statistics(), (0, 1))
+        # Equal content: prepared tempo map is reused
+        converter1 = core_converters.TempoConverter(tempo_envelope.copy())
+        self.assertEqual(get_statistics(), (1, 1))
+        self.assertIs(
+            converter0._beat_length_in_seconds_envelope,
+            converter1._beat_length_in_seconds_envelope,
+        )
+        # Different reference: new tempo map
+        converter2 = core_converters.TempoConverter(
+            core_events.Envelope(
+                [[0, core_parameters.TempoPoint(30, reference=2)], [4, 60]]
+            )
+        )
+        self.assertEqual(get_statistics(), (1, 2))
+        self.assertEqual(converter0.convert(core_events.SimpleEvent(4)).duration, 6)
+        self.assertEqual(converter2.convert(core_events.SimpleEvent(4)).duration, 4)
+
+    def test_get_absolute_time_in_seconds_array(self):
+        tempo_envelope = core_events.Envelope([[0, 30], [4, 60]])
+        converter = core_converters.TempoConverter(tempo_envelope)
+        self.assertEqual(
+            converter.get_absolute_time_in_seconds_array([0, 2, 4, 5]).tolist(),
+            [0, 3.5, 6, 7],
+        )
+
+    def test_get_absolute_time_in_beats_array(self):
+        tempo_envelope = core_events.Envelope(
+            [[0, 30, 2], [4, 60], [4, 120, -3], [10, 40]]
+        )
+        converter = core_converters.TempoConverter(tempo_envelope)
+        absolute_time_in_beats_tuple = (-1, 0, 0.5, 3.999, 4, 4.5, 7.25, 10, 20)
+        for absolute_time_in_beats, converted_absolute_time_in_beats in zip(
+            absolute_time_in_beats_tuple,
+            converter.get_absolute_time_in_beats_array(
+                converter.get_absolute_time_in_seconds_array(
+                    absolute_time_in_beats_tuple
+                )
+            ),
+        ):
+            self.assertAlmostEqual(
+                absolute_time_in_beats, converted_absolute_time_in_beats
+            )
+
+    def test_invert(self):
+        tempo_envelope = core_events.Envelope([[0, 30, 1], [3, 60], [3, 45], [7, 80]])
+        sequential_event = core_events.SequentialEvent(
+            [core_events.SimpleEvent(duration) for duration in (1, 0.5, 2.5, 3, 1)]
+        )
+        event = core_events.SimultaneousEvent(
+            [sequential_event, core_events.SimpleEvent(6.25)]
+        )
+        converter = core_converters.TempoConverter(tempo_envelope)
+        inverted_event = converter.invert(converter.convert(event))
+        for duration, inverted_duration in zip(
+            event.get_parameter("duration", flat=True),
+            inverted_event.get_parameter("duration", flat=True),
+        ):
+            self.assertAlmostEqual(float(duration), float(inverted_duration))
+        # Original event isn't changed
+        self.assertEqual(sequential_event[0].duration, 1)
+
+    def test_iterate_timed_simple_events(self):
+        tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (2, 3)]
+                ),
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(1),
+                        core_events.SimultaneousEvent(
+                            [core_events.SimpleEvent(3), core_events.SimpleEvent(0.5)]
+                        ),
+                    ]
+                ),
+            ]
+        )
+        converter = core_converters.TempoConverter(tempo_envelope)
+        timed_simple_event_list = list(converter.iterate_timed_simple_events(event))
+        self.assertEqual(
+            [(start, end) for start, end, _ in timed_simple_event_list],
+            [(0, 3.5), (0, 1.875), (1.875, 6), (1.875, 2.71875), (3.5, 7)],
+        )
+        self.assertEqual(
+            [simple_event for _, _, simple_event in timed_simple_event_list],
+            [event[0][0], event[1][0], event[1][1][0], event[1][1][1], event[0][1]],
+        )
+        # 'end - start' is the duration of the converted simple event
+        converted_event = converter.convert(event)
+        for (start, end, _), converted_simple_event in zip(
+            timed_simple_event_list,
+            (
+                converted_event[0][0],
+                converted_event[1][0],
+                converted_event[1][1][0],
+                converted_event[1][1][1],
+                converted_event[0][1],
+            ),
+        ):
+            self.assertEqual(end - start, converted_simple_event.duration)
+
+    def test_convert_iter(self):
+        tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (2, 3)]
+                ),
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (1, 3)]
+                ),
+            ]
+        )
+        converter = core_converters.TempoConverter(tempo_envelope)
+        converted_event = converter.convert(event)
+        self.assertEqual(
+            list(converter.convert_iter(event)),
+            [
+                converted_event[0][0],
+                converted_event[1][0],
+                converted_event[1][1],
+                converted_event[0][1],
+            ],
+        )
+        # The original event isn't changed
+        self.assertEqual(event[0][0].duration, 2)
+
+    def test_convert_iter_with_tempo_envelope_of_simple_event(self):
+        tempo_envelope = core_events.TempoEnvelope([[0, 30], [4, 60]])
+        event = core_events.SequentialEvent(
+            [
+                core_events.SimpleEvent(1),
+                core_events.SimpleEvent(
+                    2, tempo_envelope=core_events.TempoEnvelope([[0, 20], [2, 40]])
+                ),
+            ]
+        )
+        converter = core_converters.TempoConverter(tempo_envelope)
+        converted_event = converter.convert(event)
+        self.assertEqual(list(converter.convert_iter(event)), list(converted_event))
+        self.assertEqual(
+            list(converter.convert_iter(event))[1].tempo_envelope,
+            converted_event[1].tempo_envelope,
+        )
+        self.assertEqual(event[1].tempo_envelope.value_tuple, (20, 40))
+        # Simple events are only copied when the iterator reaches them
+        simple_event_iterator = converter.convert_iter(event)
+        self.assertEqual(next(simple_event_iterator), converted_event[0])
+        event[1].duration = 3
+        self.assertEqual(next(simple_event_iterator), converter.convert(event)[1])
+
 
 class EventToMetrizedEventTest(unittest.TestCase):
     def test_convert_simple_event(self):
@@ -296,6 +608,80 @@ class EventToMetrizedEventTest(unittest.TestCase):
             event_to_metrized_event.convert(sequential_event), expected_sequential_event
         )
 
+    def test_convert_nested_event_with_changing_tempo(self):
+        """
+        Ensure nested tempo envelopes are applied like nested tempo converters.
+        """
+        sequential_event = core_events.SequentialEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(1), core_events.SimpleEvent(2)],
+                    tempo_envelope=core_events.TempoEnvelope([[0, 40], [3, 80]]),
+                ),
+                core_events.SimpleEvent(1),
+            ],
+            tempo_envelope=core_events.TempoEnvelope([[0, 30], [2, 90], [4, 60]]),
+        )
+        expected_sequential_event = core_converters.TempoConverter(
+            sequential_event.tempo_envelope
+        ).convert(sequential_event)
+        expected_sequential_event[0] = core_converters.TempoConverter(
+            expected_sequential_event[0].tempo_envelope
+        ).convert(expected_sequential_event[0])
+        metrized_sequential_event = core_converters.EventToMetrizedEvent().convert(
+            sequential_event
+        )
+        for duration, expected_duration in zip(
+            metrized_sequential_event.get_parameter("duration", flat=True),
+            expected_sequential_event.get_parameter("duration", flat=True),
+        ):
+            self.assertAlmostEqual(float(duration), float(expected_duration))
+        # Original event isn't changed
+        self.assertEqual(sequential_event[0][1].duration, 2)
+
+    def test_convert_nested_event_with_changing_tempo_on_each_level(self):
+        """
+        Ensure simple events with and without own tempo envelopes are
+        converted like with nested tempo converters.
+        """
+        sequential_event = core_events.SequentialEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(1),
+                        core_events.SimpleEvent(
+                            2,
+                            tempo_envelope=core_events.TempoEnvelope(
+                                [[0, 50], [2, 100]]
+                            ),
+                        ),
+                    ]
+                    + [core_events.SimpleEvent(0.5) for _ in range(4)],
+                    tempo_envelope=core_events.TempoEnvelope([[0, 40], [5, 80]]),
+                ),
+                core_events.SimultaneousEvent(
+                    [core_events.SimpleEvent(1), core_events.SimpleEvent(0.5)]
+                ),
+            ],
+            tempo_envelope=core_events.TempoEnvelope([[0, 30], [2, 90], [6, 60]]),
+        )
+        expected_sequential_event = core_converters.TempoConverter(
+            sequential_event.tempo_envelope
+        ).convert(sequential_event)
+        expected_sequential_event[0] = core_converters.TempoConverter(
+            expected_sequential_event[0].tempo_envelope
+        ).convert(expected_sequential_event[0])
+        expected_sequential_event[0][1] = core_converters.TempoConverter(
+            expected_sequential_event[0][1].tempo_envelope
+        ).convert(expected_sequential_event[0][1])
+        metrized_sequential_event = core_converters.EventToMetrizedEvent().convert(
+            sequential_event
+        )
+        for duration, expected_duration in zip(
+            metrized_sequential_event.get_parameter("duration", flat=True),
+            expected_sequential_event.get_parameter("duration", flat=True),
+        ):
+            self.assertAlmostEqual(float(duration), float(expected_duration))
 
 if __name__ == "__main__":
     unittest.main()
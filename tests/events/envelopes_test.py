@@ -1,3 +1,6 @@
+import copy
+import math
+import pickle
 import unittest
 
 from mutwo import core_constants
@@ -103,6 +106,154 @@ class EnvelopeTest(unittest.TestCase):
         envelope_from_points = core_events.Envelope.from_points((0, 0, 10), (1, 1))
         self.assertEqual(envelope_from_points, envelope_from_init)
 
+    def test_from_arrays(self):
+        envelope_from_arrays = core_events.Envelope.from_arrays(
+            (0, 1, 3), (0, 1, 0.5), (1, 0, 0)
+        )
+        envelope_from_points = core_events.Envelope.from_points(
+            (0, 0, 1), (1, 1), (3, 0.5)
+        )
+        self.assertEqual(envelope_from_arrays, envelope_from_points)
+        self.assertEqual(envelope_from_arrays.duration, 3)
+
+    def test_from_arrays_without_events(self):
+        envelope = core_events.Envelope.from_arrays((0, 1, 2), (0, 1, 0))
+        self.assertAlmostEqual(
+            envelope.get_average_value_array((0,), (2,))[0], 0.5
+        )
+        self.assertEqual(len(envelope), 3)
+        self.assertEqual(envelope.value_tuple, (0, 1, 0))
+        self.assertEqual(envelope.curve_shape_tuple, (0, 0, 0))
+
+    def test_from_arrays_copy(self):
+        envelope = core_events.Envelope.from_arrays((0, 1, 2), (0, 1, 0))
+        copied_envelope = envelope.copy()
+        self.assertEqual(len(copied_envelope), 3)
+        self.assertEqual(copied_envelope, envelope)
+
+    def test_from_arrays_list_methods(self):
+        def get_envelope():
+            return core_events.Envelope.from_arrays((0, 1, 2), (0, 1, 0))
+
+        event_list = list(core_events.Envelope.from_points((0, 0), (1, 1), (2, 0)))
+        self.assertEqual(list(reversed(get_envelope())), event_list[::-1])
+        self.assertIn(event_list[1], get_envelope())
+        self.assertEqual(get_envelope().index(event_list[2]), 2)
+        self.assertEqual(len(get_envelope() + get_envelope()), 6)
+        self.assertEqual(get_envelope().pop().duration, 0)
+        envelope = get_envelope()
+        envelope.extend(get_envelope())
+        self.assertEqual(len(envelope), 6)
+
+    def test_from_arrays_with_offset(self):
+        def get_envelope():
+            return core_events.Envelope.from_arrays((3, 4, 6), (0, 1, 0))
+
+        def query(envelope):
+            return (
+                envelope.get_average_value_array((0, 3, 0.5), (1, 4, 3)).tolist(),
+                envelope.integrate_interval_array((0, 1), (2, 4)).tolist(),
+                envelope.value_at(0.5),
+            )
+
+        # Like points, arrays are shifted so that the first point is at 0.
+        self.assertEqual(get_envelope(), core_events.Envelope([[3, 0], [4, 1], [6, 0]]))
+        # Events are created by 'len'
+        envelope = get_envelope()
+        len(envelope)
+        self.assertEqual(query(get_envelope()), query(envelope))
+
+    def test_from_arrays_with_invalid_arrays(self):
+        self.assertRaises(
+            ValueError, lambda: core_events.Envelope.from_arrays((0, 1), (0,))
+        )
+        self.assertRaises(
+            ValueError, lambda: core_events.Envelope.from_arrays((1, 0), (0, 1))
+        )
+
+    def test_init_with_mixed_types(self):
+        self.assertRaises(
+            TypeError,
+            lambda: core_events.Envelope([(0, 1), self.EnvelopeEvent(1, 0)]),
+        )
+
+    def test_cache_invalidation_by_setitem(self):
+        self.assertEqual(self.envelope.value_tuple, (0, 1, 0, 1, 0.5))
+        self.envelope[0] = self.EnvelopeEvent(2, 10)
+        self.assertEqual(self.envelope.value_tuple, (10, 1, 0, 1, 0.5))
+        self.assertEqual(self.envelope.duration, 7)
+        self.assertEqual(self.envelope.value_at(1), 5.5)
+
+    def test_cache_invalidation_by_list_mutation(self):
+        self.assertEqual(self.envelope.curve_shape_tuple, (0, 1, -1, 0, 0))
+        self.envelope.append(self.EnvelopeEvent(1, 3, 2))
+        self.assertEqual(self.envelope.curve_shape_tuple, (0, 1, -1, 0, 0, 2))
+        del self.envelope[0]
+        self.assertEqual(self.envelope.curve_shape_tuple, (1, -1, 0, 0, 2))
+        self.assertEqual(self.envelope.absolute_time_tuple, (0, 1, 2, 4, 5))
+
+    def test_cache_invalidation_by_event_mutation(self):
+        self.assertEqual(self.envelope.is_static, False)
+        for event in self.envelope:
+            event.value = 1
+        self.assertEqual(self.envelope.is_static, True)
+        self.envelope[1].duration = 10
+        self.assertEqual(self.envelope.absolute_time_tuple, (0, 1, 11, 12, 14))
+        self.envelope.duration = 7.5
+        self.assertEqual(self.envelope.absolute_time_tuple, (0, 0.5, 5.5, 6, 7))
+
+    def test_cache_with_event_mutation_after_access(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        event = envelope[0]
+        self.assertEqual(envelope.value_tuple, (0, 1, 0))
+        event.value = 99
+        self.assertEqual(envelope.value_tuple, (99, 1, 0))
+        self.assertEqual(envelope.value_at(0), 99)
+
+    def test_cache_with_event_mutation_of_init_events(self):
+        event = self.EnvelopeEvent(1, 0)
+        envelope = core_events.Envelope([event, self.EnvelopeEvent(0, 1)])
+        self.assertEqual(envelope.value_at(0), 0)
+        event.value = 10
+        self.assertEqual(envelope.value_at(0), 10)
+
+    def test_cache_is_used_for_owned_events(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        self.assertEqual(envelope.value_at(0.5), 0.5)
+        self.assertIn("value_tuple", envelope._cache_dict)
+        self.assertEqual(envelope.copy().value_at(0.5), 0.5)
+        self.assertIn("value_tuple", envelope._cache_dict)
+
+    def test_cache_is_used_after_indexing_and_iteration(self):
+        envelope = core_events.TempoEnvelope([[0, 60], [2, 30]])
+        envelope[0]
+        list(envelope)
+        self.assertTrue(envelope._are_events_shared)
+        integral_table_tuple = envelope._integral_table_tuple
+        self.assertIs(envelope._integral_table_tuple, integral_table_tuple)
+        self.assertIs(envelope.value_tuple, envelope.value_tuple)
+        self.assertEqual(envelope.integrate_interval(0, 2), 90)
+        self.assertIs(envelope._integral_table_tuple, integral_table_tuple)
+        # Changed events are still noticed
+        envelope[0].duration = 1
+        self.assertIsNot(envelope._integral_table_tuple, integral_table_tuple)
+        self.assertEqual(envelope.integrate_interval(0, 2), 75)
+
+    def test_copy_has_its_own_cache(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0]])
+        self.assertEqual(envelope.value_tuple, (0, 1, 0))
+        for copied_envelope in (
+            copy.copy(envelope),
+            copy.deepcopy(envelope),
+            pickle.loads(pickle.dumps(envelope)),
+        ):
+            self.assertIsNot(copied_envelope._cache_dict, envelope._cache_dict)
+            self.assertEqual(copied_envelope, envelope)
+        shallow_copied_envelope = copy.copy(envelope)
+        shallow_copied_envelope[0].value = 5
+        self.assertEqual(envelope.value_tuple, (5, 1, 0))
+        self.assertEqual(shallow_copied_envelope.value_tuple, (5, 1, 0))
+
     def test_is_static(self):
         self.assertEqual(self.envelope.is_static, False)
         self.assertEqual(core_events.Envelope([]).is_static, True)
@@ -123,6 +274,65 @@ class EnvelopeTest(unittest.TestCase):
         )
         self.assertAlmostEqual(self.envelope.integrate_interval(-3, 0.25), 0.03125)
 
+    def test_integrate_interval_without_duration(self):
+        empty_envelope = core_events.Envelope([])
+        self.assertEqual(empty_envelope.integrate_interval(2, 2), 0)
+        self.assertEqual(
+            empty_envelope.integrate_interval_array([0, 2], [0, 2]).tolist(), [0, 0]
+        )
+        self.assertEqual(core_events.PointEnvelope([], []).integrate_interval(1, 1), 0)
+        self.assertRaises(ValueError, empty_envelope.integrate_interval, 0, 1)
+
+    def test_integrate_interval_closed_form(self):
+        envelope = core_events.Envelope([[0, 0, 1], [2, 1], [2, 3], [4, 3]])
+
+        def curve_integral(percentage):
+            return (math.expm1(percentage) - percentage) / math.expm1(1)
+
+        # Curved part, jump and static part
+        self.assertAlmostEqual(
+            envelope.integrate_interval(1, 3),
+            2 * (curve_integral(1) - curve_integral(0.5)) + 3,
+            places=12,
+        )
+        # Intervals are additive, also across the jump
+        self.assertAlmostEqual(
+            envelope.integrate_interval(0.5, 2) + envelope.integrate_interval(2, 5),
+            envelope.integrate_interval(0.5, 5),
+            places=12,
+        )
+        # Reversed interval
+        self.assertAlmostEqual(
+            envelope.integrate_interval(3, 1), -envelope.integrate_interval(1, 3)
+        )
+
+    def test_integrate_interval_array(self):
+        start_tuple = (-3, 0, 0.25, 1, 1.5, 2.5, 4, 5, 30)
+        end_tuple = (0.25, 5, 1.75, 1, 2.75, 3, 30, 6, 31)
+        integral_array = self.envelope.integrate_interval_array(start_tuple, end_tuple)
+        self.assertEqual(len(integral_array), len(start_tuple))
+        # Exactly the same results as the scalar method
+        for start, end, integral in zip(start_tuple, end_tuple, integral_array):
+            self.assertEqual(self.envelope.integrate_interval(start, end), integral)
+
+    def test_get_time_at_integral_array(self):
+        envelope = core_events.Envelope([[0, 1, 2], [2, 3], [2, 0.5], [4, 2]])
+        absolute_time_tuple = (-1, 0, 0.5, 1.99, 2, 3.25, 4, 10)
+        for start in (0, 1.5, 5):
+            integral_array = envelope.integrate_interval_array(
+                [start] * len(absolute_time_tuple), absolute_time_tuple
+            )
+            for absolute_time, found_absolute_time in zip(
+                absolute_time_tuple,
+                envelope.get_time_at_integral_array(integral_array, start),
+            ):
+                self.assertAlmostEqual(absolute_time, found_absolute_time)
+
+    def test_get_time_at_integral_array_with_invalid_values(self):
+        self.assertRaises(
+            ValueError, lambda: self.envelope.get_time_at_integral_array([1])
+        )
+
     def test_get_average_value(self):
         self.assertEqual(self.envelope.get_average_value(-1, 0), 0)
         self.assertAlmostEqual(
@@ -141,11 +351,229 @@ class EnvelopeTest(unittest.TestCase):
         with self.assertWarns(core_utilities.InvalidAverageValueStartAndEndWarning):
             self.envelope.get_average_value(0, 0)
 
+    def test_get_average_value_array(self):
+        start_tuple = (-1, 0, 0, 1.3, -3)
+        end_tuple = (0, 5, 30, 4.1, 0.25)
+        average_value_array = self.envelope.get_average_value_array(
+            start_tuple, end_tuple
+        )
+        self.assertEqual(len(average_value_array), len(start_tuple))
+        for average_value, start, end in zip(
+            average_value_array, start_tuple, end_tuple
+        ):
+            self.assertAlmostEqual(
+                average_value, self.envelope.get_average_value(start, end)
+            )
+
+    def test_get_average_value_array_with_zero_duration(self):
+        with self.assertWarns(core_utilities.InvalidAverageValueStartAndEndWarning):
+            average_value_array = self.envelope.get_average_value_array(
+                (0, 0.5, 1.5), (1, 0.5, 1.5)
+            )
+        self.assertAlmostEqual(average_value_array[0], 0.5)
+        self.assertAlmostEqual(average_value_array[1], self.envelope.value_at(0.5))
+        self.assertAlmostEqual(average_value_array[2], self.envelope.value_at(1.5))
+
     def test_get_average_parameter(self):
         self.assertAlmostEqual(
             self.envelope.get_average_parameter(0, 5), 0.6327906827477305
         )
 
+    def test_simplify(self):
+        envelope = core_events.Envelope(
+            [[0, 0], [1, 1], [2, 2], [3, 2.1], [4, 2], [5, 1, 2], [6, 3], [6, 0]]
+        )
+        simplified_envelope, error = envelope.simplify()
+        self.assertEqual(error, 0)
+        self.assertEqual(
+            simplified_envelope.absolute_time_tuple, (0, 2, 3, 4, 5, 6, 6)
+        )
+        # Segments which are kept stay with their curve shape
+        self.assertEqual(
+            simplified_envelope.curve_shape_tuple, (0, 0, 0, 0, 2, 0, 0)
+        )
+
+        simplified_envelope, error = envelope.simplify(0.2)
+        self.assertAlmostEqual(error, 0.1)
+        # Jumps are always kept
+        self.assertEqual(simplified_envelope.absolute_time_tuple, (0, 2, 4, 5, 6, 6))
+
+    def test_simplify_keeps_max_error(self):
+        envelope = core_events.Envelope(
+            [
+                [absolute_time, (absolute_time % 7) / 3, (absolute_time % 5) - 2]
+                for absolute_time in range(100)
+            ]
+        )
+        for max_error in (0.1, 0.5, 1):
+            simplified_envelope, error = envelope.simplify(max_error)
+            self.assertLessEqual(error, max_error)
+            self.assertLess(len(simplified_envelope), len(envelope))
+            real_error = max(
+                abs(
+                    envelope.value_at(absolute_time)
+                    - simplified_envelope.value_at(absolute_time)
+                )
+                for absolute_time in (index / 20 for index in range(2000))
+            )
+            self.assertLessEqual(real_error, error + 1e-9)
+            self.assertGreater(real_error, error - 0.01)
+
+    def test_simplify_keeps_side_attributes(self):
+        envelope = core_events.Envelope(
+            [[0, 0], [1, 1], [2, 2]], value_to_parameter=lambda value: value * 2
+        )
+        simplified_envelope, _ = envelope.simplify()
+        self.assertEqual(simplified_envelope.parameter_tuple, (0, 4))
+
+    def test_simplify_with_invalid_max_error(self):
+        self.assertRaises(ValueError, lambda: self.envelope.simplify(-1))
+
+    def test_to_step_events(self):
+        step_events = core_events.Envelope([[0, 0], [4, 1]]).to_step_events(0.5)
+        self.assertEqual(step_events.get_parameter("duration"), (1, 2, 1))
+        self.assertEqual(step_events.get_parameter("value"), (0, 0.5, 1))
+
+    def test_to_step_events_with_curve_shape(self):
+        envelope = core_events.Envelope(
+            [[0, 0, 2], [1, 1, -1], [2, 0.3], [2, 0.9], [3, 0.9]]
+        )
+        step_events = envelope.to_step_events(0.1)
+        self.assertEqual(step_events.duration, envelope.duration)
+        for absolute_time, step_event in zip(
+            step_events.absolute_time_tuple, step_events
+        ):
+            # The value changes when the envelope crosses the middle
+            # between two rounded values (or when it jumps at 2).
+            if 0 < absolute_time < 2:
+                self.assertAlmostEqual(
+                    envelope.value_at(absolute_time) % 0.1,
+                    0.05,
+                )
+            self.assertAlmostEqual(
+                step_event.value,
+                round(envelope.value_at(absolute_time + 0.001) * 10) / 10,
+            )
+        # Jumps are kept
+        self.assertEqual(step_events[-1].value, 0.9)
+        self.assertEqual(step_events.absolute_time_tuple[-1], 2)
+
+    def test_to_step_events_with_min_interval(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1], [2, 0], [3, 0], [3, 0.2]])
+        step_events = envelope.to_step_events(0.1, min_interval=0.25)
+        self.assertEqual(
+            step_events.get_parameter("duration"), (0.25,) * 8 + (1, 0)
+        )
+        self.assertEqual(
+            [round(value, 2) for value in step_events.get_parameter("value")],
+            [0, 0.3, 0.5, 0.8, 1, 0.7, 0.5, 0.2, 0, 0.2],
+        )
+
+    def test_to_step_events_with_invalid_resolution(self):
+        self.assertRaises(ValueError, self.envelope.to_step_events, 0)
+
+    def test_add(self):
+        envelope0 = core_events.Envelope([[0, 0.5], [4, 1]])
+        envelope1 = core_events.Envelope([[0, 0], [1, 0.2], [2, 0]])
+        added_envelope = envelope0.add(envelope1)
+        self.assertEqual(added_envelope.absolute_time_tuple, (0, 1, 2, 4))
+        self.assertEqual(added_envelope.value_tuple, (0.5, 0.825, 0.75, 1))
+        self.assertEqual(envelope0.add(0.5).value_tuple, (1, 1.5))
+
+    def test_add_with_curve_shape(self):
+        # Same curve shapes can be added exactly
+        envelope = core_events.Envelope([[0, 0, 2], [1, 1]])
+        added_envelope = envelope.add(envelope)
+        self.assertEqual(added_envelope.value_tuple, (0, 2))
+        self.assertEqual(added_envelope.curve_shape_tuple, (2, 0))
+        # Different curve shapes are sampled
+        added_envelope = envelope.add(core_events.Envelope([[0, 0], [1, 1]]))
+        self.assertGreater(len(added_envelope), 2)
+        for absolute_time in (0.1, 0.33, 0.5, 0.9):
+            self.assertAlmostEqual(
+                added_envelope.value_at(absolute_time),
+                envelope.value_at(absolute_time) + absolute_time,
+                places=2,
+            )
+
+    def test_add_with_jump(self):
+        envelope0 = core_events.Envelope([[0, 0], [1, 1], [1, 2], [2, 2]])
+        envelope1 = core_events.Envelope([[0, 1], [2, 1]])
+        added_envelope = envelope0.add(envelope1)
+        self.assertEqual(added_envelope.absolute_time_tuple, (0, 1, 1, 2))
+        self.assertEqual(added_envelope.value_tuple, (1, 2, 3, 3))
+
+    def test_multiply(self):
+        envelope0 = core_events.Envelope([[0, 0, 1], [1, 1]])
+        multiplied_envelope = envelope0.multiply(
+            core_events.Envelope([[0, 2], [2, 2]])
+        )
+        self.assertEqual(multiplied_envelope.value_tuple, (0, 2, 2))
+        self.assertEqual(multiplied_envelope.curve_shape_tuple, (1, 0, 0))
+        multiplied_envelope = envelope0.multiply(envelope0, max_error=0.0001)
+        for absolute_time in (0.1, 0.33, 0.5, 0.9):
+            self.assertAlmostEqual(
+                multiplied_envelope.value_at(absolute_time),
+                envelope0.value_at(absolute_time) ** 2,
+                places=3,
+            )
+
+    def test_minimum_and_maximum(self):
+        envelope0 = core_events.Envelope([[0, 0], [2, 2]])
+        envelope1 = core_events.Envelope([[0, 2], [2, 0]])
+        minimum_envelope = envelope0.minimum(envelope1)
+        self.assertEqual(minimum_envelope.absolute_time_tuple, (0, 1, 2))
+        self.assertEqual(minimum_envelope.value_tuple, (0, 1, 0))
+        maximum_envelope = envelope0.maximum(envelope1)
+        self.assertEqual(maximum_envelope.value_tuple, (2, 1, 2))
+
+    def test_minimum_with_curve_shape(self):
+        envelope = core_events.Envelope([[0, 0, 3], [1, 1]])
+        minimum_envelope = envelope.minimum(0.5)
+        self.assertEqual(len(minimum_envelope), 3)
+        crossing_time = minimum_envelope.absolute_time_tuple[1]
+        self.assertAlmostEqual(envelope.value_at(crossing_time), 0.5)
+        for absolute_time in (0.1, 0.5, 0.7, 0.9):
+            self.assertAlmostEqual(
+                minimum_envelope.value_at(absolute_time),
+                min(envelope.value_at(absolute_time), 0.5),
+            )
+
+    def test_operation_with_invalid_max_error(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1, 1]])
+        for max_error in (0, -1):
+            self.assertRaises(ValueError, envelope.multiply, envelope, max_error)
+            self.assertRaises(ValueError, envelope.map, abs, max_error)
+
+    def test_map(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1], [2, 1]])
+        mapped_envelope = envelope.map(lambda value: value**2, max_error=0.001)
+        self.assertEqual(mapped_envelope.value_tuple[0], 0)
+        self.assertEqual(mapped_envelope.value_tuple[-2:], (1, 1))
+        for absolute_time in (0.1, 0.33, 0.5, 0.9, 1.5):
+            self.assertAlmostEqual(
+                mapped_envelope.value_at(absolute_time),
+                envelope.value_at(absolute_time) ** 2,
+                places=2,
+            )
+
+    def test_pickle(self):
+        envelope = core_events.Envelope([[0, 0], [1, 1, 0.5], [2, 0]])
+        unpickled_envelope = pickle.loads(pickle.dumps(envelope))
+        self.assertEqual(unpickled_envelope.value_tuple, envelope.value_tuple)
+        self.assertEqual(
+            unpickled_envelope.curve_shape_tuple, envelope.curve_shape_tuple
+        )
+        # Events with an initialised tempo envelope can be pickled as well
+        sequential_event = core_events.SequentialEvent(
+            [core_events.SimpleEvent(1)],
+            tempo_envelope=core_events.TempoEnvelope([[0, 60], [1, 30]]),
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(sequential_event)).tempo_envelope,
+            sequential_event.tempo_envelope,
+        )
+
 
 class RelativeEnvelopeTest(unittest.TestCase):
     def setUp(cls):
@@ -164,6 +592,264 @@ class RelativeEnvelopeTest(unittest.TestCase):
         self.assertEqual(resolved_envelope.duration, core_parameters.DirectDuration(1))
         self.assertEqual(resolved_envelope.value_tuple, (100, 105, 110))
 
+    def test_resolve_many(self):
+        duration_tuple = (1, 2, 0.5, 1)
+        base_parameter_tuple = (100, 100, 3, 3)
+        resolved_envelope_tuple = self.envelope.resolve_many(
+            duration_tuple, base_parameter_tuple
+        )
+        self.assertEqual(len(resolved_envelope_tuple), len(duration_tuple))
+        for resolved_envelope, duration, base_parameter in zip(
+            resolved_envelope_tuple, duration_tuple, base_parameter_tuple
+        ):
+            expected_resolved_envelope = self.envelope.resolve(
+                duration, base_parameter
+            )
+            self.assertEqual(resolved_envelope, expected_resolved_envelope)
+            self.assertEqual(
+                resolved_envelope.absolute_time_tuple,
+                expected_resolved_envelope.absolute_time_tuple,
+            )
+
+    def test_resolve_many_with_unequal_sizes(self):
+        self.assertRaises(ValueError, self.envelope.resolve_many, (1, 2), (100,))
+
+    def test_resolve_without_cache(self):
+        self.assertEqual(self.envelope.resolve_cache, None)
+        self.assertIsNot(
+            self.envelope.resolve(duration=1, base_parameter=100),
+            self.envelope.resolve(duration=1, base_parameter=100),
+        )
+
+    def test_resolve_with_cache(self):
+        self.envelope.resolve_cache_size = 2
+        resolved_envelope = self.envelope.resolve(duration=1, base_parameter=100)
+        self.assertIs(
+            self.envelope.resolve(duration=1.0, base_parameter=100), resolved_envelope
+        )
+        self.assertEqual(
+            self.envelope.resolve(duration=2, base_parameter=100).duration,
+            core_parameters.DirectDuration(2),
+        )
+        self.assertEqual(
+            self.envelope.resolve(duration=1, base_parameter=10).value_tuple,
+            (10, 15, 20),
+        )
+        self.assertEqual(self.envelope.resolve_cache.hit_count, 1)
+        self.assertEqual(self.envelope.resolve_cache.miss_count, 3)
+        self.assertEqual(len(self.envelope.resolve_cache), 2)
+
+    def test_resolve_cache_is_cleared_after_change(self):
+        self.envelope.resolve_cache_size = 2
+        self.envelope.resolve(duration=1, base_parameter=100)
+        self.envelope[1].value = 0
+        self.assertEqual(
+            self.envelope.resolve(duration=1, base_parameter=100).value_tuple,
+            (100, 100, 110),
+        )
+        self.envelope.append(core_events.SimpleEvent(0))
+        self.assertEqual(
+            self.envelope.resolve(duration=1, base_parameter=100).value_tuple,
+            (100, 100, 110, 100),
+        )
+        self.assertEqual(self.envelope.resolve_cache.hit_count, 0)
+
+    def test_resolve_cache_with_event_mutation_after_access(self):
+        self.envelope.resolve_cache_size = 2
+        event = self.envelope[1]
+        self.envelope.resolve(duration=1, base_parameter=100)
+        event.value = 0
+        self.assertEqual(
+            self.envelope.resolve(duration=1, base_parameter=100).value_tuple,
+            (100, 100, 110),
+        )
+
+    def test_resolve_cache_with_shared_events(self):
+        self.envelope.resolve_cache_size = 2
+        event = self.envelope[1]
+        resolved_envelope = self.envelope.resolve(duration=1, base_parameter=100)
+        self.assertIs(
+            self.envelope.resolve(duration=1, base_parameter=100), resolved_envelope
+        )
+        self.assertEqual(self.envelope.resolve_cache.hit_count, 1)
+        event.value = 0
+        self.assertIsNot(
+            self.envelope.resolve(duration=1, base_parameter=100), resolved_envelope
+        )
+
+    def test_copy_has_its_own_resolve_cache(self):
+        self.envelope.resolve_cache_size = 2
+        self.envelope.resolve(duration=1, base_parameter=100)
+        copied_envelope = copy.copy(self.envelope)
+        self.assertIsNot(copied_envelope.resolve_cache, self.envelope.resolve_cache)
+        self.assertEqual(len(copied_envelope.resolve_cache), 0)
+
+    def test_resolve_cache_with_unhashable_base_parameter(self):
+        envelope = core_events.RelativeEnvelope(
+            [[0, 0], [1, 1]],
+            base_parameter_and_relative_parameter_to_absolute_parameter=lambda base_parameter, relative_parameter: base_parameter[
+                0
+            ]
+            + relative_parameter,
+            resolve_cache_size=2,
+        )
+        self.assertEqual(envelope.resolve(1, [10]).value_tuple, (10, 11))
+        self.assertEqual(len(envelope.resolve_cache), 0)
+
+    def test_empty_copy(self):
+        empty_copy = self.envelope.empty_copy()
+        self.assertEqual(
+            empty_copy.base_parameter_and_relative_parameter_to_absolute_parameter,
+            self.envelope.base_parameter_and_relative_parameter_to_absolute_parameter,
+        )
+
+
+class EnvelopeCursorTest(unittest.TestCase):
+    def setUp(self):
+        self.envelope = core_events.Envelope(
+            [[0, 0], [1, 1, 1], [2, 0, -1], [3, 1], [5, 0.5], [5, 2], [6, 0]]
+        )
+        self.cursor = self.envelope.cursor()
+
+    def test_value_at_with_increasing_times(self):
+        for absolute_time in (-1, 0, 0.25, 1, 1.25, 2.5, 4, 5, 5.5, 6, 100):
+            self.assertAlmostEqual(
+                self.cursor.value_at(absolute_time),
+                self.envelope.value_at(absolute_time),
+            )
+
+    def test_value_at_with_backward_jumps(self):
+        for absolute_time in (5.5, 0.25, 4, 1.25, 100, -1, 2.5):
+            self.assertAlmostEqual(
+                self.cursor.value_at(absolute_time),
+                self.envelope.value_at(absolute_time),
+            )
+
+    def test_integrate_to(self):
+        point_envelope = core_events.PointEnvelope.from_envelope(self.envelope)
+        for absolute_time in (-1, 0.5, 1.5, 2.5, 5, 5.5, 10, 0.25):
+            self.assertAlmostEqual(
+                self.cursor.integrate_to(absolute_time),
+                point_envelope.integrate_interval(0, absolute_time),
+            )
+
+    def test_sample(self):
+        self.assertEqual(
+            list(self.cursor.sample(4, 0, 1)), [0, 0.25, 0.5, 0.75]
+        )
+        self.assertEqual(len(list(self.cursor.sample(10))), 60)
+        self.assertEqual(list(self.cursor.sample(10, 2, 1)), [])
+
+
+class PointEnvelopeTest(unittest.TestCase):
+    def setUp(self):
+        self.envelope = core_events.Envelope(
+            [[0, 0], [1, 1, 1], [2, 0, -1], [3, 1], [5, 0.5]]
+        )
+        self.point_envelope = core_events.PointEnvelope.from_envelope(self.envelope)
+
+    def test_from_envelope(self):
+        self.assertEqual(len(self.point_envelope), len(self.envelope))
+        self.assertEqual(
+            self.point_envelope.absolute_time_tuple,
+            tuple(float(absolute_time) for absolute_time in self.envelope.absolute_time_tuple),
+        )
+        self.assertEqual(self.point_envelope.value_tuple, self.envelope.value_tuple)
+        self.assertEqual(
+            self.point_envelope.curve_shape_tuple, self.envelope.curve_shape_tuple
+        )
+
+    def test_eq_with_empty_envelope(self):
+        self.assertEqual(
+            core_events.PointEnvelope([], []), core_events.PointEnvelope([], [])
+        )
+        self.assertEqual(core_events.PointEnvelope([], []), core_events.Envelope([]))
+        self.assertNotEqual(core_events.PointEnvelope([], []), self.point_envelope)
+        self.assertNotEqual(self.point_envelope, core_events.PointEnvelope([], []))
+        self.assertNotEqual(core_events.PointEnvelope([], []), [])
+
+    def test_to_envelope(self):
+        self.assertEqual(self.point_envelope.to_envelope(), self.envelope)
+        self.assertEqual(
+            core_events.PointEnvelope.from_envelope(self.point_envelope.to_envelope()),
+            self.point_envelope,
+        )
+        self.assertEqual(
+            type(self.point_envelope.to_envelope(core_events.TempoEnvelope)),
+            core_events.TempoEnvelope,
+        )
+
+    def test_to_envelope_with_offset(self):
+        point_envelope = core_events.PointEnvelope([3, 4, 6], [0, 1, 0.5], [0, 1, 0])
+        envelope = point_envelope.to_envelope()
+        # The value before the first point is kept by an additional point.
+        self.assertEqual(envelope.absolute_time_tuple, (0, 3, 4, 6))
+        self.assertEqual(envelope.value_tuple, (0, 0, 1, 0.5))
+        converted_point_envelope = core_events.PointEnvelope.from_envelope(envelope)
+        self.assertEqual(converted_point_envelope.to_envelope(), envelope)
+        for absolute_time in (0, 1, 3, 3.5, 4, 5, 6, 8):
+            for tested_envelope in (envelope, converted_point_envelope):
+                self.assertEqual(
+                    tested_envelope.value_at(absolute_time),
+                    point_envelope.value_at(absolute_time),
+                )
+                self.assertAlmostEqual(
+                    tested_envelope.integrate_interval(1, absolute_time),
+                    point_envelope.integrate_interval(1, absolute_time),
+                )
+        self.assertRaises(
+            ValueError, core_events.PointEnvelope([-1, 1], [0, 1]).to_envelope
+        )
+
+    def test_value_at(self):
+        for absolute_time in (-1, 0, 0.25, 1.25, 2.5, 4, 5, 100):
+            self.assertAlmostEqual(
+                self.point_envelope.value_at(absolute_time),
+                self.envelope.value_at(absolute_time),
+            )
+
+    def test_parameter_at(self):
+        point_envelope = core_events.PointEnvelope(
+            [0, 1], [0, 1], value_to_parameter=lambda value: value * 2
+        )
+        self.assertEqual(point_envelope.parameter_at(0.5), 1)
+
+    def test_integrate_interval(self):
+        for start, end in ((0, 5), (1, 1), (0, 30), (-3, 0.25)):
+            self.assertAlmostEqual(
+                self.point_envelope.integrate_interval(start, end),
+                self.envelope.integrate_interval(start, end),
+            )
+
+    def test_is_static(self):
+        self.assertEqual(self.point_envelope.is_static, False)
+        self.assertEqual(core_events.PointEnvelope([], []).is_static, True)
+        self.assertEqual(core_events.PointEnvelope([0, 10], [3, 3]).is_static, True)
+
+    def test_insert_point(self):
+        self.assertEqual(self.point_envelope.insert_point(1, 10), 2)
+        self.assertEqual(
+            self.point_envelope.absolute_time_tuple, (0, 1, 1, 2, 3, 5)
+        )
+        self.assertEqual(self.point_envelope.value_tuple, (0, 1, 10, 0, 1, 0.5))
+        self.assertEqual(self.point_envelope.value_at(1.5), 5)
+
+    def test_remove_point(self):
+        self.point_envelope.remove_point(1)
+        self.assertEqual(self.point_envelope.absolute_time_tuple, (0, 2, 3, 5))
+        self.assertEqual(self.point_envelope.curve_shape_tuple, (0, -1, 0, 0))
+        self.assertRaises(IndexError, lambda: self.point_envelope.remove_point(10))
+
+    def test_simplify(self):
+        for max_error in (0, 0.5):
+            simplified_point_envelope, error = self.point_envelope.simplify(max_error)
+            simplified_envelope, envelope_error = self.envelope.simplify(max_error)
+            self.assertEqual(error, envelope_error)
+            self.assertEqual(
+                simplified_point_envelope,
+                core_events.PointEnvelope.from_envelope(simplified_envelope),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
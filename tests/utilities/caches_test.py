@@ -0,0 +1,48 @@
+import unittest
+
+from mutwo import core_utilities
+
+
+class LRUCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = core_utilities.LRUCache(max_size=2)
+
+    def test_get(self):
+        self.cache[1] = "a"
+        self.assertEqual(self.cache.get(1), "a")
+        self.assertEqual(self.cache.get(2), None)
+        self.assertEqual(self.cache.get(2, "b"), "b")
+        self.assertEqual(self.cache.hit_count, 1)
+        self.assertEqual(self.cache.miss_count, 2)
+        self.assertEqual(self.cache.hit_rate, 1 / 3)
+
+    def test_hit_rate_without_request(self):
+        self.assertEqual(self.cache.hit_rate, 0)
+
+    def test_max_size(self):
+        self.cache[1] = "a"
+        self.cache[2] = "b"
+        # Now 2 is the least recently used item
+        self.cache.get(1)
+        self.cache[3] = "c"
+        self.assertEqual(len(self.cache), 2)
+        self.assertIn(1, self.cache)
+        self.assertNotIn(2, self.cache)
+        self.assertIn(3, self.cache)
+
+    def test_invalid_max_size(self):
+        self.assertRaises(ValueError, core_utilities.LRUCache, 0)
+
+    def test_clear(self):
+        self.cache[1] = "a"
+        self.cache.get(1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        # Statistics are kept
+        self.assertEqual(self.cache.hit_count, 1)
+        self.cache.reset_statistics()
+        self.assertEqual(self.cache.hit_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()